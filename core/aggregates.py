@@ -0,0 +1,71 @@
+"""
+Running Aggregates - Dashboard totals maintained incrementally
+Rebuilt with one vectorized pass after a load, then updated in O(1) by
+every add, stock change and delete.
+"""
+
+from bisect import bisect_right
+from typing import List
+
+import numpy as np
+
+
+def stock_buckets(low_limit: int) -> List[int]:
+    """Histogram edges around the low-stock limit: 0, below the limit, up to 5x, up to 10x, beyond"""
+    return sorted({edge for edge in (1, low_limit, low_limit * 5, low_limit * 10) if edge > 0})
+
+
+class RunningTotals:
+    """Product count, total units, low-stock count and a stock histogram"""
+
+    def __init__(self, bucket_edges: List[int]):
+        # Bucket i holds stock in [edges[i-1], edges[i]); bucket 0 is below edges[0]
+        self.bucket_edges = list(bucket_edges)
+        self.labels = self._labels()
+        self.reset(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    def _labels(self) -> List[str]:
+        """Human-readable bucket ranges"""
+        edges = self.bucket_edges
+        labels = [f"<{edges[0]}" if edges[0] != 1 else "0"]
+        for lo, hi in zip(edges, edges[1:]):
+            labels.append(f"{lo}-{hi - 1}")
+        labels.append(f"{edges[-1]}+")
+        return labels
+
+    def reset(self, stock: np.ndarray, low_limit):
+        """Recompute everything from a stock column (low_limit: scalar or per-row array)"""
+        stock = np.asarray(stock, dtype=np.int64)
+        self.count = len(stock)
+        self.total_stock = int(stock.sum())
+        self.low_stock = int((stock < low_limit).sum())
+        buckets = np.searchsorted(self.bucket_edges, stock, side="right")
+        self.histogram = np.bincount(buckets, minlength=len(self.bucket_edges) + 1).tolist()
+
+    def add(self, stock: int, low_limit: int):
+        """Account for a new product"""
+        self.count += 1
+        self.total_stock += stock
+        self.low_stock += stock < low_limit
+        self.histogram[bisect_right(self.bucket_edges, stock)] += 1
+
+    def remove(self, stock: int, low_limit: int):
+        """Account for a deleted product"""
+        self.count -= 1
+        self.total_stock -= stock
+        self.low_stock -= stock < low_limit
+        self.histogram[bisect_right(self.bucket_edges, stock)] -= 1
+
+    def update(self, old: int, new: int, low_limit: int):
+        """Account for a stock change"""
+        self.remove(old, low_limit)
+        self.add(new, low_limit)
+
+    def summary(self) -> dict:
+        """Current aggregates for the dashboard"""
+        return {
+            "total_products": self.count,
+            "total_stock": self.total_stock,
+            "low_stock": int(self.low_stock),
+            "histogram": list(zip(self.labels, self.histogram)),
+        }
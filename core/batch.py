@@ -0,0 +1,104 @@
+"""
+Batch Mutations - Validate many operations together before applying them
+Operations use the journal format: add / set / adjust / delete.
+"""
+
+from typing import Dict, List
+
+import pandas as pd
+
+from core.schema import check_count
+
+
+class BatchError(ValueError):
+    """Raised when one or more operations in a batch are invalid"""
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__(f"{len(errors)} invalid operation(s): " + "; ".join(errors[:5]))
+
+
+class Batch:
+    """Collects operations for InventoryAgent.transaction()"""
+
+    def __init__(self):
+        self.ops: List[dict] = []
+
+    def add(self, product_id: str, name: str, stock: int, demand: int):
+        """Queue a new product"""
+        self.ops.append({"op": "add", "id": product_id, "name": name, "stock": stock, "demand": demand})
+
+    def set_stock(self, product_id: str, stock: int):
+        """Queue an absolute stock change"""
+        self.ops.append({"op": "set", "id": product_id, "stock": stock})
+
+    def adjust(self, product_id: str, delta: int):
+        """Queue a relative stock change (e.g. +40 received, -3 sold)"""
+        self.ops.append({"op": "adjust", "id": product_id, "delta": delta})
+
+    def delete(self, product_id: str):
+        """Queue a product removal"""
+        self.ops.append({"op": "delete", "id": product_id})
+
+
+def resolve_ops(ops: List[dict], df: pd.DataFrame, index: Dict[str, int]) -> List[dict]:
+    """Validate operations in order and turn them into absolute journal operations.
+
+    Adjustments are resolved to the stock value they produce, so the result
+    can be journaled and replayed idempotently. Raises BatchError listing
+    every invalid operation; nothing is resolved partially.
+    """
+    stock_col = df["Stock"]
+    # Stock as seen by the batch so far: None marks a product deleted in the batch
+    current: Dict[str, object] = {}
+    resolved = []
+    errors = []
+
+    def stock_of(pid):
+        if pid in current:
+            return current[pid]
+        pos = index.get(pid)
+        return None if pos is None else int(stock_col.iat[pos])
+
+    for n, op in enumerate(ops, 1):
+        kind = op.get("op")
+        pid = str(op.get("id", "")).strip()
+        if not pid:
+            errors.append(f"#{n}: missing Product ID")
+            continue
+        try:
+            if kind == "add":
+                name = str(op.get("name", "")).strip()
+                if not name:
+                    errors.append(f"#{n}: missing Product Name for '{pid}'")
+                    continue
+                if stock_of(pid) is not None:
+                    errors.append(f"#{n}: Product ID '{pid}' already exists")
+                    continue
+                stock, demand = check_count(op["stock"], "Stock"), check_count(op["demand"], "Daily Demand")
+                current[pid] = stock
+                resolved.append({"op": "add", "id": pid, "name": name, "stock": stock, "demand": demand})
+            elif kind in ("set", "adjust"):
+                old = stock_of(pid)
+                if old is None:
+                    errors.append(f"#{n}: unknown Product ID '{pid}'")
+                    continue
+                stock = check_count(op["stock"] if kind == "set" else old + check_count(op["delta"], "Stock change"), "Stock")
+                current[pid] = stock
+                resolved.append({"op": "set", "id": pid, "stock": stock})
+            elif kind == "delete":
+                if stock_of(pid) is None:
+                    errors.append(f"#{n}: unknown Product ID '{pid}'")
+                    continue
+                current[pid] = None
+                resolved.append({"op": "delete", "id": pid})
+            else:
+                errors.append(f"#{n}: unknown operation '{kind}'")
+        except KeyError:
+            errors.append(f"#{n}: missing fields for '{pid}'")
+        except (TypeError, ValueError) as e:
+            errors.append(f"#{n}: {e} for '{pid}'")
+
+    if errors:
+        raise BatchError(errors)
+    return resolved
@@ -0,0 +1,70 @@
+"""
+Bulk Import - Stream a large supplier CSV into the catalog in fixed-size chunks
+Rows are type-checked and de-duplicated per chunk with vectorized pandas
+operations; only accepted rows are kept in memory.
+"""
+
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.schema import COLUMNS, COUNT_MAX, COUNT_MIN
+
+
+def read_valid_chunks(path: str, existing_ids: Iterable[str], chunksize: int = 100_000,
+                      progress: Optional[Callable[[int, float], None]] = None,
+                      stats: Optional[dict] = None) -> Iterator[pd.DataFrame]:
+    """Yield cleaned chunks of new products from a CSV file.
+
+    Rows are rejected when the ID or name is empty, when Stock/Daily Demand
+    are not whole numbers within the int32 range, or when the ID already
+    exists in the catalog or earlier in the file. Counts are written into
+    `stats` when given.
+    """
+    existing = pd.Index(list(existing_ids))
+    seen = set()
+    stats = stats if stats is not None else {}
+    stats.update({"read": 0, "imported": 0, "rejected": 0, "duplicates": 0})
+    start = time.perf_counter()
+
+    reader = pd.read_csv(path, usecols=COLUMNS, dtype=str, chunksize=chunksize, keep_default_na=False)
+    for chunk in reader:
+        ids = chunk["Product ID"].str.strip()
+        names = chunk["Product Name"].str.strip()
+        stock = pd.to_numeric(chunk["Stock"], errors="coerce")
+        demand = pd.to_numeric(chunk["Daily Demand"], errors="coerce")
+
+        valid = (ids != "") & (names != "")
+        for col in (stock, demand):
+            valid &= np.isfinite(col) & (col == col.round()) & col.between(COUNT_MIN, COUNT_MAX)
+
+        in_file = np.fromiter((pid in seen for pid in ids), dtype=bool, count=len(ids))
+        duplicate = ids.isin(existing).to_numpy() | in_file | ids.duplicated().to_numpy()
+        keep = valid.to_numpy() & ~duplicate
+
+        accepted = pd.DataFrame({
+            "Product ID": ids[keep],
+            "Product Name": names[keep],
+            "Stock": stock[keep].astype("int32"),
+            "Daily Demand": demand[keep].astype("int32"),
+        })
+        seen.update(accepted["Product ID"])
+
+        stats["read"] += len(chunk)
+        stats["imported"] += len(accepted)
+        stats["duplicates"] += int((valid.to_numpy() & duplicate).sum())
+        stats["rejected"] += len(chunk) - len(accepted)
+        if progress is not None:
+            elapsed = time.perf_counter() - start
+            progress(stats["read"], stats["read"] / elapsed if elapsed else 0.0)
+        if len(accepted):
+            yield accepted
+
+    stats["seconds"] = time.perf_counter() - start
+
+
+def print_progress(rows: int, rows_per_sec: float):
+    """Default progress reporter for the CLI"""
+    print(f"\r   {rows:,} rows read ({rows_per_sec:,.0f} rows/s)", end="", flush=True)
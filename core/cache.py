@@ -0,0 +1,220 @@
+"""
+Derived-Data Cache - Results keyed by the agent's data version
+The agent bumps its version on every mutation. Whole results (reorder plan,
+report tables) are reused while the version is unchanged; row-aligned
+results (demand forecast, recommendations) are patched row by row, so one
+stock update recomputes one row.
+
+    VersionedCache  key -> (version, value)
+    RowCache        frame or array aligned with agent.df positions
+    SortOrder       argsort permutation of agent.df positions by one key
+"""
+
+from typing import Callable, Hashable, Set
+
+import numpy as np
+import pandas as pd
+
+
+class VersionedCache:
+    """Whole results reused until the data version (or stamp) changes"""
+
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, key: Hashable, version, compute: Callable):
+        """Cached value for key at this version, computing it on a miss"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            entry = (version, compute())
+            self._entries[key] = entry
+        return entry[1]
+
+    def clear(self):
+        """Drop everything"""
+        self._entries.clear()
+
+
+class RowCache:
+    """A derived frame or array with one row per agent.df row, patched per row.
+
+    compute(positions) returns the derived rows for those positions of
+    agent.df (positions=None: every row). The owner mirrors its row changes
+    with mark(), remove_at() and invalidate(); get() recomputes only what
+    changed since the last call.
+    """
+
+    def __init__(self, compute: Callable):
+        self.compute = compute
+        self.value = None
+        self.stamp = None
+        self._dirty: Set[int] = set()
+
+    def invalidate(self):
+        """Forget everything (after the frame was replaced)"""
+        self.value = None
+        self._dirty.clear()
+
+    def mark(self, pos: int):
+        """Row pos changed or was appended"""
+        if self.value is not None:
+            self._dirty.add(pos)
+
+    def remove_at(self, pos: int, last: int):
+        """Mirror a swap-remove: row `last` moves into `pos` and the tail is dropped"""
+        if self.value is None:
+            return
+        if last >= len(self.value):
+            # The moved row was appended and never computed
+            self._dirty.discard(last)
+            self._dirty.add(pos)
+        elif pos != last:
+            if isinstance(self.value, pd.DataFrame):
+                moved = self.value.iloc[[last]]
+                self.value.loc[[pos], :] = moved.set_axis([pos])
+            else:
+                self.value[pos] = self.value[last]
+            if last in self._dirty:
+                self._dirty.discard(last)
+                self._dirty.add(pos)
+        self._dirty.discard(last)
+        if last < len(self.value):
+            self.value = self.value[:last] if isinstance(self.value, np.ndarray) else self.value.iloc[:last]
+
+    def get(self, length: int, stamp=None):
+        """Up-to-date value for a frame of `length` rows; a new stamp (e.g. the day) recomputes all"""
+        if self.value is None or stamp != self.stamp:
+            self.value = self.compute(None)
+            self.stamp = stamp
+            self._dirty.clear()
+            return self.value
+        if self._dirty or len(self.value) != length:
+            self._dirty.update(range(len(self.value), length))
+            positions = np.array(sorted(p for p in self._dirty if p < length), dtype=np.int64)
+            self._dirty.clear()
+            self._patch(positions, self.compute(positions))
+        return self.value
+
+    def _patch(self, positions: np.ndarray, rows):
+        """Write recomputed rows in place, appending those past the current end"""
+        inside = positions < len(self.value)
+        if isinstance(self.value, np.ndarray):
+            self.value[positions[inside]] = rows[inside]
+            if not inside.all():
+                self.value = np.concatenate([self.value, rows[~inside]])
+            return
+
+        rows = rows.set_axis(positions)
+        for col in self.value.columns:
+            old, new = self.value[col].dtype, rows[col].dtype
+            if isinstance(old, pd.CategoricalDtype) and old != new:
+                categories = old.categories.append(new.categories.difference(old.categories))
+                self.value[col] = self.value[col].cat.set_categories(categories)
+                rows[col] = rows[col].cat.set_categories(categories)
+        if inside.any():
+            self.value.loc[positions[inside], :] = rows[inside]
+        if not inside.all():
+            self.value = pd.concat([self.value, rows[~inside]])
+
+
+class SortOrder:
+    """Positions of agent.df in ascending order of one key, patched per row.
+
+    key(positions) returns the sort key of those positions (None: every
+    row). Like RowCache, the owner reports row changes with mark(),
+    remove_at() and invalidate(). get() moves the changed rows to their new
+    places with searchsorted and np.insert (O(n) memory moves, no sort) and
+    only argsorts everything again when many rows changed.
+    """
+
+    # Fraction of rows changed above which a full argsort is cheaper
+    RESORT_FRACTION = 0.02
+    # Changed rows moved one by one (each an O(n) in-place shift); more are re-inserted together
+    MOVE_LIMIT = 16
+
+    def __init__(self, key: Callable):
+        self.key = key
+        self.order = None
+        self.keys = None
+        self.stamp = None
+        self._dirty: Set[int] = set()
+
+    def invalidate(self):
+        """Forget everything (after the frame was replaced)"""
+        self.order = self.keys = None
+        self._dirty.clear()
+
+    def mark(self, pos: int):
+        """Row pos changed or was appended"""
+        if self.order is not None:
+            self._dirty.add(pos)
+
+    def remove_at(self, pos: int, last: int):
+        """Mirror a swap-remove: row `last` moves into `pos` and the tail is dropped"""
+        if self.order is None:
+            return
+        # The moved row keeps its place in the order under its new position
+        moved_is_new = last >= len(self.order)
+        keep = self.order != pos
+        self.order, self.keys = self.order[keep], self.keys[keep]
+        self.order[self.order == last] = pos
+        if moved_is_new or last in self._dirty:
+            self._dirty.add(pos)
+        else:
+            self._dirty.discard(pos)
+        self._dirty.discard(last)
+
+    def get(self, length: int, stamp=None) -> np.ndarray:
+        """Up-to-date order for a frame of `length` rows; a new stamp re-sorts everything"""
+        if self.order is not None:
+            # Rows appended since the order was built
+            self._dirty.update(range(len(self.order), length))
+        if self.order is None or stamp != self.stamp or len(self._dirty) > max(64, length * self.RESORT_FRACTION):
+            keys = np.asarray(self.key(None))
+            self.order = np.argsort(keys, kind="stable")
+            self.keys = keys[self.order]
+            self.stamp = stamp
+            self._dirty.clear()
+        elif self._dirty:
+            self._patch(np.array(sorted(p for p in self._dirty if p < length), dtype=np.int64))
+            self._dirty.clear()
+        return self.order
+
+    def _patch(self, positions: np.ndarray):
+        """Move changed rows to where their new keys belong, then insert rows not in the order yet"""
+        new_keys = np.asarray(self.key(positions))
+        if new_keys.dtype.kind == "U" and new_keys.dtype.itemsize > self.keys.dtype.itemsize:
+            self.keys = self.keys.astype(new_keys.dtype)
+        if len(positions) > self.MOVE_LIMIT:
+            # Many rows: take them all out in one pass and insert them again
+            keep = ~np.isin(self.order, positions)
+            self.order, self.keys = self.order[keep], self.keys[keep]
+            self._insert(positions, new_keys)
+            return
+
+        order, keys = self.order, self.keys
+        missing = []
+        for n, (pos, key) in enumerate(zip(positions.tolist(), new_keys)):
+            found = np.flatnonzero(order == pos)
+            if not len(found):
+                missing.append(n)
+                continue
+            # Shift the rows between the old and the new place by one (in place)
+            i = int(found[0])
+            j = int(np.searchsorted(keys, key, side="right"))
+            if j > i:
+                j -= 1
+                order[i:j], keys[i:j] = order[i + 1:j + 1], keys[i + 1:j + 1]
+            else:
+                order[j + 1:i + 1], keys[j + 1:i + 1] = order[j:i], keys[j:i]
+            order[j], keys[j] = pos, key
+        if missing:
+            self._insert(positions[missing], new_keys[missing])
+
+    def _insert(self, positions: np.ndarray, new_keys: np.ndarray):
+        """Insert rows that are not in the order at their sorted places"""
+        by_key = np.argsort(new_keys, kind="stable")
+        positions, new_keys = positions[by_key], new_keys[by_key]
+        at = np.searchsorted(self.keys, new_keys, side="right")
+        self.order = np.insert(self.order, at, positions)
+        self.keys = np.insert(self.keys, at, new_keys)
@@ -0,0 +1,128 @@
+"""
+Stock Events - Alerts when a write moves a product across a risk boundary
+The agent compares the old and new risk level of the one row it writes, so
+detection is O(1) per change and alerting cost follows the number of
+changes, not catalog size. Subscribers register callbacks on an EventBus.
+
+    low_stock     stock fell below low_limit (now HIGH RISK)
+    restocked     stock is back at or above low_limit
+    risk_changed  moved between SAFE and MEDIUM RISK
+"""
+
+import json
+import queue
+import threading
+import urllib.request
+import warnings
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from core.recommendations import HIGH, STATUSES
+
+LOW_STOCK, RESTOCKED, RISK_CHANGED = "low_stock", "restocked", "risk_changed"
+
+
+class StockEvent:
+    """One risk-boundary crossing for one product"""
+
+    __slots__ = ("kind", "product_id", "name", "old_stock", "new_stock", "old_level", "new_level", "time")
+
+    def __init__(self, product_id: str, name: str, old_stock: Optional[int], new_stock: int,
+                 old_level: Optional[int], new_level: int):
+        if new_level == HIGH:
+            self.kind = LOW_STOCK
+        elif old_level == HIGH:
+            self.kind = RESTOCKED
+        else:
+            self.kind = RISK_CHANGED
+        self.product_id = product_id
+        self.name = name
+        self.old_stock = old_stock
+        self.new_stock = new_stock
+        self.old_level = old_level
+        self.new_level = new_level
+        self.time = datetime.now()
+
+    @property
+    def status(self) -> str:
+        """Status label of the new risk level"""
+        return STATUSES[self.new_level]
+
+    def to_dict(self) -> dict:
+        """JSON-friendly representation"""
+        data = {slot: getattr(self, slot) for slot in self.__slots__}
+        data["time"] = self.time.isoformat(timespec="seconds")
+        data["status"] = self.status
+        return data
+
+    def __str__(self):
+        change = f"new, stock {self.new_stock}" if self.old_stock is None else f"stock {self.old_stock} -> {self.new_stock}"
+        return f"{self.time:%Y-%m-%d %H:%M:%S} {self.kind} {self.name} (ID: {self.product_id}) {change}, {self.status}"
+
+
+class EventBus:
+    """Synchronous publish/subscribe for StockEvents"""
+
+    def __init__(self):
+        self._subscribers: List[tuple] = []
+
+    def subscribe(self, callback: Callable[[StockEvent], None], kinds=None) -> Callable[[], None]:
+        """Register callback for all events or only the given kinds; returns an unsubscribe function"""
+        entry = (callback, frozenset(kinds) if kinds else None)
+        self._subscribers.append(entry)
+        return lambda: self._subscribers.remove(entry) if entry in self._subscribers else None
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+    def publish(self, event: StockEvent):
+        """Deliver an event; a failing subscriber never aborts the write that caused it"""
+        for callback, kinds in list(self._subscribers):
+            if kinds is not None and event.kind not in kinds:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                warnings.warn(f"Event subscriber failed: {e}")
+
+
+class LogFileSink:
+    """Subscriber appending one line per event to a log file"""
+
+    def __init__(self, path: str = "inventory_alerts.log"):
+        self.path = path
+
+    def __call__(self, event: StockEvent):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(f"{event}\n")
+
+
+class WebhookSink:
+    """Subscriber POSTing events as JSON to a local endpoint from a background thread.
+
+    The write path only enqueues; delivery failures are counted, not raised.
+    """
+
+    def __init__(self, url: str = "http://127.0.0.1:8765/inventory-events", timeout: float = 2.0):
+        self.url = url
+        self.timeout = timeout
+        self.failures = 0
+        self._queue: "queue.Queue[Dict]" = queue.Queue()
+        threading.Thread(target=self._deliver, daemon=True).start()
+
+    def __call__(self, event: StockEvent):
+        self._queue.put(event.to_dict())
+
+    def _deliver(self):
+        """Send queued events one by one"""
+        while True:
+            payload = self._queue.get()
+            request = urllib.request.Request(
+                self.url, data=json.dumps(payload).encode("utf-8"),
+                headers={"Content-Type": "application/json"}, method="POST")
+            try:
+                urllib.request.urlopen(request, timeout=self.timeout).close()
+            except OSError:
+                self.failures += 1
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,90 @@
+"""
+Demand Forecasting - Vectorized smoothing over every SKU at once
+Loops run over days, never over products: each step updates the whole
+catalog with NumPy, so 100k SKUs x 2 years is a few hundred array ops.
+Days before an SKU's first recorded demand are ignored.
+
+    SES      level = alpha * demand + (1 - alpha) * level
+    Croston  smooths non-zero demand size and the interval between demands
+             separately (SBA bias correction) for intermittent items
+"""
+
+import numpy as np
+
+# Share of zero-demand days above which an SKU is treated as intermittent
+INTERMITTENT_ZERO_SHARE = 0.3
+
+
+def _first_demand(demand: np.ndarray) -> np.ndarray:
+    """Column of the first non-zero value per row (0 for all-zero rows)"""
+    return np.argmax(demand > 0, axis=1)
+
+
+def ses(demand: np.ndarray, alpha: float = 0.2) -> np.ndarray:
+    """Simple exponential smoothing from each row's first demand; returns the final level"""
+    start = _first_demand(demand)
+    level = np.zeros(demand.shape[0])
+    for t, x in enumerate(np.ascontiguousarray(demand.T)):
+        active = t > start
+        level[active] += alpha * (x[active] - level[active])
+        begin = t == start
+        level[begin] = x[begin]
+    return level
+
+
+def croston(demand: np.ndarray, alpha: float = 0.1) -> np.ndarray:
+    """Croston's method with the Syntetos-Boylan correction; daily rate per row"""
+    n = demand.shape[0]
+    size = np.zeros(n)
+    interval = np.ones(n)
+    since = np.ones(n)
+    seen = np.zeros(n, dtype=bool)
+    for x in np.ascontiguousarray(demand.T):
+        hit = x > 0
+        first = hit & ~seen
+        update = hit & seen
+        size[first] = x[first]
+        interval[first] = 1
+        size[update] += alpha * (x[update] - size[update])
+        interval[update] += alpha * (since[update] - interval[update])
+        seen |= hit
+        since[hit] = 1
+        since[~hit] += 1
+    rate = (1 - alpha / 2) * size / interval
+    rate[~seen] = 0.0
+    return rate
+
+
+def demand_std(demand: np.ndarray) -> np.ndarray:
+    """Standard deviation of daily demand since each row's first demand (NaN without history)"""
+    out = np.full(demand.shape[0], np.nan)
+    has_history = (demand > 0).any(axis=1)
+    if not has_history.any():
+        return out
+    rows = demand[has_history].astype(np.float64)
+    active = np.arange(rows.shape[1]) >= _first_demand(rows)[:, None]
+    n = active.sum(axis=1)
+    mean = np.where(active, rows, 0).sum(axis=1) / n
+    out[has_history] = np.sqrt(np.where(active, (rows - mean[:, None]) ** 2, 0).sum(axis=1) / n)
+    return out
+
+
+def forecast_daily_demand(demand: np.ndarray, alpha: float = 0.2, croston_alpha: float = 0.1) -> np.ndarray:
+    """Daily demand rate per row, picking Croston for intermittent SKUs and SES otherwise.
+
+    Rows with no recorded demand at all come back as NaN so callers can fall
+    back to the typed-in Daily Demand.
+    """
+    rates = np.full(demand.shape[0], np.nan)
+    if not demand.size:
+        return rates
+    has_history = (demand > 0).any(axis=1)
+    active_days = demand.shape[1] - _first_demand(demand)
+    zero_share = 1 - (demand > 0).sum(axis=1) / active_days
+    intermittent = has_history & (zero_share > INTERMITTENT_ZERO_SHARE)
+    smooth = has_history & ~intermittent
+    if smooth.any():
+        rates[smooth] = ses(demand[smooth], alpha)
+    if intermittent.any():
+        rates[intermittent] = croston(demand[intermittent], croston_alpha)
+    return rates
@@ -0,0 +1,155 @@
+"""
+Demand History - Compact append-only log of daily consumption per SKU
+Each record is 16 bytes: day (ordinal), quantity and a 64-bit hash of the
+Product ID. Consumption is recorded whenever a stock change lowers stock.
+"""
+
+import hashlib
+import os
+from datetime import date
+from typing import Iterable, Optional
+
+import numpy as np
+
+RECORD = np.dtype([("day", "<i4"), ("qty", "<i4"), ("sku", "<i8")])
+
+
+def sku_key(product_id: str) -> int:
+    """Stable 64-bit key for a Product ID"""
+    digest = hashlib.blake2b(str(product_id).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def sku_keys(product_ids: Iterable[str]) -> np.ndarray:
+    """Keys for many Product IDs"""
+    return np.fromiter((sku_key(pid) for pid in product_ids), dtype=np.int64)
+
+
+class DemandHistory:
+    """Columnar history file stored next to the inventory data.
+
+    Lookups go through an in-memory index of the file: records sorted by SKU
+    key plus the offset where each key's run starts, so the history of a few
+    products is found with searchsorted instead of a scan. Records appended
+    since (by this process or another) are read incrementally and kept in a
+    small unsorted tail until merging them into the index pays off.
+    """
+
+    # Unsorted tail records tolerated (or 1/8 of the index, if larger) before a merge
+    TAIL_LIMIT = 65_536
+
+    def __init__(self, path: str):
+        self.path = path
+        self._reset()
+
+    def _reset(self):
+        """Forget the index"""
+        self._size = 0
+        self._sorted = np.empty(0, dtype=RECORD)
+        self._skus = np.empty(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._tail = np.empty(0, dtype=RECORD)
+
+    def __len__(self) -> int:
+        """Number of records in the file"""
+        self._sync()
+        return self._size
+
+    def record(self, product_ids: Iterable[str], quantities: Iterable[int], day: Optional[int] = None):
+        """Append consumption records (one per product) for `day` (default: today)"""
+        keys = sku_keys(product_ids)
+        if not len(keys):
+            return
+        records = np.empty(len(keys), dtype=RECORD)
+        records["day"] = day if day is not None else date.today().toordinal()
+        records["qty"] = np.fromiter(quantities, dtype=np.int32, count=len(keys))
+        records["sku"] = keys
+        with open(self.path, "ab") as f:
+            records.tofile(f)
+
+    def load(self) -> np.ndarray:
+        """All records as a structured array"""
+        if not os.path.exists(self.path):
+            return np.empty(0, dtype=RECORD)
+        size = os.path.getsize(self.path) // RECORD.itemsize
+        return np.fromfile(self.path, dtype=RECORD, count=size)
+
+    # ==================== INDEX ====================
+    def _sync(self):
+        """Read records appended to the file since the last lookup"""
+        size = os.path.getsize(self.path) // RECORD.itemsize if os.path.exists(self.path) else 0
+        if size < self._size:
+            # The file was replaced or truncated
+            self._reset()
+        if size > self._size:
+            new = np.fromfile(self.path, dtype=RECORD, count=size - self._size,
+                              offset=self._size * RECORD.itemsize)
+            self._tail = np.concatenate((self._tail, new))
+            self._size = size
+        if len(self._tail) > max(self.TAIL_LIMIT, len(self._sorted) // 8):
+            self._merge()
+
+    def _merge(self):
+        """Sort the tail and insert it into the sorted records (O(n) memory moves)"""
+        tail = self._tail[np.argsort(self._tail["sku"])]
+        records = np.insert(self._sorted, np.searchsorted(self._sorted["sku"], tail["sku"]), tail)
+        skus = records["sku"]
+        starts = np.flatnonzero(np.concatenate(([True], skus[1:] != skus[:-1])))
+        self._sorted = records
+        self._skus = skus[starts]
+        self._offsets = np.append(starts, len(records))
+        self._tail = self._tail[:0]
+
+    def _tail_rows(self, keys: np.ndarray):
+        """(row in keys, record) pairs of the tail records whose SKU is among keys"""
+        tail = self._tail
+        if not len(tail) or not len(keys):
+            return np.empty(0, dtype=np.int64), tail[:0]
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        slot = np.minimum(np.searchsorted(sorted_keys, tail["sku"]), len(keys) - 1)
+        hit = sorted_keys[slot] == tail["sku"]
+        return order[slot[hit]], tail[hit]
+
+    def has_history(self, keys: np.ndarray) -> np.ndarray:
+        """Boolean mask of the SKU keys with at least one record"""
+        self._sync()
+        keys = np.asarray(keys, dtype=np.int64)
+        found = np.zeros(len(keys), dtype=bool)
+        if len(self._skus) and len(keys):
+            slot = np.minimum(np.searchsorted(self._skus, keys), len(self._skus) - 1)
+            found = self._skus[slot] == keys
+        found[self._tail_rows(keys)[0]] = True
+        return found
+
+    def window(self, keys: np.ndarray, days: int = 730, end: Optional[int] = None) -> np.ndarray:
+        """Daily demand of SKU keys as a (keys x days) float32 matrix ending on `end` (default: today).
+
+        Only the records of those keys are read; days without records are zero.
+        """
+        end = end if end is not None else date.today().toordinal()
+        keys = np.asarray(keys, dtype=np.int64)
+        out = np.zeros((len(keys), days), dtype=np.float32)
+        self._sync()
+        rows, records = self._tail_rows(keys)
+        if len(self._skus) and len(keys):
+            slot = np.minimum(np.searchsorted(self._skus, keys), len(self._skus) - 1)
+            found = np.flatnonzero(self._skus[slot] == keys)
+            start = self._offsets[slot[found]]
+            count = self._offsets[slot[found] + 1] - start
+            # Positions of every record of the found keys, run by run
+            at = np.arange(count.sum()) + np.repeat(start - (np.cumsum(count) - count), count)
+            rows = np.concatenate((np.repeat(found, count), rows))
+            records = np.concatenate((self._sorted[at], records))
+
+        col = records["day"] - (end - days + 1)
+        keep = (col >= 0) & (col < days)
+        np.add.at(out.ravel(), rows[keep] * days + col[keep], records["qty"][keep].astype(np.float32))
+        return out
+
+    def matrix(self, product_ids: Iterable[str], days: int = 730, end: Optional[int] = None) -> np.ndarray:
+        """Daily demand as a (products x days) float32 matrix ending on `end` (default: today).
+
+        Rows follow the order of product_ids; days without records are zero.
+        """
+        return self.window(sku_keys(product_ids), days, end)
@@ -0,0 +1,129 @@
+"""
+Change Journal - Append-only write-ahead log for inventory mutations
+Each mutation is stored as one JSON line and fsync'd, so the base CSV
+only has to be rewritten when the journal is compacted.
+"""
+
+import json
+import os
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from core.schema import COLUMNS, apply_schema, concat_rows
+
+
+class ChangeJournal:
+    """Append-only log of inventory operations stored next to the CSV"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = len(self.read())
+
+    def append(self, op: dict):
+        """Append one operation and force it to disk"""
+        with open(self.path, "a+b") as f:
+            self._drop_torn_tail(f)
+            f.write((json.dumps(op) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        self.count += 1
+
+    @staticmethod
+    def _drop_torn_tail(f, block: int = 65_536):
+        """Cut a partial last line (a crash mid-write) so the next record starts on its own line"""
+        size = f.seek(0, os.SEEK_END)
+        if not size:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        end = size
+        while end > 0:
+            start = max(0, end - block)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+        f.truncate(end)
+
+    def read(self) -> List[dict]:
+        """Read all complete operations from the journal"""
+        if not os.path.exists(self.path):
+            return []
+        ops = []
+        with open(self.path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    ops.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn line from a crash mid-write never committed; later records still count
+                    continue
+        return ops
+
+    def clear(self):
+        """Truncate the journal after its operations reached the base file"""
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self.count = 0
+
+
+def apply_ops(df: pd.DataFrame, ops: List[dict]) -> pd.DataFrame:
+    """Apply journal operations to a frame in one pass.
+
+    Operations are absolute (stock is set, not adjusted), so replaying a
+    journal whose entries already reached the base file is harmless.
+    """
+    if not ops:
+        return df
+
+    ids = df["Product ID"].astype(str).tolist()
+    positions = {pid: pos for pos, pid in enumerate(ids)}
+    stock = df["Stock"].to_numpy(copy=True)
+    deleted = set()
+    added = {}
+
+    flat = []
+    for op in ops:
+        flat.extend(op["ops"] if op["op"] == "batch" else [op])
+
+    for op in flat:
+        pid = str(op["id"])
+        kind = op["op"]
+        if kind == "add":
+            if (pid in positions and positions[pid] not in deleted) or pid in added:
+                continue
+            added[pid] = {
+                "Product ID": pid,
+                "Product Name": op["name"],
+                "Stock": int(op["stock"]),
+                "Daily Demand": int(op["demand"]),
+            }
+        elif kind == "set":
+            if pid in added:
+                added[pid]["Stock"] = int(op["stock"])
+            elif pid in positions and positions[pid] not in deleted:
+                stock[positions[pid]] = int(op["stock"])
+        elif kind == "delete":
+            if pid in added:
+                del added[pid]
+            elif pid in positions:
+                deleted.add(positions[pid])
+
+    result = apply_schema(df)
+    result["Product ID"] = pd.array(ids, dtype="string")
+    result["Stock"] = stock.astype(result["Stock"].dtype)
+    if deleted:
+        keep = np.ones(len(result), dtype=bool)
+        keep[list(deleted)] = False
+        result = result[keep]
+    if added:
+        result = concat_rows(result, pd.DataFrame(list(added.values()), columns=COLUMNS))
+    return result.reset_index(drop=True)
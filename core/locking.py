@@ -0,0 +1,67 @@
+"""
+File Locking - Cross-process exclusive lock for the inventory files
+Uses fcntl on POSIX and msvcrt on Windows; the lock is held on a small
+sidecar .lock file so the data files themselves can be replaced freely.
+"""
+
+import os
+import time
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """Re-entrant exclusive lock on `<path>`, usable as a context manager"""
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = path
+        self.timeout = timeout
+        self._handle = None
+        self._depth = 0
+
+    def acquire(self):
+        """Block until the lock is held (raises TimeoutError after `timeout` seconds)"""
+        if self._depth:
+            self._depth += 1
+            return
+        handle = open(self.path, "a+b")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if os.name == "nt":
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    handle.close()
+                    raise TimeoutError(f"Could not lock {self.path}")
+                time.sleep(0.05)
+        self._handle = handle
+        self._depth = 1
+
+    def release(self):
+        """Release one level of the lock"""
+        self._depth -= 1
+        if self._depth:
+            return
+        if os.name == "nt":
+            self._handle.seek(0)
+            msvcrt.locking(self._handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        self._handle.close()
+        self._handle = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
@@ -0,0 +1,292 @@
+"""
+Memory-Mapped Storage - Catalog kept in fixed-width files instead of RAM
+Layout of the <name>.mmap directory:
+    stock.i32, demand.i32   one int32 per row, memory-mapped
+    name_code.i32           per-row index into the name heap
+    names.heap, names.off   distinct product names, offset-indexed
+    id.heap, id.off         product IDs; id.off holds (start, length) per row
+    meta.json               row count, heap sizes, data version and generation
+A stock update writes four bytes in place. Rows are swap-removed, which
+matches InventoryAgent, so positions in the files equal positions in agent.df.
+Full rewrites (batches, compaction) write a new generation of the data files
+(<file>.<generation>) and switch to it by replacing meta.json, so a crash
+midway leaves the previous generation in use.
+"""
+
+import json
+import os
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.locking import FileLock
+from core.schema import COLUMNS, apply_schema
+
+# Files rewritten by save(); their names carry the generation from meta.json
+DATA_FILES = ("stock.i32", "demand.i32", "name_code.i32", "id.off", "id.heap", "names.heap", "names.off")
+
+
+class MappedStorage:
+    """Backend that memory-maps numeric columns and keeps strings in heaps"""
+
+    def __init__(self, directory: str, initial_capacity: int = 1024):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.file_lock = FileLock(self._path("lock"))
+        meta_path = self._path("meta.json")
+        if os.path.exists(meta_path):
+            self._read_meta()
+        else:
+            self.meta = {"count": 0, "capacity": initial_capacity, "id_heap": 0, "version": 0}
+            for name in ("id.heap", "names.heap"):
+                open(self._file(name), "wb").close()
+            self._write_names_offsets([0])
+            self._write_meta()
+        self._map_columns(self.meta["capacity"])
+        self._load_names()
+
+    # ==================== FILE LAYOUT ====================
+    def _path(self, name: str) -> str:
+        """Path of one file inside the storage directory"""
+        return os.path.join(self.directory, name)
+
+    def _file(self, name: str, generation: Optional[int] = None) -> str:
+        """Path of one data file of a generation (default: the current one)"""
+        generation = self.meta.get("generation", 0) if generation is None else generation
+        return self._path(f"{name}.{generation}" if generation else name)
+
+    def _write_file(self, name: str, generation: int, data: bytes, size: int = 0):
+        """Write a data file of a new generation to disk, zero-padded to `size` bytes"""
+        with open(self._file(name, generation), "wb") as f:
+            f.write(data)
+            if size > len(data):
+                f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_meta(self):
+        """Load row count, heap sizes and data version"""
+        with open(self._path("meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.meta.setdefault("version", 0)
+
+    def _write_meta(self, sync: bool = False):
+        """Persist row count and heap sizes, advancing the data version (sync: fsync it first)"""
+        self.meta["version"] = self.meta.get("version", 0) + 1
+        tmp_path = self._path("meta.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self._path("meta.json"))
+
+    def _map(self, name: str, dtype, shape):
+        """Open (creating or growing) one fixed-width column file"""
+        path = self._file(name)
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        with open(path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+        return np.memmap(path, dtype=dtype, mode="r+", shape=shape)
+
+    def _map_columns(self, capacity: int):
+        """Map all fixed-width columns for the given row capacity"""
+        self.stock = self._map("stock.i32", np.int32, (capacity,))
+        self.demand = self._map("demand.i32", np.int32, (capacity,))
+        self.name_code = self._map("name_code.i32", np.int32, (capacity,))
+        self.id_off = self._map("id.off", np.int64, (capacity, 2))
+        self.meta["capacity"] = capacity
+
+    def _ensure_capacity(self, rows: int):
+        """Grow the column files (doubling) so `rows` rows fit"""
+        capacity = self.meta["capacity"]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        for column in (self.stock, self.demand, self.name_code, self.id_off):
+            column.flush()
+        self._map_columns(capacity)
+
+    def _load_names(self):
+        """Load the distinct-name heap (small) into memory"""
+        offsets = np.fromfile(self._file("names.off"), dtype=np.int64)
+        with open(self._file("names.heap"), "rb") as f:
+            heap = f.read()
+        self.names: List[str] = [heap[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+        self.name_codes = {name: code for code, name in enumerate(self.names)}
+        self.names_offsets = offsets.tolist()
+
+    def _write_names_offsets(self, offsets):
+        """Rewrite the (small) name offset file"""
+        np.asarray(offsets, dtype=np.int64).tofile(self._file("names.off"))
+
+    def _name_code(self, name: str) -> int:
+        """Code of a name, appending it to the name heap when new"""
+        code = self.name_codes.get(name)
+        if code is None:
+            data = name.encode("utf-8")
+            with open(self._file("names.heap"), "ab") as f:
+                f.write(data)
+            self.names_offsets.append(self.names_offsets[-1] + len(data))
+            self._write_names_offsets(self.names_offsets)
+            code = len(self.names)
+            self.names.append(name)
+            self.name_codes[name] = code
+        return code
+
+    # ==================== ROW ACCESS ====================
+    def _read_ids(self, start: int, stop: int) -> List[str]:
+        """Decode product IDs for rows [start, stop)"""
+        offsets = np.asarray(self.id_off[start:stop])
+        if not len(offsets):
+            return []
+        lo, hi = int(offsets[:, 0].min()), int((offsets[:, 0] + offsets[:, 1]).max())
+        with open(self._file("id.heap"), "rb") as f:
+            f.seek(lo)
+            heap = f.read(hi - lo)
+        return [heap[s - lo:s - lo + n].decode("utf-8") for s, n in offsets.tolist()]
+
+    def _frame(self, start: int, stop: int) -> pd.DataFrame:
+        """Build a frame for rows [start, stop); numeric columns stay mapped"""
+        names = pd.Categorical.from_codes(np.asarray(self.name_code[start:stop]), categories=self.names)
+        return pd.DataFrame({
+            "Product ID": pd.array(self._read_ids(start, stop), dtype="string"),
+            "Product Name": names,
+            "Stock": self.stock[start:stop],
+            "Daily Demand": self.demand[start:stop],
+        }, columns=COLUMNS, copy=False)
+
+    def iter_chunks(self, df: pd.DataFrame, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Stream the catalog in fixed-size chunks over the mapped pages"""
+        for start in range(0, self.meta["count"], chunksize):
+            yield self._frame(start, min(start + chunksize, self.meta["count"]))
+
+    def _append(self, product_id: str, name: str, stock: int, demand: int):
+        """Write one row at the end of every column"""
+        pos = self.meta["count"]
+        self._ensure_capacity(pos + 1)
+        data = str(product_id).encode("utf-8")
+        with open(self._file("id.heap"), "ab") as f:
+            f.write(data)
+        self.id_off[pos] = (self.meta["id_heap"], len(data))
+        self.meta["id_heap"] += len(data)
+        self.stock[pos] = stock
+        self.demand[pos] = demand
+        self.name_code[pos] = self._name_code(str(name))
+        self.meta["count"] = pos + 1
+
+    def _swap_remove(self, pos: int):
+        """Move the last row into `pos` and shrink by one (heap space is reclaimed on save)"""
+        last = self.meta["count"] - 1
+        if pos != last:
+            for column in (self.stock, self.demand, self.name_code, self.id_off):
+                column[pos] = column[last]
+        self.meta["count"] = last
+
+    # ==================== STORAGE INTERFACE ====================
+    def lock(self) -> FileLock:
+        """Exclusive cross-process lock around read-modify-write sequences"""
+        return self.file_lock
+
+    def poll(self):
+        """("reload", None) when another process changed the files since our last load"""
+        with open(self._path("meta.json"), encoding="utf-8") as f:
+            version = json.load(f).get("version", 0)
+        return ("reload", None) if version != self.meta["version"] else (None, None)
+
+    def load(self) -> pd.DataFrame:
+        """Frame over the whole catalog; Stock and Daily Demand are not copied into RAM"""
+        with self.file_lock:
+            self._read_meta()
+            self._map_columns(self.meta["capacity"])
+            self._load_names()
+            return self._frame(0, self.meta["count"])
+
+    def save(self, df: pd.DataFrame):
+        """Rewrite every file from df, dropping heap garbage.
+
+        The files of the next generation are written and synced first;
+        replacing meta.json commits them, then the old generation is removed.
+        """
+        df = apply_schema(df)
+        old = self.meta.get("generation", 0)
+        generation = old + 1
+        n = len(df)
+        capacity = self.meta["capacity"]
+        while capacity < n:
+            capacity *= 2
+
+        encoded = [str(name).encode("utf-8") for name in df["Product Name"].cat.categories]
+        names_offsets = np.concatenate(([0], np.cumsum([len(b) for b in encoded], dtype=np.int64)))
+        self._write_file("names.heap", generation, b"".join(encoded))
+        self._write_file("names.off", generation, names_offsets.astype(np.int64).tobytes())
+
+        ids = [str(pid).encode("utf-8") for pid in df["Product ID"]]
+        lengths = np.fromiter((len(b) for b in ids), dtype=np.int64, count=len(ids))
+        self._write_file("id.heap", generation, b"".join(ids))
+        columns = {
+            "stock.i32": df["Stock"].to_numpy(dtype=np.int32),
+            "demand.i32": df["Daily Demand"].to_numpy(dtype=np.int32),
+            "name_code.i32": df["Product Name"].cat.codes.to_numpy(dtype=np.int32),
+            "id.off": np.column_stack((np.cumsum(lengths) - lengths, lengths)).astype(np.int64),
+        }
+        for name, values in columns.items():
+            row_bytes = values.itemsize * int(np.prod(values.shape[1:]))
+            self._write_file(name, generation, values.tobytes(), capacity * row_bytes)
+
+        previous = dict(self.meta)
+        self.meta.update({"generation": generation, "count": n, "capacity": capacity, "id_heap": int(lengths.sum())})
+        try:
+            self._write_meta(sync=True)
+        except BaseException:
+            self.meta = previous
+            raise
+        self._map_columns(capacity)
+        self._load_names()
+        for name in DATA_FILES:
+            try:
+                os.remove(self._file(name, old))
+            except OSError:
+                # Still open elsewhere (Windows): left behind, never read again
+                pass
+
+    def record(self, op: dict, df: pd.DataFrame, pos: Optional[int] = None):
+        """Apply one mutation in place; `pos` is the row position in agent.df"""
+        kind = op["op"]
+        if kind == "set":
+            self.stock[pos] = int(op["stock"])
+            self.stock.flush()
+            self._write_meta()
+            return
+        if kind == "add":
+            self._append(op["id"], op["name"], int(op["stock"]), int(op["demand"]))
+        elif kind == "delete":
+            self._swap_remove(pos)
+        self._flush()
+
+    def record_batch(self, ops: list, df: pd.DataFrame):
+        """Batches are applied order-preserving by the agent, so rewrite from df (atomically)"""
+        self.save(df)
+
+    def append_rows(self, rows: pd.DataFrame, df: pd.DataFrame):
+        """Append imported products at the end of the files"""
+        for pid, name, stock, demand in rows[COLUMNS].itertuples(index=False, name=None):
+            self._append(pid, name, int(stock), int(demand))
+        self._flush()
+
+    def _flush(self):
+        """Flush mapped columns and the row count"""
+        for column in (self.stock, self.demand, self.name_code, self.id_off):
+            column.flush()
+        self._write_meta()
+
+    def compact(self, df: pd.DataFrame):
+        """Reclaim heap space left behind by deletes"""
+        self.save(df)
+
+    def compaction_due(self) -> bool:
+        """Mutations are written in place"""
+        return False
@@ -0,0 +1,63 @@
+"""
+Recommendation Engine - Risk scoring for the whole catalog in one pass
+Shared by the CLI and the AI Insights page; both only format the result.
+
+    demand_rate    = forecast from history (core/forecasting.py), else daily_demand
+    forecast       = demand_rate * 7
+    priority_score = demand_rate * 2 - stock
+    HIGH   if stock < low_limit
+    MEDIUM if priority_score > 0
+    SAFE   otherwise
+Custom thresholds and rules come from core/rules.py.
+"""
+
+import numpy as np
+import pandas as pd
+
+HIGH, MEDIUM, SAFE = 2, 1, 0
+
+# Indexed by risk level
+STATUSES = ["🟢 SAFE", "🟡 MEDIUM RISK", "🔴 HIGH RISK"]
+RECOMMENDATIONS = [
+    "Stock levels are healthy. Continue monitoring.",
+    "Monitor stock closely. Plan to reorder soon.",
+    "URGENT: Reorder immediately!",
+]
+
+RESULT_COLUMNS = [
+    "Product ID", "Product Name", "Stock", "Daily Demand",
+    "Forecast", "Priority Score", "Risk Level", "Status", "Recommendation",
+]
+
+
+def risk(stock, rate, low_limit):
+    """Priority score and risk level; works on arrays and on single values"""
+    score = np.rint(np.multiply(rate, 2)).astype(np.int64) - stock
+    level = np.where(np.less(stock, low_limit), HIGH, np.where(score > 0, MEDIUM, SAFE)).astype(np.int8)
+    return score, level
+
+
+def compute_recommendations(df: pd.DataFrame, low_limit: int, demand_rate=None, model=None) -> pd.DataFrame:
+    """Score, classify and forecast every row of df with vectorized operations.
+
+    demand_rate: optional forecast daily demand per row (NaN = no history).
+    model: optional core.rules.RiskModel (per-product limits and rules).
+    """
+    stock = df["Stock"].to_numpy(dtype=np.int64)
+    demand = df["Daily Demand"].to_numpy(dtype=np.int64)
+    rate = demand.astype(np.float64)
+    if demand_rate is not None:
+        rate = np.where(np.isnan(demand_rate), rate, demand_rate)
+    score, level = model.classify_frame(df, rate) if model is not None else risk(stock, rate, low_limit)
+
+    return pd.DataFrame({
+        "Product ID": df["Product ID"].array,
+        "Product Name": df["Product Name"].array,
+        "Stock": stock,
+        "Daily Demand": demand,
+        "Forecast": np.rint(rate * 7).astype(np.int64),
+        "Priority Score": score,
+        "Risk Level": level,
+        "Status": pd.Categorical.from_codes(level, categories=STATUSES),
+        "Recommendation": pd.Categorical.from_codes(level, categories=RECOMMENDATIONS),
+    }, columns=RESULT_COLUMNS)
@@ -0,0 +1,81 @@
+"""
+Reorder Planner - Safety stock, reorder point and EOQ for every SKU
+One vectorized computation over the catalog:
+
+    safety_stock  = z(service_level) * demand_std * sqrt(lead_time)
+    reorder_point = demand_rate * lead_time + safety_stock
+    eoq           = sqrt(2 * annual_demand * order_cost / (unit_cost * holding_rate))
+    days_of_cover = stock / demand_rate
+Products at or below their reorder point get a suggested order quantity.
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+PLAN_COLUMNS = [
+    "Product ID", "Product Name", "Stock", "Demand Rate", "Days of Cover",
+    "Safety Stock", "Reorder Point", "EOQ", "Order Qty", "Order In Days",
+]
+
+
+def per_product(values, product_ids: pd.Series, default: float) -> np.ndarray:
+    """Broadcast a scalar, a per-row array or a {Product ID: value} mapping to one float per row"""
+    if isinstance(values, dict):
+        return product_ids.map(values).astype("float64").fillna(default).to_numpy()
+    if isinstance(values, np.ndarray):
+        return np.where(np.isnan(values), default, values) if values.dtype.kind == "f" else values.astype(np.float64)
+    return np.full(len(product_ids), float(values if values is not None else default))
+
+
+def plan_reorders(df: pd.DataFrame, demand_rate=None, demand_std=None, lead_time_days=7,
+                  order_cost=50.0, unit_cost=10.0, holding_rate=0.25,
+                  service_level: float = 0.95) -> pd.DataFrame:
+    """Purchase-suggestion table for every row of df.
+
+    demand_rate / demand_std: optional per-row arrays (NaN = unknown); the
+    typed-in Daily Demand and a Poisson std (sqrt of the rate) fill the gaps.
+    lead_time_days, order_cost, unit_cost: scalar, per-row array or {Product ID: value}.
+    Raises ValueError if a product's unit cost times holding_rate is not positive.
+    """
+    ids = df["Product ID"]
+    stock = df["Stock"].to_numpy(dtype=np.float64)
+    rate = df["Daily Demand"].to_numpy(dtype=np.float64)
+    if demand_rate is not None:
+        rate = np.where(np.isnan(demand_rate), rate, demand_rate)
+    std = np.sqrt(rate)
+    if demand_std is not None:
+        std = np.where(np.isnan(demand_std), std, demand_std)
+
+    lead = per_product(lead_time_days, ids, 7)
+    setup = per_product(order_cost, ids, 50.0)
+    holding = per_product(unit_cost, ids, 10.0) * holding_rate
+    invalid = ~(holding > 0)
+    if invalid.any():
+        sample = ", ".join(map(str, ids[invalid].head(5)))
+        raise ValueError(f"unit_cost and holding_rate must be positive (products: {sample})")
+    z = NormalDist().inv_cdf(service_level)
+
+    safety = z * std * np.sqrt(lead)
+    reorder_point = rate * lead + safety
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eoq = np.sqrt(2 * rate * 365 * setup / holding)
+        cover = np.where(rate > 0, stock / rate, np.inf)
+        order_in = np.where(rate > 0, np.maximum(stock - reorder_point, 0) / rate, np.inf)
+    eoq = np.nan_to_num(eoq)
+    due = (stock <= reorder_point) & (rate > 0)
+    order_qty = np.where(due, np.maximum(np.ceil(eoq), np.ceil(reorder_point - stock)), 0)
+
+    return pd.DataFrame({
+        "Product ID": ids.array,
+        "Product Name": df["Product Name"].array,
+        "Stock": stock.astype(np.int64),
+        "Demand Rate": rate.round(2),
+        "Days of Cover": cover.round(1),
+        "Safety Stock": np.ceil(safety).astype(np.int64),
+        "Reorder Point": np.ceil(reorder_point).astype(np.int64),
+        "EOQ": np.ceil(eoq).astype(np.int64),
+        "Order Qty": order_qty.astype(np.int64),
+        "Order In Days": order_in.round(1),
+    }, columns=PLAN_COLUMNS)
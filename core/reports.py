@@ -0,0 +1,122 @@
+"""
+Report Writers - PDF report and CSV export from plain data
+The writers only read the frames they are given, so they can run on a
+background thread over a snapshot (see InventoryAgent.snapshot()). An
+optional task object receives progress and can stop the work:
+
+    task.progress(done, total)   called every few thousand rows
+    task.check()                 raises when the task was cancelled
+
+Cancelled or failed writes leave no partial file behind.
+"""
+
+import os
+from datetime import datetime
+
+import pandas as pd
+
+# Try to import reportlab for PDF generation
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    HAS_REPORTLAB = True
+except ImportError:
+    HAS_REPORTLAB = False
+
+# Rows between progress reports / cancellation checks
+PROGRESS_EVERY = 2_000
+
+
+def _step(task, done: int, total: int):
+    """Report progress and honour cancellation"""
+    if task is not None:
+        task.check()
+        task.progress(done, total)
+
+
+def write_pdf_report(filename: str, df: pd.DataFrame, plan: pd.DataFrame, task=None) -> str:
+    """Write the inventory listing and purchase suggestions to a PDF"""
+    due = plan[plan["Order Qty"] > 0]
+    total = len(df) + len(due)
+    tmp_path = filename + ".tmp"
+    pdf = canvas.Canvas(tmp_path, pagesize=A4)
+    try:
+        # Header
+        pdf.setFont("Helvetica-Bold", 16)
+        pdf.drawString(50, 800, "INVENTORY MANAGEMENT REPORT")
+        pdf.setFont("Helvetica", 10)
+        pdf.drawString(50, 780, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+        # Content
+        y = 750
+        pdf.setFont("Helvetica-Bold", 11)
+
+        rows = zip(df["Product Name"], df["Product ID"], df["Stock"], df["Daily Demand"])
+        for done, (name, pid, stock, demand) in enumerate(rows):
+            if done % PROGRESS_EVERY == 0:
+                _step(task, done, total)
+            pdf.drawString(50, y, f"Product: {name} (ID: {pid})")
+            y -= 15
+            pdf.setFont("Helvetica", 10)
+            pdf.drawString(60, y, f"Stock: {stock} | Daily Demand: {demand}")
+            y -= 15
+            y -= 5
+
+            if y < 50:
+                pdf.showPage()
+                y = 800
+
+        # Purchase suggestions
+        if y < 100:
+            pdf.showPage()
+            y = 800
+        y -= 10
+        pdf.setFont("Helvetica-Bold", 13)
+        pdf.drawString(50, y, "PURCHASE SUGGESTIONS")
+        y -= 20
+        pdf.setFont("Helvetica", 10)
+        if due.empty:
+            pdf.drawString(50, y, "All products are above their reorder point.")
+        rows = zip(due["Product Name"], due["Product ID"], due["Stock"], due["Reorder Point"],
+                   due["Safety Stock"], due["Days of Cover"], due["Order Qty"])
+        for done, (name, pid, stock, reorder_point, safety, cover, order_qty) in enumerate(rows, len(df)):
+            if done % PROGRESS_EVERY == 0:
+                _step(task, done, total)
+            pdf.drawString(50, y, f"{name} (ID: {pid}) - order {order_qty} units")
+            y -= 15
+            pdf.drawString(60, y, f"Stock: {stock} | Reorder Point: {reorder_point} | "
+                                  f"Safety Stock: {safety} | Days of Cover: {cover}")
+            y -= 20
+
+            if y < 50:
+                pdf.showPage()
+                pdf.setFont("Helvetica", 10)
+                y = 800
+
+        _step(task, total, total)
+        pdf.save()
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return filename
+
+
+def write_csv(filename: str, data: pd.DataFrame, task=None, chunksize: int = 50_000) -> str:
+    """Write a frame to CSV in chunks"""
+    tmp_path = filename + ".tmp"
+    total = len(data)
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            data.iloc[:0].to_csv(f, index=False)
+            for start in range(0, total, chunksize):
+                _step(task, start, total)
+                data.iloc[start:start + chunksize].to_csv(f, index=False, header=False)
+        _step(task, total, total)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return filename
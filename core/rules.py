@@ -0,0 +1,240 @@
+"""
+Risk Rules - Per-product thresholds and a small compiled rule language
+Low-stock limits resolve per SKU, then per category (Product Name), then the
+global default. Risk levels come from rules such as
+
+    days_of_cover < lead_time * 1.5 -> HIGH
+    demand == 0 and stock > 0 -> SAFE
+
+Each rule is parsed once with `ast` and compiled into a NumPy expression over
+whole columns (`and`/`or`/`not` become `&`/`|`/`~`), so a rule costs a few
+array operations for the entire catalog. Levels are picked with np.select:
+the first matching rule wins, custom rules before the built-in ones.
+
+Variables: stock, demand, rate, forecast, score, low_limit, lead_time,
+days_of_cover. Functions: min, max, abs.
+"""
+
+import ast
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.recommendations import HIGH, MEDIUM, SAFE, risk
+
+LEVELS = {"HIGH": HIGH, "MEDIUM": MEDIUM, "SAFE": SAFE}
+
+# The classic classification, always evaluated after custom rules
+DEFAULT_RULES = ["stock < low_limit -> HIGH", "score > 0 -> MEDIUM"]
+
+VARIABLES = {"stock", "demand", "rate", "forecast", "score", "low_limit", "lead_time", "days_of_cover"}
+FUNCTIONS = {"min": "minimum", "max": "maximum", "abs": "abs"}
+
+_ALLOWED = (ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.UAdd,
+            ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+            ast.Compare, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+            ast.Name, ast.Load, ast.Constant, ast.Call)
+
+
+class RuleError(ValueError):
+    """A rule that does not parse or uses something outside the language"""
+
+
+class _Vectorize(ast.NodeTransformer):
+    """Rewrite a validated rule expression into NumPy column operations"""
+
+    def visit_BoolOp(self, node):
+        values = [self.visit(value) for value in node.values]
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        result = values[0]
+        for value in values[1:]:
+            result = ast.BinOp(left=result, op=op, right=value)
+        return result
+
+    def visit_UnaryOp(self, node):
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(op=ast.Invert(), operand=operand)
+        return ast.UnaryOp(op=node.op, operand=operand)
+
+    def visit_Compare(self, node):
+        # a < b < c  ->  (a < b) & (b < c)
+        left = self.visit(node.left)
+        parts = []
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self.visit(comparator)
+            parts.append(ast.Compare(left=left, ops=[op], comparators=[right]))
+            left = right
+        result = parts[0]
+        for part in parts[1:]:
+            result = ast.BinOp(left=result, op=ast.BitAnd(), right=part)
+        return result
+
+    def visit_Name(self, node):
+        return ast.Subscript(value=ast.Name(id="cols", ctx=ast.Load()), slice=ast.Constant(node.id), ctx=ast.Load())
+
+    def visit_Call(self, node):
+        func = ast.Attribute(value=ast.Name(id="np", ctx=ast.Load()), attr=FUNCTIONS[node.func.id], ctx=ast.Load())
+        return ast.Call(func=func, args=[self.visit(arg) for arg in node.args], keywords=[])
+
+
+class Rule:
+    """One compiled `condition -> LEVEL` rule"""
+
+    __slots__ = ("source", "level", "code")
+
+    def __init__(self, source: str):
+        self.source = source
+        text = source.replace("→", "->")
+        if "->" not in text:
+            raise RuleError(f"Missing '-> LEVEL' in rule: {source}")
+        condition, level = (part.strip() for part in text.rsplit("->", 1))
+        if level.upper() not in LEVELS:
+            raise RuleError(f"Unknown level '{level}' in rule: {source} (use HIGH, MEDIUM or SAFE)")
+        self.level = LEVELS[level.upper()]
+        try:
+            tree = ast.parse(condition, mode="eval")
+        except SyntaxError as e:
+            raise RuleError(f"Cannot parse rule: {source} ({e.msg})") from None
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED):
+                raise RuleError(f"'{type(node).__name__}' is not allowed in rule: {source}")
+            if isinstance(node, ast.Name) and node.id not in VARIABLES and node.id not in FUNCTIONS:
+                raise RuleError(f"Unknown name '{node.id}' in rule: {source}")
+            if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS
+                                               or node.keywords):
+                raise RuleError(f"Only min(), max() and abs() can be called in rule: {source}")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise RuleError(f"Only numbers are allowed as constants in rule: {source}")
+        tree = ast.fix_missing_locations(_Vectorize().visit(tree))
+        self.code = compile(tree, f"<rule: {source}>", "eval")
+
+    def evaluate(self, cols) -> np.ndarray:
+        """Boolean mask over the rows described by cols"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mask = eval(self.code, {"__builtins__": {}, "np": np, "cols": cols})
+        return np.broadcast_to(np.asarray(mask, dtype=bool), cols["stock"].shape)
+
+    def __repr__(self):
+        return f"Rule({self.source!r})"
+
+
+class _Columns(dict):
+    """Rule variables; derived ones are computed on first use and shared by all rules"""
+
+    def __missing__(self, name):
+        if name == "score":
+            value = np.rint(self["rate"] * 2).astype(np.int64) - self["stock"]
+        elif name == "forecast":
+            value = np.rint(self["rate"] * 7)
+        elif name == "days_of_cover":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                value = np.where(self["rate"] > 0, self["stock"] / self["rate"], np.inf)
+        else:
+            raise KeyError(name)
+        self[name] = value
+        return value
+
+
+class RiskModel:
+    """Thresholds and rules deciding each product's risk level"""
+
+    def __init__(self, low_limit: int = 10, category_limits: Optional[Dict[str, int]] = None,
+                 sku_limits: Optional[Dict[str, int]] = None, lead_time: float = 7,
+                 sku_lead_times: Optional[Dict[str, float]] = None, rules: Optional[List[str]] = None):
+        self.low_limit = low_limit
+        self.category_limits = dict(category_limits or {})
+        self.sku_limits = dict(sku_limits or {})
+        self.lead_time = lead_time
+        self.sku_lead_times = dict(sku_lead_times or {})
+        self.rules = [Rule(text) for text in (rules or [])]
+        self._compiled = self.rules + [Rule(text) for text in DEFAULT_RULES]
+
+    # ==================== PERSISTENCE ====================
+    @classmethod
+    def load(cls, path: str, low_limit: int = 10) -> "RiskModel":
+        """Read a rules file; a missing file gives the built-in behaviour"""
+        if not os.path.exists(path):
+            return cls(low_limit)
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        return cls(config.get("low_limit", low_limit), config.get("category_limits"), config.get("sku_limits"),
+                   config.get("lead_time", 7), config.get("sku_lead_times"), config.get("rules"))
+
+    def save(self, path: str):
+        """Write the rules file atomically"""
+        config = {
+            "low_limit": self.low_limit,
+            "category_limits": self.category_limits,
+            "sku_limits": self.sku_limits,
+            "lead_time": self.lead_time,
+            "sku_lead_times": self.sku_lead_times,
+            "rules": [rule.source for rule in self.rules],
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    # ==================== THRESHOLDS ====================
+    def limit_of(self, product_id: str, name: str) -> int:
+        """Low-stock limit of one product: SKU, then category, then default"""
+        limit = self.sku_limits.get(product_id)
+        if limit is None:
+            limit = self.category_limits.get(name, self.low_limit)
+        return limit
+
+    def limits(self, product_ids, names) -> np.ndarray:
+        """Low-stock limit per row, resolved with vectorized lookups"""
+        limits = np.full(len(product_ids), self.low_limit, dtype=np.int64)
+        if self.category_limits:
+            by_name = names.map(self.category_limits).astype("float64").to_numpy()
+            limits = np.where(np.isnan(by_name), limits, by_name).astype(np.int64)
+        if self.sku_limits:
+            by_sku = product_ids.map(self.sku_limits).astype("float64").to_numpy()
+            limits = np.where(np.isnan(by_sku), limits, by_sku).astype(np.int64)
+        return limits
+
+    def lead_times(self, product_ids) -> np.ndarray:
+        """Lead time in days per row"""
+        if not self.sku_lead_times:
+            return np.full(len(product_ids), float(self.lead_time))
+        return product_ids.map(self.sku_lead_times).astype("float64").fillna(self.lead_time).to_numpy()
+
+    # ==================== CLASSIFICATION ====================
+    def classify(self, stock, rate, limit, lead_time=None, demand=None):
+        """Priority score and risk level per row (arrays, or scalars for one product)"""
+        if not self.rules:
+            return risk(stock, rate, limit)
+        scalar = np.ndim(stock) == 0
+        cols = _Columns(
+            stock=np.atleast_1d(np.asarray(stock, dtype=np.int64)),
+            rate=np.atleast_1d(np.asarray(rate, dtype=np.float64)),
+        )
+        shape = cols["stock"].shape
+        cols["low_limit"] = np.broadcast_to(limit, shape)
+        cols["lead_time"] = np.broadcast_to(self.lead_time if lead_time is None else lead_time, shape)
+        cols["demand"] = np.broadcast_to(cols["rate"] if demand is None else demand, shape)
+        level = np.select([rule.evaluate(cols) for rule in self._compiled],
+                          [rule.level for rule in self._compiled], SAFE).astype(np.int8)
+        score = cols["score"]
+        return (score[0], level[0]) if scalar else (score, level)
+
+    def classify_frame(self, df, rate) -> tuple:
+        """(score, level) for every row of an inventory frame"""
+        ids = df["Product ID"]
+        return self.classify(df["Stock"].to_numpy(dtype=np.int64), rate, self.limits(ids, df["Product Name"]),
+                             self.lead_times(ids), df["Daily Demand"].to_numpy(dtype=np.int64))
+
+
+def check_rules(rules: Iterable[str]) -> List[str]:
+    """Error messages for rules that do not compile (empty if all are fine)"""
+    errors = []
+    for text in rules:
+        try:
+            Rule(text)
+        except RuleError as e:
+            errors.append(str(e))
+    return errors
@@ -0,0 +1,93 @@
+"""
+Catalog Schema - Explicit, stable dtypes for the inventory frame
+Product IDs are strings, names are categorical (each distinct name stored
+once), and the counters are int32. Every load and append goes through here
+so dtypes never drift between saves, loads and mutations.
+"""
+
+import warnings
+from typing import Optional
+
+import pandas as pd
+
+COLUMNS = ["Product ID", "Product Name", "Stock", "Daily Demand"]
+
+SCHEMA = {
+    "Product ID": "string",
+    "Product Name": "category",
+    "Stock": "int32",
+    "Daily Demand": "int32",
+}
+
+# Stock and Daily Demand are stored as int32
+COUNT_MIN, COUNT_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+def check_count(value, field: str) -> int:
+    """value as an int, raising ValueError unless it is a whole number that fits the int32 columns"""
+    try:
+        number = int(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"{field} must be a whole number") from None
+    if not COUNT_MIN <= number <= COUNT_MAX:
+        raise ValueError(f"{field} must be between {COUNT_MIN:,} and {COUNT_MAX:,}")
+    return number
+
+
+def apply_schema(df: pd.DataFrame, source: Optional[str] = None) -> pd.DataFrame:
+    """Return df with exactly the schema columns and dtypes.
+
+    Blank Stock or Daily Demand cells become 0, with a warning naming the
+    source (e.g. the file) and the data rows (1 = first row after the header).
+    """
+    df = df.reindex(columns=COLUMNS)
+    blank = df[["Stock", "Daily Demand"]].isna().any(axis=1).to_numpy()
+    if blank.any():
+        rows = (blank.nonzero()[0] + 1).tolist()
+        listed = ", ".join(map(str, rows[:10])) + (f" and {len(rows) - 10} more" if len(rows) > 10 else "")
+        warnings.warn(f"{source or 'Inventory data'}: blank Stock or Daily Demand set to 0 in row(s) {listed}")
+        df = df.fillna({"Stock": 0, "Daily Demand": 0})
+    if isinstance(df["Product Name"].dtype, pd.CategoricalDtype):
+        # astype("category") on a categorical hands back read-only codes,
+        # which breaks later in-place writes (swap-remove)
+        return df.astype({col: dtype for col, dtype in SCHEMA.items() if col != "Product Name"})
+    df["Product Name"] = df["Product Name"].astype(str)
+    return df.astype(SCHEMA)
+
+
+def concat_rows(df: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """Append rows without upcasting the categorical name column to object"""
+    rows = apply_schema(rows)
+    names = df["Product Name"].cat.categories
+    new_names = rows["Product Name"].cat.categories.difference(names)
+    categories = names.append(new_names) if len(new_names) else names
+    name_dtype = pd.CategoricalDtype(categories)
+    df = df.assign(**{"Product Name": df["Product Name"].cat.set_categories(categories)})
+    rows = rows.assign(**{"Product Name": rows["Product Name"].astype(name_dtype)})
+    return pd.concat([df, rows], ignore_index=True)
+
+
+class ProductRecord:
+    """Lightweight single-row view of a product"""
+
+    __slots__ = ("product_id", "name", "stock", "demand")
+
+    def __init__(self, product_id: str, name: str, stock: int, demand: int):
+        self.product_id = product_id
+        self.name = name
+        self.stock = stock
+        self.demand = demand
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, pos: int) -> "ProductRecord":
+        """Read one row by position without building a pandas Series"""
+        return cls(
+            str(df["Product ID"].iat[pos]),
+            str(df["Product Name"].iat[pos]),
+            int(df["Stock"].iat[pos]),
+            int(df["Daily Demand"].iat[pos]),
+        )
+
+    def __repr__(self):
+        return f"ProductRecord({self.product_id!r}, {self.name!r}, stock={self.stock}, demand={self.demand})"
+
@@ -0,0 +1,238 @@
+"""
+Search Index - Search-as-you-type over Product ID and Product Name
+Every product is a document with a stable number. Documents live in
+immutable segments, each holding two vectorized structures per field:
+
+    prefix keys   lowercase IDs and names, sorted, searched with searchsorted
+    trigrams      sorted postings of document numbers per 3-byte gram (CSR)
+
+A query first takes products whose ID or name starts with it (in key order),
+then fills up with products containing it anywhere (3+ characters), checking
+candidates a chunk at a time and stopping once enough were found. New
+products go to a small unindexed tail that is scanned directly and sealed
+into a segment when it fills; small segments are merged as they pile up, so
+each product is re-indexed O(log n) times. Deleted products are masked out.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Unindexed products scanned directly before they are sealed into a segment
+TAIL_LIMIT = 1024
+# Characters of an ID or name kept in the sorted prefix keys
+KEY_WIDTH = 32
+# Candidate documents checked per vectorized step
+CHUNK = 1024
+# Separates documents in a segment's byte array (blanked out of the text)
+_SEP = "\x01"
+_END = "\U0010ffff"
+
+
+def _normalize(text) -> str:
+    """Lowercase text with the separator character blanked out"""
+    return str(text).lower().replace(_SEP, " ")
+
+
+def _normalize_all(values) -> List[str]:
+    """_normalize() for a whole column, lowercasing it as one string"""
+    values = [str(value) for value in values]
+    if not values:
+        return []
+    joined = _SEP.join(values)
+    if joined.count(_SEP) != len(values) - 1:
+        return [_normalize(value) for value in values]
+    return joined.lower().split(_SEP)
+
+
+def _trigram_codes(data: bytes) -> np.ndarray:
+    """24-bit codes of the byte trigrams in data"""
+    b = np.frombuffer(data, dtype=np.uint8).astype(np.int64)
+    return b[:-2] << 16 | b[1:-1] << 8 | b[2:]
+
+
+class _Field:
+    """Prefix keys and trigram postings of one text field for a batch of documents"""
+
+    def __init__(self, docs: np.ndarray, texts: List[str]):
+        """Index texts[i] (normalized) as document docs[i]; docs ascending"""
+        keys = np.array(texts, dtype=f"U{KEY_WIDTH}")
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.key_docs = docs[order]
+
+        # One byte array for the whole batch; owner = documents separators passed
+        flat = np.frombuffer(_SEP.join(texts).encode("utf-8"), dtype=np.uint8)
+        sep = flat == ord(_SEP)
+        owner = np.cumsum(sep)
+        inside = ~(sep[:-2] | sep[1:-1] | sep[2:])
+        codes = _trigram_codes(flat.tobytes())[inside]
+
+        # Sort (gram, document) pairs once and drop repeats within a document
+        pairs = np.sort(codes << 32 | owner[:-2][inside])
+        pairs = pairs[np.diff(pairs, prepend=-1) != 0]
+        codes = pairs >> 32
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        self.codes = codes[starts]
+        self.offsets = np.append(starts, len(codes))
+        self.postings = docs[pairs & 0xFFFFFFFF]
+
+    def postings_for(self, code: int) -> np.ndarray:
+        """Ascending document numbers containing one trigram"""
+        i = np.searchsorted(self.codes, code)
+        if i == len(self.codes) or self.codes[i] != code:
+            return self.postings[:0]
+        return self.postings[self.offsets[i]:self.offsets[i + 1]]
+
+    def prefix_range(self, text: str):
+        """Slice of the sorted keys that start with text (cut to the key width)"""
+        key = text[:KEY_WIDTH]
+        return np.searchsorted(self.keys, key), np.searchsorted(self.keys, key + _END)
+
+
+class _Segment:
+    """Immutable index of a batch of documents"""
+
+    def __init__(self, docs: np.ndarray, id_keys: List[str], names: List[str]):
+        """Index both fields of the documents"""
+        self.docs = docs
+        self.size = len(docs)
+        self.fields = (_Field(docs, id_keys), _Field(docs, names))
+
+
+class SearchIndex:
+    """Incrementally maintained prefix/trigram index over product IDs and names"""
+
+    def __init__(self, product_ids=(), names=()):
+        """Index a catalog in one vectorized pass"""
+        self._load([str(pid) for pid in product_ids], _normalize_all(names))
+
+    def __len__(self) -> int:
+        return len(self._doc)
+
+    def _load(self, product_ids: List[str], names: List[str]):
+        """Start over with one segment holding the given products (names normalized)"""
+        self._ids: List[Optional[str]] = product_ids
+        self._id_keys: List[Optional[str]] = _normalize_all(product_ids)
+        self._names: List[Optional[str]] = names
+        self._doc: Dict[str, int] = dict(zip(product_ids, range(len(product_ids))))
+        self._alive = np.ones(len(product_ids), dtype=bool)
+        self._tail: List[int] = []
+        self._dead = 0
+        docs = np.arange(len(product_ids), dtype=np.int64)
+        self._segments = [_Segment(docs, self._id_keys, names)] if len(docs) else []
+
+    # ==================== UPDATES ====================
+    def add(self, product_id: str, name: str):
+        """Index a new product (or re-index one whose name changed)"""
+        product_id = str(product_id)
+        self.discard(product_id)
+        doc = len(self._ids)
+        self._ids.append(product_id)
+        self._id_keys.append(_normalize(product_id))
+        self._names.append(_normalize(name))
+        self._doc[product_id] = doc
+        if doc >= len(self._alive):
+            self._alive = np.concatenate((self._alive, np.zeros(max(len(self._alive), TAIL_LIMIT), dtype=bool)))
+        self._alive[doc] = True
+        self._tail.append(doc)
+        if len(self._tail) >= TAIL_LIMIT:
+            self._seal()
+
+    def discard(self, product_id: str):
+        """Drop a deleted product from results"""
+        doc = self._doc.pop(str(product_id), None)
+        if doc is None:
+            return
+        self._alive[doc] = False
+        self._ids[doc] = self._id_keys[doc] = self._names[doc] = None
+        self._dead += 1
+        if self._dead > len(self._doc) + TAIL_LIMIT:
+            # Mostly tombstones: renumber the live products into a fresh index
+            live = sorted(self._doc.values())
+            self._load([self._ids[d] for d in live], [self._names[d] for d in live])
+
+    def _seal(self):
+        """Index the tail as a new segment, merging segments of similar size"""
+        docs = np.array(self._tail, dtype=np.int64)
+        self._tail = []
+        while self._segments and 2 * len(docs) >= self._segments[-1].size:
+            docs = np.concatenate((self._segments.pop().docs, docs))
+        docs = docs[self._alive[docs]]
+        if len(docs):
+            live = docs.tolist()
+            self._segments.append(_Segment(docs, [self._id_keys[d] for d in live],
+                                           [self._names[d] for d in live]))
+
+    # ==================== QUERIES ====================
+    def search(self, query: str, limit: int = 20) -> List[str]:
+        """Product IDs matching query: exact ID, then ID/name prefix, then anywhere in either"""
+        text = _normalize(query).strip()
+        if not text or limit <= 0:
+            return []
+        found: Dict[int, None] = {}
+
+        exact = self._doc.get(str(query).strip())
+        if exact is not None:
+            found[exact] = None
+        self._prefix_matches(text, limit, found)
+        if len(found) < limit and len(text.encode("utf-8")) >= 3:
+            self._infix_matches(text, limit, found)
+        return [self._ids[doc] for doc in list(found)[:limit]]
+
+    def _contains(self, doc: int, text: str) -> bool:
+        """True if the document's ID or name contains text"""
+        return text in self._id_keys[doc] or text in self._names[doc]
+
+    def _starts(self, doc: int, text: str) -> bool:
+        """True if the document's ID or name starts with text"""
+        return self._id_keys[doc].startswith(text) or self._names[doc].startswith(text)
+
+    def _prefix_matches(self, text: str, limit: int, found: Dict[int, None]):
+        """Add documents whose ID or name starts with text"""
+        alive = self._alive
+        check = len(text) > KEY_WIDTH
+        for segment in self._segments:
+            for field in segment.fields:
+                lo, hi = field.prefix_range(text)
+                for start in range(lo, hi, CHUNK):
+                    docs = field.key_docs[start:min(start + CHUNK, hi)]
+                    for doc in docs[alive[docs]].tolist():
+                        if check and not self._starts(doc, text):
+                            continue
+                        found[doc] = None
+                        if len(found) >= limit:
+                            return
+        for doc in self._tail:
+            if alive[doc] and self._starts(doc, text):
+                found[doc] = None
+                if len(found) >= limit:
+                    return
+
+    def _infix_matches(self, text: str, limit: int, found: Dict[int, None]):
+        """Add documents containing text, intersecting trigram postings chunk by chunk"""
+        alive = self._alive
+        grams = np.unique(_trigram_codes(text.encode("utf-8"))).tolist()
+        for segment in self._segments:
+            for field in segment.fields:
+                lists = sorted((field.postings_for(code) for code in grams), key=len)
+                first, rest = lists[0], lists[1:]
+                for start in range(0, len(first), CHUNK):
+                    docs = first[start:start + CHUNK]
+                    docs = docs[alive[docs]]
+                    for other in rest:
+                        if not len(docs):
+                            break
+                        at = np.minimum(np.searchsorted(other, docs), len(other) - 1)
+                        docs = docs[other[at] == docs]
+                    # Sharing every trigram does not guarantee the whole string
+                    for doc in docs.tolist():
+                        if doc not in found and self._contains(doc, text):
+                            found[doc] = None
+                            if len(found) >= limit:
+                                return
+        for doc in self._tail:
+            if alive[doc] and doc not in found and self._contains(doc, text):
+                found[doc] = None
+                if len(found) >= limit:
+                    return
@@ -0,0 +1,56 @@
+"""
+Columnar Snapshot - Binary copy of the base CSV for fast startup
+The snapshot is a NumPy .npz archive with one typed array per column (names
+as categorical codes plus their distinct values) and the size and
+modification time of the CSV it was built from. It is only used while that
+CSV is unchanged; the CSV stays the interchange format.
+"""
+
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from core.schema import COLUMNS
+
+
+def _source_stamp(source_path: str) -> np.ndarray:
+    """Identify a CSV version by (mtime_ns, size)"""
+    st = os.stat(source_path)
+    return np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+
+def write_snapshot(df: pd.DataFrame, path: str, source_path: str):
+    """Write a snapshot of df describing the current contents of source_path"""
+    names = df["Product Name"].astype("category")
+    arrays = {
+        "product_id": df["Product ID"].to_numpy(dtype=str),
+        "name_codes": names.cat.codes.to_numpy(),
+        "name_categories": names.cat.categories.to_numpy(dtype=str),
+        "stock": df["Stock"].to_numpy(dtype=np.int32),
+        "daily_demand": df["Daily Demand"].to_numpy(dtype=np.int32),
+        "source": _source_stamp(source_path),
+    }
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str, source_path: str) -> Optional[pd.DataFrame]:
+    """Load the snapshot if it matches source_path, otherwise return None"""
+    if not os.path.exists(path) or not os.path.exists(source_path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if not np.array_equal(data["source"], _source_stamp(source_path)):
+                return None
+            names = pd.Categorical.from_codes(data["name_codes"], categories=data["name_categories"])
+            return pd.DataFrame({
+                "Product ID": pd.array(data["product_id"], dtype="string"),
+                "Product Name": names,
+                "Stock": data["stock"],
+                "Daily Demand": data["daily_demand"],
+            }, columns=COLUMNS)
+    except (OSError, KeyError, ValueError):
+        return None
@@ -0,0 +1,279 @@
+"""
+Storage Backends - Persistence engines behind InventoryAgent
+CsvStorage keeps the original CSV file (optionally with a change journal),
+SqliteStorage keeps one row per product in an SQLite database and
+MappedStorage (core/mmap_store.py) keeps memory-mapped column files.
+"""
+
+import json
+import os
+import sqlite3
+
+import pandas as pd
+
+from core.journal import ChangeJournal, apply_ops
+from core.locking import FileLock
+from core.schema import COLUMNS, apply_schema
+from core.mmap_store import MappedStorage
+from core.snapshot import read_snapshot, write_snapshot
+
+
+def open_storage(file_path: str, journal: bool = False, compact_every: int = 500):
+    """Pick a backend from the file extension (.db/.sqlite -> SQLite, .mmap -> mapped, else CSV)"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in (".db", ".sqlite", ".sqlite3"):
+        return SqliteStorage(file_path)
+    if ext == ".mmap":
+        return MappedStorage(file_path)
+    return CsvStorage(file_path, journal=journal, compact_every=compact_every)
+
+
+def iter_frame(df: pd.DataFrame, chunksize: int):
+    """Yield consecutive row slices of an in-memory frame"""
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+class CsvStorage:
+    """CSV file backend, full rewrites or journal + compaction, with a binary snapshot"""
+
+    def __init__(self, file_path: str, journal: bool = False, compact_every: int = 500,
+                 snapshot: bool = True):
+        self.file_path = file_path
+        self.compact_every = compact_every
+        self.journal = ChangeJournal(file_path + ".journal") if journal else None
+        self.snapshot_path = file_path + ".snapshot.npz" if snapshot else None
+        self.version_path = file_path + ".version"
+        self.file_lock = FileLock(file_path + ".lock")
+        self.version = 0
+        # Leave compaction to the owner (e.g. a background task) instead of doing it in record()
+        self.defer_compaction = False
+
+    # ==================== VERSIONING ====================
+    def lock(self) -> FileLock:
+        """Exclusive cross-process lock around read-modify-write sequences"""
+        return self.file_lock
+
+    def _read_version(self) -> dict:
+        """Data version on disk; base_version is the version of the last full CSV write"""
+        try:
+            with open(self.version_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"version": 0, "base_version": 0}
+
+    def _bump_version(self, base_changed: bool):
+        """Advance the on-disk version after this process persisted a change"""
+        meta = self._read_version()
+        self.version = meta["version"] + 1
+        meta["version"] = self.version
+        if base_changed:
+            meta["base_version"] = self.version
+        tmp_path = self.version_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.version_path)
+
+    def poll(self):
+        """Changes made by other processes since our version.
+
+        Returns (None, None) when up to date, ("ops", ops) when only journal
+        entries were added, or ("reload", None) when the base file changed.
+        """
+        meta = self._read_version()
+        if meta["version"] == self.version:
+            return None, None
+        if self.journal is None or meta["base_version"] > self.version:
+            return "reload", None
+        entries = self.journal.read()
+        self.journal.count = len(entries)
+        ops = [entry for entry in entries if entry.get("v", 0) > self.version]
+        self.version = meta["version"]
+        return "ops", ops
+
+    def load(self) -> pd.DataFrame:
+        """Load inventory from the snapshot or CSV (or create the file), then replay the journal"""
+        with self.file_lock:
+            self.version = self._read_version()["version"]
+            df = self._load_unlocked()
+            if self.journal is not None:
+                self.journal.count = len(self.journal.read())
+            return df
+
+    def _load_unlocked(self) -> pd.DataFrame:
+        """Read snapshot/CSV and journal; caller holds the lock"""
+        df = None
+        if self.snapshot_path is not None:
+            df = read_snapshot(self.snapshot_path, self.file_path)
+        if df is None:
+            if not os.path.exists(self.file_path):
+                df = pd.DataFrame(columns=COLUMNS)
+                df.to_csv(self.file_path, index=False)
+            else:
+                df = pd.read_csv(self.file_path, dtype={"Product ID": str})
+            df = apply_schema(df, self.file_path)
+            self._write_snapshot(df)
+        if self.journal is not None:
+            df = apply_ops(df, self.journal.read())
+        return df
+
+    def save(self, df: pd.DataFrame):
+        """Save inventory to CSV and truncate the journal"""
+        tmp_path = self.file_path + ".tmp"
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, self.file_path)
+        self._write_snapshot(df)
+        if self.journal is not None:
+            self.journal.clear()
+        self._bump_version(base_changed=True)
+
+    def _write_snapshot(self, df: pd.DataFrame):
+        """Refresh the binary snapshot after the base CSV changed"""
+        if self.snapshot_path is not None:
+            write_snapshot(df, self.snapshot_path, self.file_path)
+
+    def record(self, op: dict, df: pd.DataFrame, pos=None):
+        """Persist one mutation: journal it, or rewrite the CSV when journaling is off"""
+        if self.journal is None:
+            self.save(df)
+            return
+        self.journal.append(dict(op, v=self.version + 1))
+        self._bump_version(base_changed=False)
+        if self.compaction_due() and not self.defer_compaction:
+            self.save(df)
+
+    def record_batch(self, ops: list, df: pd.DataFrame):
+        """Persist many mutations with a single write"""
+        if self.journal is None:
+            self.save(df)
+            return
+        self.journal.append({"op": "batch", "ops": ops, "v": self.version + 1})
+        self._bump_version(base_changed=False)
+        if self.compaction_due() and not self.defer_compaction:
+            self.save(df)
+
+    def append_rows(self, rows: pd.DataFrame, df: pd.DataFrame):
+        """Persist newly imported products by appending them to the CSV"""
+        if not os.path.exists(self.file_path) or (self.journal is not None and self.journal.count):
+            # Pending journal entries must reach the base file before the append
+            self.save(df)
+            return
+        # The snapshot is now stale and gets rebuilt on the next load
+        rows[COLUMNS].to_csv(self.file_path, mode="a", header=False, index=False)
+        self._bump_version(base_changed=True)
+
+    def compact(self, df: pd.DataFrame):
+        """Fold pending journal entries into the base CSV"""
+        if self.journal is not None and self.journal.count:
+            self.save(df)
+
+    def compaction_due(self) -> bool:
+        """True once the journal is long enough to fold into the base CSV"""
+        return self.journal is not None and self.journal.count >= self.compact_every
+
+    def save_if_current(self, df: pd.DataFrame, version: int) -> bool:
+        """Save a copy of the data taken at `version`, from any thread.
+
+        Takes its own handle on the lock file, so it excludes this process's
+        writers as well as other processes. Returns False, saving nothing,
+        if anything was persisted since the copy was taken.
+        """
+        with FileLock(self.file_lock.path, self.file_lock.timeout):
+            if self._read_version()["version"] != version:
+                return False
+            self.save(df)
+            return True
+
+    def iter_chunks(self, df: pd.DataFrame, chunksize: int):
+        """Stream the catalog in row chunks"""
+        return iter_frame(df, chunksize)
+
+
+class SqliteStorage:
+    """SQLite backend (WAL mode, Product ID primary key), one statement per mutation"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS inventory ("
+            " product_id TEXT PRIMARY KEY,"
+            " name TEXT NOT NULL,"
+            " stock INTEGER NOT NULL,"
+            " demand INTEGER NOT NULL)"
+        )
+        self.conn.commit()
+        self.file_lock = FileLock(db_path + ".lock")
+        self.data_version = None
+
+    def lock(self) -> FileLock:
+        """Exclusive cross-process lock around read-modify-write sequences"""
+        return self.file_lock
+
+    def poll(self):
+        """("reload", None) when another connection committed since our last load"""
+        if self.conn.execute("PRAGMA data_version").fetchone()[0] != self.data_version:
+            return "reload", None
+        return None, None
+
+    def load(self) -> pd.DataFrame:
+        """Load all products in insertion order"""
+        self.data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        rows = self.conn.execute("SELECT product_id, name, stock, demand FROM inventory ORDER BY rowid").fetchall()
+        return apply_schema(pd.DataFrame(rows, columns=COLUMNS))
+
+    def save(self, df: pd.DataFrame):
+        """Replace the whole table with the given frame"""
+        rows = [
+            (str(pid), name, int(stock), int(demand))
+            for pid, name, stock, demand in df[COLUMNS].itertuples(index=False)
+        ]
+        with self.conn:
+            self.conn.execute("DELETE FROM inventory")
+            self.conn.executemany("INSERT INTO inventory VALUES (?, ?, ?, ?)", rows)
+
+    def record(self, op: dict, df: pd.DataFrame, pos=None):
+        """Persist one mutation as a single-row statement"""
+        with self.conn:
+            self._execute(op)
+
+    def record_batch(self, ops: list, df: pd.DataFrame):
+        """Persist many mutations in one SQL transaction"""
+        with self.conn:
+            for op in ops:
+                self._execute(op)
+
+    def append_rows(self, rows: pd.DataFrame, df: pd.DataFrame):
+        """Persist newly imported products with one bulk INSERT"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO inventory VALUES (?, ?, ?, ?)",
+                rows[COLUMNS].itertuples(index=False, name=None),
+            )
+
+    def _execute(self, op: dict):
+        """Translate one journal-style operation into SQL"""
+        kind = op["op"]
+        if kind == "add":
+            self.conn.execute(
+                "INSERT INTO inventory VALUES (?, ?, ?, ?)",
+                (str(op["id"]), op["name"], int(op["stock"]), int(op["demand"])),
+            )
+        elif kind == "set":
+            self.conn.execute("UPDATE inventory SET stock = ? WHERE product_id = ?", (int(op["stock"]), str(op["id"])))
+        elif kind == "delete":
+            self.conn.execute("DELETE FROM inventory WHERE product_id = ?", (str(op["id"]),))
+
+    def compact(self, df: pd.DataFrame):
+        """Checkpoint the WAL into the main database file"""
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def compaction_due(self) -> bool:
+        """Every statement is already in the database"""
+        return False
+
+    def iter_chunks(self, df: pd.DataFrame, chunksize: int):
+        """Stream the catalog in row chunks"""
+        return iter_frame(df, chunksize)
@@ -0,0 +1,77 @@
+"""
+Urgency Heap - Most urgent products without rescoring the catalog
+Entries are ordered by risk level, then priority score (both descending).
+A stock change pushes a fresh entry and leaves the old one in place; stale
+entries are recognized and dropped when they surface (lazy deletion), and
+the heap is rebuilt once they outnumber live ones. Each update carries the
+row's current forecast rate; owners rebuild the heap once built_on is no
+longer today, as the forecast window moves with the date.
+"""
+
+import heapq
+from datetime import date
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class UrgencyHeap:
+    """Priority queue over products keyed on (risk level, priority score)"""
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, str]] = []
+        self._live: Dict[str, Tuple[int, int]] = {}
+        self._rates: Dict[str, float] = {}
+        self.built_on = date.today().toordinal()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    # ==================== BUILD ====================
+    def reset(self, product_ids, score: np.ndarray, level: np.ndarray, rates: np.ndarray):
+        """Load scores and levels computed for the whole catalog in one vectorized pass, then heapify"""
+        ids = list(product_ids)
+        neg_level, neg_score = (-level).tolist(), (-score).tolist()
+        self._rates = dict(zip(ids, np.asarray(rates, dtype=np.float64).tolist()))
+        self._live = dict(zip(ids, zip(neg_level, neg_score)))
+        self._heap = list(zip(neg_level, neg_score, ids))
+        heapq.heapify(self._heap)
+        self.built_on = date.today().toordinal()
+
+    def _compact(self):
+        """Drop stale entries by rebuilding from the live keys"""
+        self._heap = [(key[0], key[1], pid) for pid, key in self._live.items()]
+        heapq.heapify(self._heap)
+
+    # ==================== UPDATES ====================
+    def update(self, product_id: str, score: int, level: int, rate: float):
+        """Re-key a product after an add or stock change, scored with its current rate (O(log n))"""
+        self._rates[product_id] = rate
+        key = (-int(level), -int(score))
+        if self._live.get(product_id) == key:
+            return
+        self._live[product_id] = key
+        heapq.heappush(self._heap, (key[0], key[1], product_id))
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._compact()
+
+    def discard(self, product_id: str):
+        """Forget a deleted product; its heap entries become stale"""
+        self._live.pop(product_id, None)
+        self._rates.pop(product_id, None)
+
+    # ==================== QUERY ====================
+    def rate(self, product_id: str, default: float) -> float:
+        """Demand rate the heap scores a product with"""
+        return self._rates.get(product_id, default)
+
+    def top(self, k: int) -> List[Tuple[str, int, int]]:
+        """The k most urgent products as (product_id, priority_score, risk_level)"""
+        found = []
+        while self._heap and len(found) < k:
+            entry = heapq.heappop(self._heap)
+            if self._live.get(entry[2]) == entry[:2] and (not found or found[-1] != entry):
+                found.append(entry)
+        for entry in found:
+            heapq.heappush(self._heap, entry)
+        return [(pid, -neg_score, -neg_level) for neg_level, neg_score, pid in found]
@@ -0,0 +1,171 @@
+"""
+Warehouse Network - Stock per (product, warehouse) with rollups
+Each warehouse is its own partition: a separate inventory file (and journal,
+history, lock) managed by its own InventoryAgent, opened only when needed.
+The default site keeps the original file, so a single-site install is just
+a network of one.
+
+    inventory.csv          main (default site)
+    inventory.north.csv    site "north"
+    inventory.sites.json   list of sites
+
+Per-site figures come from each agent's running totals; company-wide views
+are grouped vectorized aggregations over the sites asked for.
+"""
+
+import json
+import os
+import re
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.recommendations import compute_recommendations
+
+SITE_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class WarehouseNetwork:
+    """Lazily opened per-warehouse agents plus company-wide rollups"""
+
+    def __init__(self, agent_factory: Callable, file_path: str = "inventory.csv", default_site: str = "main",
+                 on_open: Optional[Callable] = None, **agent_kwargs):
+        self.agent_factory = agent_factory
+        self.file_path = file_path
+        self.default_site = default_site
+        self.on_open = on_open
+        self.agent_kwargs = agent_kwargs
+        self._root, self._ext = os.path.splitext(file_path)
+        self.registry_path = self._root + ".sites.json"
+        self.sites: List[str] = self._read_sites()
+        self._agents: Dict[str, object] = {}
+
+    # ==================== SITES ====================
+    def _read_sites(self) -> List[str]:
+        """Registered site names (default site first)"""
+        sites = [self.default_site]
+        if os.path.exists(self.registry_path):
+            with open(self.registry_path, encoding="utf-8") as f:
+                sites += [site for site in json.load(f).get("sites", []) if site not in sites]
+        return sites
+
+    def _write_sites(self):
+        """Persist the site list atomically"""
+        tmp_path = self.registry_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"sites": self.sites}, f)
+        os.replace(tmp_path, self.registry_path)
+
+    def site_path(self, site: str) -> str:
+        """Inventory file of a site"""
+        return self.file_path if site == self.default_site else f"{self._root}.{site}{self._ext}"
+
+    def add_site(self, site: str) -> bool:
+        """Register a warehouse, returns False if the name is taken"""
+        site = site.strip()
+        if not SITE_NAME.match(site):
+            raise ValueError("Warehouse names may only contain letters, digits, '-' and '_'")
+        self.sites = self._read_sites()
+        if site in self.sites:
+            return False
+        self.sites.append(site)
+        self._write_sites()
+        return True
+
+    def site(self, site: str):
+        """The agent of one warehouse, opened on first use"""
+        if site not in self.sites:
+            self.sites = self._read_sites()
+            if site not in self.sites:
+                raise KeyError(f"Unknown warehouse: {site}")
+        agent = self._agents.get(site)
+        if agent is None:
+            agent = self.agent_factory(file_path=self.site_path(site), **self.agent_kwargs)
+            self._agents[site] = agent
+            if self.on_open is not None:
+                self.on_open(site, agent)
+        return agent
+
+    def agents(self, sites: Optional[Iterable[str]] = None):
+        """(site, agent) pairs for the given sites (default: all), refreshed from disk"""
+        for site in (self.sites if sites is None else sites):
+            agent = self.site(site)
+            agent.refresh()
+            yield site, agent
+
+    def close(self):
+        """Compact every opened partition"""
+        for agent in self._agents.values():
+            agent.compact()
+
+    # ==================== ROLLUPS ====================
+    def site_totals(self, sites: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Products, total stock and low-stock count per warehouse (from running totals)"""
+        rows = []
+        for site, agent in self.agents(sites):
+            summary = agent.get_summary()
+            rows.append((site, summary["total_products"], summary["total_stock"], summary["low_stock"]))
+        return pd.DataFrame(rows, columns=["Warehouse", "Products", "Total Stock", "Low Stock"])
+
+    def company_summary(self, sites: Optional[Iterable[str]] = None) -> dict:
+        """Dashboard aggregates summed over warehouses (same shape as agent.get_summary())"""
+        total = {"total_products": 0, "total_stock": 0, "low_stock": 0, "histogram": []}
+        for _, agent in self.agents(sites):
+            summary = agent.get_summary()
+            for key in ("total_products", "total_stock", "low_stock"):
+                total[key] += summary[key]
+            if total["histogram"]:
+                total["histogram"] = [(label, count + other) for (label, count), (_, other)
+                                      in zip(total["histogram"], summary["histogram"])]
+            else:
+                total["histogram"] = list(summary["histogram"])
+        return total
+
+    def product_totals(self, sites: Optional[Iterable[str]] = None, with_forecast: bool = False) -> pd.DataFrame:
+        """Stock and demand per product summed over warehouses, with the number of sites stocking it.
+
+        with_forecast adds a Demand Rate column (forecast where history exists).
+        """
+        frames = []
+        for _, agent in self.agents(sites):
+            frame = agent.df[["Product ID", "Product Name", "Stock", "Daily Demand"]]
+            if with_forecast:
+                rates = agent.demand_forecast()
+                demand = agent.df["Daily Demand"].to_numpy(dtype=np.float64)
+                frame = frame.assign(**{"Demand Rate": np.where(np.isnan(rates), demand, rates)})
+            frames.append(frame.astype({"Product Name": str, "Stock": np.int64, "Daily Demand": np.int64}))
+        columns = ["Product ID", "Product Name", "Stock", "Daily Demand"] + (["Demand Rate"] if with_forecast else [])
+        if not frames:
+            return pd.DataFrame(columns=columns + ["Warehouses"])
+        combined = pd.concat(frames, ignore_index=True)
+        aggregations = {"Product Name": "first", "Stock": "sum", "Daily Demand": "sum"}
+        if with_forecast:
+            aggregations["Demand Rate"] = "sum"
+        grouped = combined.groupby("Product ID", sort=False)
+        totals = grouped.agg(aggregations)
+        totals["Warehouses"] = grouped.size()
+        return totals.reset_index()[columns + ["Warehouses"]]
+
+    def low_stock_by_site(self, sites: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Every product below its low limit at that warehouse, tagged with the warehouse"""
+        frames = []
+        for site, agent in self.agents(sites):
+            low = agent.df[agent.df["Stock"].to_numpy() < agent.low_limits()]
+            frames.append(low.assign(Warehouse=site).astype({"Product Name": str}))
+        if not frames:
+            return pd.DataFrame(columns=["Warehouse", "Product ID", "Product Name", "Stock", "Daily Demand"])
+        low = pd.concat(frames, ignore_index=True)
+        return low[["Warehouse", "Product ID", "Product Name", "Stock", "Daily Demand"]]
+
+    def recommendations(self, sites: Optional[Iterable[str]] = None, low_limit: Optional[int] = None) -> pd.DataFrame:
+        """Company-wide risk scoring on stock and forecast demand summed over warehouses.
+
+        Uses the default warehouse's thresholds and rules unless low_limit is given.
+        """
+        totals = self.product_totals(sites, with_forecast=True)
+        model = None
+        if low_limit is None:
+            model = self.site(self.default_site).risk_model
+            low_limit = model.low_limit
+        return compute_recommendations(totals, low_limit, totals["Demand Rate"].to_numpy(dtype=np.float64), model)
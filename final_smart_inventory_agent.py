@@ -3,42 +3,690 @@ Final Smart Inventory Management Agent
 A pure Python CLI-based inventory management system with AI decision-making
 """
 
+import numpy as np
 import pandas as pd
 import os
+import sys
 from datetime import datetime
-from typing import Optional, List
+from typing import Callable, Optional, List, Dict
+from contextlib import contextmanager
 import getpass
-
-# Try to import reportlab for PDF generation
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.pdfgen import canvas
-    HAS_REPORTLAB = True
-except ImportError:
-    HAS_REPORTLAB = False
+from core.aggregates import RunningTotals, stock_buckets
+from core.batch import Batch, resolve_ops
+from core.bulk_import import read_valid_chunks, print_progress
+from core.cache import RowCache, SortOrder, VersionedCache
+from core.events import EventBus, LogFileSink, StockEvent, WebhookSink
+from core.forecasting import demand_std, forecast_daily_demand
+from core.history import DemandHistory, sku_keys
+from core.journal import apply_ops
+from core.recommendations import SAFE, STATUSES, compute_recommendations
+from core.reports import HAS_REPORTLAB, write_csv, write_pdf_report
+from core.reorder import per_product, plan_reorders
+from core.rules import RiskModel
+from core.simulation import rank_stockout_risk, simulate_stockouts
+from core.schema import COLUMNS, ProductRecord, check_count, concat_rows
+from core.search import SearchIndex
+from core.storage import open_storage
+from core.urgency import UrgencyHeap
+from core.warehouses import WarehouseNetwork
+
+
+# Columns the inventory table can be sorted by
+SORT_COLUMNS = ("Product ID", "Product Name", "Stock", "Daily Demand", "Priority Score")
 
 
 class InventoryAgent:
     """AI-powered inventory management system"""
 
-    def __init__(self, file_path: str = "inventory.csv", low_limit: int = 10):
+    def __init__(self, file_path: str = "inventory.csv", low_limit: int = 10,
+                 journal: bool = False, compact_every: int = 500, storage=None):
         self.file_path = file_path
-        self.low_limit = low_limit
+        # Per-product / per-category limits and risk rules (inventory.csv.rules.json)
+        self.risk_model = RiskModel.load(file_path + ".rules.json", low_limit)
+        self.low_limit = self.risk_model.low_limit
+        self.storage = storage or open_storage(file_path, journal=journal, compact_every=compact_every)
+        self.history = DemandHistory(file_path + ".history")
         self.df = self._load_data()
+        self._index: Dict[str, int] = {}
+        self._urgency: Optional[UrgencyHeap] = None
+        # Product finder index, built on first search (or in the background, see search_snapshot())
+        self._search: Optional[SearchIndex] = None
+        # Adds/deletes since the snapshot of the one background build in flight (None: no build)
+        self._search_log: Optional[list] = None
+        self._search_stale = False
+        self._search_waiters: list = []
+        self.events = EventBus()
+        # Bumped by every mutation; derived results are cached against it
+        self.version = 0
+        self._cache = VersionedCache()
+        # History keys of the Product IDs, hashed once per row
+        self._keys = RowCache(lambda positions: sku_keys(self.df["Product ID"] if positions is None
+                                                         else self.df["Product ID"].iloc[positions]))
+        self._demand = RowCache(self._compute_demand)
+        self._scores = RowCache(self._compute_recommendations)
+        # Inventory table sort orders, patched per changed row like the row caches
+        self._orders = {col: SortOrder(lambda positions, col=col: self._sort_key(col, positions))
+                        for col in SORT_COLUMNS}
+        self.totals = RunningTotals(stock_buckets(self.low_limit))
+        self._rebuild()
         self.user = None
         self.logged_in = False
 
     def _load_data(self) -> pd.DataFrame:
-        """Load inventory from CSV or create empty file"""
-        if not os.path.exists(self.file_path):
-            df = pd.DataFrame(columns=["Product ID", "Product Name", "Stock", "Daily Demand"])
-            df.to_csv(self.file_path, index=False)
-            return df
-        return pd.read_csv(self.file_path)
+        """Load inventory from the storage backend"""
+        return self.storage.load()
 
     def _save_data(self):
-        """Save inventory to CSV"""
-        self.df.to_csv(self.file_path, index=False)
+        """Write the full inventory to the storage backend"""
+        self.storage.save(self.df)
+
+    def _record(self, op: dict, pos: Optional[int] = None):
+        """Persist one mutation through the storage backend (pos: affected row)"""
+        self.storage.record(op, self.df, pos)
+
+    def compact(self):
+        """Fold pending changes into the base file"""
+        with self._writing():
+            self.storage.compact(self.df)
+
+    def pending_compaction(self):
+        """(copy of the data, storage version) when the journal is due for compaction, else None.
+
+        With storage.defer_compaction set, the copy can be saved on a
+        background thread through save_snapshot().
+        """
+        if not self.storage.compaction_due():
+            return None
+        return self.snapshot(), self.storage.version
+
+    def save_snapshot(self, df: pd.DataFrame, version: int) -> bool:
+        """Save a pending_compaction() copy (safe off the main thread); False if the data moved on"""
+        return self.storage.save_if_current(df, version)
+
+    def get_summary(self) -> dict:
+        """Dashboard aggregates: total products, total stock, low stock count, stock histogram"""
+        return self.totals.summary()
+
+    def iter_chunks(self, chunksize: int = 262_144):
+        """Stream the catalog as row chunks (over mapped pages for .mmap storage)"""
+        return self.storage.iter_chunks(self.df, chunksize)
+
+    def demand_forecast(self, days: int = 730) -> np.ndarray:
+        """Forecast daily demand per row of self.df from recorded history (NaN = no history)"""
+        if days != 730:
+            return self._compute_demand(None, days)[:, 0]
+        return self._demand_stats()[:, 0]
+
+    def _demand_stats(self) -> np.ndarray:
+        """Cached (forecast rate, demand std) per row, refreshed daily and per changed row"""
+        return self._demand.get(len(self.df), stamp=datetime.now().toordinal())
+
+    def _compute_demand(self, positions: Optional[np.ndarray], days: int = 730) -> np.ndarray:
+        """Forecast rate and demand std for some rows (None: all) from the history (NaN without any)"""
+        stats = np.full((len(self.df) if positions is None else len(positions), 2), np.nan)
+        if not len(self.history):
+            return stats
+        keys = self._keys.get(len(self.df))
+        keys = keys if positions is None else keys[positions]
+        # Only SKUs with records get a row in the (SKUs x days) matrix
+        has = self.history.has_history(keys)
+        if has.any():
+            matrix = self.history.window(keys[has], days)
+            stats[has] = np.column_stack([forecast_daily_demand(matrix), demand_std(matrix)])
+        return stats
+
+    def recommendations(self) -> pd.DataFrame:
+        """Risk score, status, forecast and recommendation for every product.
+
+        Cached: rows are recomputed only after they change. Treat the result as read-only.
+        """
+        return self._scores.get(len(self.df), stamp=datetime.now().toordinal())
+
+    def _compute_recommendations(self, positions: Optional[np.ndarray]) -> pd.DataFrame:
+        """Recommendation rows for some positions (None: the whole catalog, chunk by chunk)"""
+        rates = self.demand_forecast()
+        model = self.risk_model
+        if positions is not None:
+            return compute_recommendations(self.df.iloc[positions], self.low_limit, rates[positions], model)
+        frames, start = [], 0
+        for chunk in self.iter_chunks():
+            frames.append(compute_recommendations(chunk, self.low_limit, rates[start:start + len(chunk)], model))
+            start += len(chunk)
+        if len(frames) == 1:
+            return frames[0]
+        if not frames:
+            return compute_recommendations(self.df, self.low_limit, rates, model)
+        return pd.concat(frames, ignore_index=True)
+
+    def risk_scores(self, positions: Optional[np.ndarray] = None, with_rates: bool = False):
+        """Priority score and risk level of every row (or some positions), as in recommendations()"""
+        df = self.df if positions is None else self.df.iloc[positions]
+        rates = self.demand_forecast()
+        if positions is not None:
+            rates = rates[positions]
+        rates = np.where(np.isnan(rates), df["Daily Demand"].to_numpy(dtype=np.float64), rates)
+        score, level = self.risk_model.classify_frame(df, rates)
+        return (score, level, rates) if with_rates else (score, level)
+
+    def low_limits(self) -> np.ndarray:
+        """Low-stock limit per row of self.df (per product, per category or the default)"""
+        return self.risk_model.limits(self.df["Product ID"], self.df["Product Name"])
+
+    def set_risk_model(self, model: RiskModel, save: bool = True):
+        """Switch to new thresholds/rules, re-classifying everything (and persist them)"""
+        if save:
+            model.save(self.file_path + ".rules.json")
+        self.risk_model = model
+        self.low_limit = model.low_limit
+        if self.totals.bucket_edges != stock_buckets(model.low_limit):
+            # Histogram edges follow the low-stock limit; _rebuild() refills them
+            self.totals = RunningTotals(stock_buckets(model.low_limit))
+        self._rebuild()
+
+    def reorder_plan(self, lead_time_days=None, order_cost=50.0, unit_cost=10.0,
+                     holding_rate: float = 0.25, service_level: float = 0.95) -> pd.DataFrame:
+        """Safety stock, reorder point, EOQ, days of cover and suggested order for every product.
+
+        lead_time_days, order_cost and unit_cost take a scalar or a
+        {Product ID: value} mapping for per-supplier figures. Lead times
+        default to those of the risk model.
+        """
+        def compute():
+            stats = self._demand_stats()
+            lead_times = self.risk_model.lead_times(self.df["Product ID"]) if lead_time_days is None else lead_time_days
+            return plan_reorders(self.df, stats[:, 0], stats[:, 1], lead_times, order_cost,
+                                 unit_cost, holding_rate, service_level)
+
+        params = (repr(lead_time_days), repr(order_cost), repr(unit_cost), holding_rate, service_level)
+        return self._cache.get(("reorder_plan",) + params, (self.version, datetime.now().toordinal()), compute)
+
+    def stockout_simulation(self, days: int = 7, trials: int = 10_000, extra_stock: Optional[Dict[str, int]] = None,
+                            workers: Optional[int] = None, seed: Optional[int] = None) -> pd.DataFrame:
+        """Monte Carlo stockout probability and expected shortfall over `days`, riskiest first.
+
+        extra_stock: what-if receipts as {Product ID: units}, e.g. a purchase plan's Order Qty.
+        """
+        stats = self._demand_stats()
+        rates = np.where(np.isnan(stats[:, 0]), self.df["Daily Demand"].to_numpy(dtype=np.float64), stats[:, 0])
+        stock = self.df["Stock"].to_numpy(dtype=np.int64)
+        if extra_stock:
+            stock = stock + per_product(extra_stock, self.df["Product ID"], 0).astype(np.int64)
+        prob, shortfall = simulate_stockouts(stock, rates, stats[:, 1], days, trials, workers, seed)
+        ids = self.df["Product ID"]
+        _, level = self.risk_model.classify(stock, rates, self.low_limits(), self.risk_model.lead_times(ids),
+                                            self.df["Daily Demand"].to_numpy(dtype=np.int64))
+        return rank_stockout_risk(self.df, rates, level, prob, shortfall, stock)
+
+    def most_urgent(self, k: int = 20) -> pd.DataFrame:
+        """The k products with the highest risk level and priority score, most urgent first"""
+        if self._urgency is None or self._urgency.built_on != datetime.now().toordinal():
+            score, level, rates = self.risk_scores(with_rates=True)
+            self._urgency = UrgencyHeap()
+            self._urgency.reset(self.df["Product ID"], score, level, rates)
+        top = self._urgency.top(k)
+        rows = self.df.iloc[[self._index[pid] for pid, _, _ in top]]
+        levels = np.array([level for _, _, level in top], dtype=np.int8)
+        return pd.DataFrame({
+            "Product ID": rows["Product ID"].array,
+            "Product Name": rows["Product Name"].array,
+            "Stock": rows["Stock"].to_numpy(),
+            "Priority Score": np.array([score for _, score, _ in top], dtype=np.int64),
+            "Risk Level": levels,
+            "Status": pd.Categorical.from_codes(levels, categories=STATUSES),
+        })
+
+    # ==================== TABLE VIEWS ====================
+    def table_view(self, sort: Optional[str] = None, descending: bool = False,
+                   low_stock_only: bool = False, status: Optional[str] = None) -> Optional[np.ndarray]:
+        """Positions of self.df in inventory table order (None: all rows in frame order).
+
+        sort: one of SORT_COLUMNS; status: one of core.recommendations.STATUSES.
+        Sort orders are kept across changes and patched per row; the filtered
+        view is cached per data version. Treat the result as read-only.
+        """
+        if sort is None and not low_stock_only and status is None:
+            return None
+
+        def compute():
+            stamp = datetime.now().toordinal()
+            if sort is None:
+                order = np.arange(len(self.df))
+            else:
+                order = self._orders[sort].get(len(self.df), stamp if sort == "Priority Score" else None)
+                if descending:
+                    order = order[::-1]
+            mask = self.table_mask(low_stock_only, status)
+            return order if mask is None else order[mask[order]]
+
+        # One cached view (the one on screen); the sort orders behind it are all kept
+        params = (sort, descending, low_stock_only, status)
+        return self._cache.get(("table_view",), (self.version, datetime.now().toordinal(), params), compute)
+
+    def table_mask(self, low_stock_only: bool = False, status: Optional[str] = None) -> Optional[np.ndarray]:
+        """Boolean mask over self.df rows for the table filters, cached per data version (None: no filter)"""
+        masks = []
+        if low_stock_only:
+            masks.append(self._cache.get(("low_stock_mask",), self.version,
+                                         lambda: self.df["Stock"].to_numpy() < self.low_limits()))
+        if status is not None:
+            level = STATUSES.index(status)
+            masks.append(self._cache.get(("status_mask", level), (self.version, datetime.now().toordinal()),
+                                         lambda: self.risk_scores()[1] == level))
+        if not masks:
+            return None
+        return masks[0] if len(masks) == 1 else masks[0] & masks[1]
+
+    def _sort_key(self, column: str, positions: Optional[np.ndarray]) -> np.ndarray:
+        """Sort key of some rows (None: all) for a table column; text sorts case-insensitively"""
+        if column == "Priority Score":
+            return np.asarray(self.risk_scores(positions)[0], dtype=np.int64)
+        values = self.df[column] if positions is None else self.df[column].iloc[positions]
+        if column in ("Product ID", "Product Name"):
+            return values.astype(str).str.lower().to_numpy(dtype=str)
+        return values.to_numpy(dtype=np.int64)
+
+    # ==================== SEARCH ====================
+    def search(self, query: str, limit: int = 20) -> pd.DataFrame:
+        """Products whose ID or name matches query, best matches first (see core.search)"""
+        if self._search is None:
+            self._search = SearchIndex(self.df["Product ID"], self.df["Product Name"])
+        positions = [self._index[pid] for pid in self._search.search(query, limit)]
+        return self.df.iloc[positions].reset_index(drop=True)
+
+    @property
+    def search_ready(self) -> bool:
+        """True once the search index exists"""
+        return self._search is not None
+
+    def search_snapshot(self, on_ready: Optional[Callable[[], None]] = None):
+        """IDs and names to build a SearchIndex from off the Tk thread; see adopt_search_index().
+
+        Only one build is in flight per agent: while one is pending this
+        returns None. Either way on_ready runs once the pending build was
+        adopted or given up, so every caller can share it.
+        """
+        if on_ready is not None:
+            self._search_waiters.append(on_ready)
+        if self._search_log is not None:
+            return None
+        self._search_log, self._search_stale = [], False
+        return self.df["Product ID"].tolist(), self.df["Product Name"].tolist()
+
+    def adopt_search_index(self, index: Optional[SearchIndex]) -> bool:
+        """Install the index built from search_snapshot(), replaying adds and deletes made since.
+
+        index is None when the build failed. Returns False if nothing was
+        installed (build failed, or the data was replaced meanwhile).
+        """
+        log, self._search_log = self._search_log, None
+        adopted = index is not None and log is not None and self._search is None and not self._search_stale
+        if adopted:
+            for product_id, name in log:
+                if name is None:
+                    index.discard(product_id)
+                else:
+                    index.add(product_id, name)
+            self._search = index
+        waiters, self._search_waiters = self._search_waiters, []
+        for on_ready in waiters:
+            on_ready()
+        return adopted
+
+    def _drop_search(self):
+        """Forget the search index after self.df was replaced (a pending build becomes stale)"""
+        self._search = None
+        self._search_stale = self._search_log is not None
+
+    def _search_changed(self, product_id: str, name: Optional[str] = None):
+        """Keep the search index in step with an add (name given) or a delete (name None)"""
+        if self._search is not None:
+            if name is None:
+                self._search.discard(product_id)
+            else:
+                self._search.add(product_id, name)
+        elif self._search_log is not None:
+            self._search_log.append((product_id, name))
+
+    # ==================== ID INDEX ====================
+    def _rebuild(self):
+        """Rebuild every derived structure after self.df was replaced"""
+        self._rebuild_index()
+        self.totals.reset(self.df["Stock"].to_numpy(), self.low_limits())
+        # Rescored lazily on the next most_urgent() / recommendations() call
+        self._urgency = None
+        self._drop_search()
+        self._keys.invalidate()
+        self._demand.invalidate()
+        self._scores.invalidate()
+        for order in self._orders.values():
+            order.invalidate()
+        self.version += 1
+
+    def _rebuild_index(self):
+        """Rebuild the Product ID -> row position index from self.df"""
+        self.df = self.df.reset_index(drop=True)
+        self._index = dict(zip(self.df["Product ID"].tolist(), range(len(self.df))))
+
+    def has_product(self, product_id: str) -> bool:
+        """Check whether a product ID exists"""
+        return str(product_id).strip() in self._index
+
+    def get_position(self, product_id: str) -> Optional[int]:
+        """Row position of a product in self.df, or None"""
+        return self._index.get(str(product_id).strip())
+
+    def get_product(self, product_id: str) -> Optional[ProductRecord]:
+        """Return a record for a product ID, or None"""
+        pos = self.get_position(product_id)
+        return None if pos is None else ProductRecord.from_frame(self.df, pos)
+
+    # ==================== SYNCHRONIZATION ====================
+    def refresh(self) -> bool:
+        """Pick up changes other processes persisted; returns True if anything changed"""
+        kind, ops = self.storage.poll()
+        if kind is None:
+            return False
+        if kind == "ops":
+            self._merge_ops([inner for op in ops for inner in (op["ops"] if op["op"] == "batch" else [op])])
+        else:
+            previous = pd.Series(self.df["Stock"].to_numpy(), index=self.df["Product ID"].to_numpy()) if self.events else None
+            self.df = self._load_data()
+            self._rebuild()
+            if previous is not None:
+                self._publish_crossings(self._changed_stock(previous))
+        return True
+
+    def _merge_ops(self, ops: List[dict]):
+        """Apply other processes' journal entries in place, like apply_ops() but through the index.
+
+        Stock changes and deletes touch their rows; products that are still
+        new after all entries are appended at the end in one concat.
+        """
+        added = {}
+        for op in ops:
+            pid = str(op["id"])
+            if op["op"] == "add":
+                if pid not in self._index and pid not in added:
+                    added[pid] = [str(op["name"]), int(op["stock"]), int(op["demand"])]
+            elif pid in added:
+                if op["op"] == "set":
+                    added[pid][1] = int(op["stock"])
+                else:
+                    del added[pid]
+            else:
+                pos = self._index.get(pid)
+                if pos is None:
+                    continue
+                if op["op"] == "set":
+                    self._write_stock(pos, int(op["stock"]))
+                else:
+                    self._remove_at(pos)
+        if added:
+            start = len(self.df)
+            self.df = concat_rows(self.df, pd.DataFrame(
+                [[pid, name, stock, demand] for pid, (name, stock, demand) in added.items()], columns=COLUMNS))
+            for pos, (pid, (name, stock, demand)) in enumerate(added.items(), start):
+                self._row_appended(pos, pid, name, stock, demand)
+
+    @contextmanager
+    def _writing(self):
+        """Hold the storage lock and start from the latest persisted data"""
+        with self.storage.lock():
+            self.refresh()
+            yield
+
+    # ==================== MUTATIONS ====================
+    def insert_product(self, product_id: str, name: str, stock: int, demand: int) -> bool:
+        """Add one product, returns False if the ID already exists.
+
+        Raises ValueError if stock or demand is not a whole number within the int32 range.
+        """
+        product_id = str(product_id).strip()
+        stock, demand = check_count(stock, "Stock"), check_count(demand, "Daily Demand")
+        with self._writing():
+            if self.has_product(product_id):
+                return False
+
+            pos = self._append_row(product_id, name, stock, demand)
+            self._record({"op": "add", "id": product_id, "name": name, "stock": stock, "demand": demand}, pos)
+        return True
+
+    def set_stock(self, product_id: str, new_stock: int) -> bool:
+        """Set stock for one product, returns False if the ID is unknown.
+
+        Raises ValueError if new_stock is not a whole number within the int32 range.
+        """
+        product_id = str(product_id).strip()
+        new_stock = check_count(new_stock, "Stock")
+        with self._writing():
+            pos = self._index.get(product_id)
+            if pos is None:
+                return False
+            consumed = int(self.df["Stock"].iat[pos]) - new_stock
+            old_rate = self._row_rate(pos) if self.events else None
+            if consumed > 0:
+                # Before the write, so the row is rescored with the updated forecast
+                self.history.record([product_id], [consumed])
+            self._write_stock(pos, new_stock, old_rate)
+            self._record({"op": "set", "id": product_id, "stock": new_stock}, pos)
+        return True
+
+    def apply_batch(self, ops: List[dict]) -> int:
+        """Validate and apply many add/set/adjust/delete operations with one save.
+
+        Raises core.batch.BatchError if any operation is invalid; in that case,
+        or if persisting fails, neither self.df nor the stored data change.
+        """
+        with self._writing():
+            resolved = resolve_ops(ops, self.df, self._index)
+            if not resolved:
+                return 0
+            consumption = self._consumption(resolved)
+            before = self._stock_before(resolved)
+            old_rates = self._rates_before(before)
+            new_df = apply_ops(self.df, resolved)
+            self.storage.record_batch(resolved, new_df)
+            self.df = new_df
+            self._rebuild()
+            if consumption:
+                self.history.record(consumption.keys(), consumption.values())
+            self._publish_crossings(before, old_rates)
+        return len(resolved)
+
+    def _consumption(self, resolved: List[dict]) -> Dict[str, int]:
+        """Units consumed per product by a resolved batch (stock decreases only)"""
+        current, consumed = {}, {}
+        for op in resolved:
+            pid = op["id"]
+            if op["op"] == "add":
+                current[pid] = op["stock"]
+            elif op["op"] == "set":
+                pos = self._index.get(pid)
+                old = current.get(pid, None if pos is None else int(self.df["Stock"].iat[pos]))
+                if old is not None and op["stock"] < old:
+                    consumed[pid] = consumed.get(pid, 0) + old - op["stock"]
+                current[pid] = op["stock"]
+        return consumed
+
+    @contextmanager
+    def transaction(self):
+        """Collect operations in a Batch and apply them together on exit"""
+        batch = Batch()
+        yield batch
+        self.apply_batch(batch.ops)
+
+    def import_csv(self, path: str, chunksize: int = 100_000, progress=print_progress) -> dict:
+        """Bulk-import new products from a CSV file, reading it in chunks.
+
+        Invalid rows and IDs that already exist (in the catalog or earlier in
+        the file) are skipped. Accepted rows are merged and persisted once.
+        Returns counts: read, imported, rejected, duplicates, seconds.
+        """
+        stats = {}
+        with self._writing():
+            chunks = list(read_valid_chunks(path, self._index.keys(), chunksize, progress, stats))
+            if progress is not None:
+                print()
+            if not chunks:
+                return stats
+
+            rows = pd.concat(chunks, ignore_index=True)
+            new_df = concat_rows(self.df, rows)
+            self.storage.append_rows(rows, new_df)
+            start = len(self.df)
+            self.df = new_df
+            self._index.update(zip(rows["Product ID"], range(start, len(new_df))))
+            self.totals.reset(self.df["Stock"].to_numpy(), self.low_limits())
+            self._urgency = None
+            self._drop_search()
+            # Row caches compute the appended rows on their next use
+            self.version += 1
+            self._publish_added(np.arange(start, len(new_df)))
+        return stats
+
+    def _append_row(self, product_id: str, name: str, stock: int, demand: int) -> int:
+        """Append one row in memory, returns its position"""
+        new_product = pd.DataFrame([{
+            "Product ID": product_id,
+            "Product Name": name,
+            "Stock": stock,
+            "Daily Demand": demand
+        }])
+        self.df = concat_rows(self.df, new_product)
+        pos = len(self.df) - 1
+        self._row_appended(pos, product_id, name, stock, demand)
+        return pos
+
+    def _row_appended(self, pos: int, product_id: str, name: str, stock: int, demand: int):
+        """Index a row just appended at pos and fold it into every derived structure"""
+        self._index[product_id] = pos
+        self.totals.add(stock, self.risk_model.limit_of(product_id, name))
+        self._row_changed(pos)
+        self._search_changed(product_id, name)
+        if self._urgency is not None:
+            rate = self._row_rate(pos)
+            score, level = self._classify_row(product_id, name, stock, demand, rate)
+            self._urgency.update(product_id, int(score), int(level), rate)
+        self._check_crossing(pos, None)
+
+    def _write_stock(self, pos: int, stock: int, old_rate: Optional[float] = None):
+        """Set the stock of one row in memory (old_rate: its rate before the write, if it moved)"""
+        col = self.df.columns.get_loc("Stock")
+        old = int(self.df.iat[pos, col])
+        record = ProductRecord.from_frame(self.df, pos)
+        self.totals.update(old, stock, self.risk_model.limit_of(record.product_id, record.name))
+        self.df.iat[pos, col] = stock
+        self._row_changed(pos)
+        if self._urgency is not None:
+            rate = self._row_rate(pos)
+            score, level = self._classify_row(record.product_id, record.name, stock, record.demand, rate)
+            self._urgency.update(record.product_id, int(score), int(level), rate)
+        self._check_crossing(pos, old, old_rate)
+
+    def _row_changed(self, pos: int):
+        """Bump the data version and mark one row's cached results stale"""
+        self._demand.mark(pos)
+        self._scores.mark(pos)
+        for order in self._orders.values():
+            order.mark(pos)
+        self.version += 1
+
+    def _remove_at(self, pos: int):
+        """Swap-remove a row: move the last row into the hole and drop the tail"""
+        last = len(self.df) - 1
+        removed = ProductRecord.from_frame(self.df, pos)
+        removed_id = self.df.iat[pos, self.df.columns.get_loc("Product ID")]
+        self.totals.remove(removed.stock, self.risk_model.limit_of(removed.product_id, removed.name))
+        if pos != last:
+            for col in range(len(self.df.columns)):
+                self.df.iat[pos, col] = self.df.iat[last, col]
+            self._index[self.df.iat[pos, self.df.columns.get_loc("Product ID")]] = pos
+        self.df = self.df.iloc[:last]
+        del self._index[removed_id]
+        self._keys.remove_at(pos, last)
+        self._demand.remove_at(pos, last)
+        self._scores.remove_at(pos, last)
+        for order in self._orders.values():
+            order.remove_at(pos, last)
+        self.version += 1
+        self._search_changed(removed_id)
+        if self._urgency is not None:
+            self._urgency.discard(removed_id)
+
+    # ==================== EVENTS ====================
+    def attach_alert_sinks(self, log_path: str = "inventory_alerts.log", webhook_url: Optional[str] = None):
+        """Subscribe the standard alert sinks: a log file and, if configured, a webhook"""
+        self.events.subscribe(LogFileSink(log_path))
+        webhook_url = webhook_url or os.environ.get("INVENTORY_WEBHOOK_URL")
+        if webhook_url:
+            self.events.subscribe(WebhookSink(webhook_url))
+
+    def _check_crossing(self, pos: int, old_stock: Optional[int], old_rate: Optional[float] = None):
+        """Publish a StockEvent if a write moved row pos across a risk boundary (old_stock None: new row)"""
+        if not self.events:
+            return
+        record = ProductRecord.from_frame(self.df, pos)
+        rate = self._row_rate(pos)
+        old_rate = rate if old_rate is None else old_rate
+        new_level = int(self._classify_row(record.product_id, record.name, record.stock, record.demand, rate)[1])
+        old_level = None if old_stock is None else int(
+            self._classify_row(record.product_id, record.name, old_stock, record.demand, old_rate)[1])
+        if new_level != (SAFE if old_level is None else old_level):
+            self.events.publish(StockEvent(record.product_id, record.name, old_stock, record.stock,
+                                           old_level, new_level))
+
+    def _row_rate(self, pos: int) -> float:
+        """Demand rate of one row as recommendations() uses it: the cached forecast, else typed demand"""
+        rate = float(self._demand_stats()[pos, 0])
+        return float(self.df["Daily Demand"].iat[pos]) if np.isnan(rate) else rate
+
+    def _classify_row(self, product_id: str, name: str, stock: int, demand: int, rate: float):
+        """Priority score and risk level of one product under the risk model (O(1) in catalog size)"""
+        model = self.risk_model
+        return model.classify(stock, rate, model.limit_of(product_id, name),
+                              model.sku_lead_times.get(product_id, model.lead_time), demand)
+
+    def _stock_before(self, ops: List[dict]) -> Dict[str, Optional[int]]:
+        """Current stock of the products a bulk change adds or sets, if anyone is listening"""
+        if not self.events:
+            return {}
+        stock = self.df["Stock"]
+        before = {}
+        for op in ops:
+            if op["op"] != "delete" and op["id"] not in before:
+                pos = self._index.get(str(op["id"]))
+                before[str(op["id"])] = None if pos is None else int(stock.iat[pos])
+        return before
+
+    def _changed_stock(self, previous: pd.Series) -> Dict[str, Optional[int]]:
+        """Previous stock (None if new) of products whose stock differs after a full reload"""
+        old = previous.reindex(self.df["Product ID"].to_numpy()).to_numpy(dtype=np.float64)
+        changed = np.flatnonzero(old != self.df["Stock"].to_numpy())
+        ids = self.df["Product ID"].to_numpy()[changed]
+        return {str(pid): None if np.isnan(value) else int(value) for pid, value in zip(ids, old[changed])}
+
+    def _rates_before(self, before: Dict[str, Optional[int]]) -> Optional[Dict[str, float]]:
+        """Current demand rate of the existing products in before (None without subscribers)"""
+        if not self.events:
+            return None
+        return {pid: self._row_rate(self._index[pid]) for pid, old in before.items() if old is not None}
+
+    def _publish_added(self, positions: np.ndarray):
+        """Publish a StockEvent for each appended row that starts out at risk (vectorized _check_crossing)"""
+        if not self.events or not len(positions):
+            return
+        level = self.risk_scores(positions)[1]
+        at_risk = level != SAFE
+        for pos, new_level in zip(positions[at_risk].tolist(), level[at_risk].tolist()):
+            record = ProductRecord.from_frame(self.df, pos)
+            self.events.publish(StockEvent(record.product_id, record.name, None, record.stock, None, int(new_level)))
+
+    def _publish_crossings(self, before: Dict[str, Optional[int]], old_rates: Optional[Dict[str, float]] = None):
+        """Check each product touched by a bulk change against its stock (and rate) before the change"""
+        for product_id, old in before.items():
+            pos = self._index.get(product_id)
+            if pos is not None:
+                self._check_crossing(pos, old, None if old_rates is None else old_rates.get(product_id))
 
     def clear_screen(self):
         """Clear console screen"""
@@ -87,13 +735,22 @@ class InventoryAgent:
             print("\nNo products in inventory. Add a product to get started!")
             return
 
-        total_products = len(self.df)
-        total_stock = int(self.df["Stock"].sum())
-        low_stock_items = int((self.df["Stock"] < self.low_limit).sum())
+        summary = self.get_summary()
 
-        print(f"\n📦 Total Products: {total_products}")
-        print(f"📚 Total Stock: {total_stock} units")
-        print(f"⚠️  Low Stock Items: {low_stock_items}")
+        print(f"\n📦 Total Products: {summary['total_products']}")
+        print(f"📚 Total Stock: {summary['total_stock']} units")
+        print(f"⚠️  Low Stock Items: {summary['low_stock']}")
+        print("📈 Stock Levels: " + " | ".join(f"{label}: {count}" for label, count in summary["histogram"]))
+
+        self.print_divider()
+        print("\n🚨 TOP 5 AT RISK:")
+        urgent = self.most_urgent(5)
+        urgent = urgent[urgent["Risk Level"] != SAFE]
+        if urgent.empty:
+            print("   No products at risk.")
+        for name, stock, score, status in zip(urgent["Product Name"], urgent["Stock"],
+                                              urgent["Priority Score"], urgent["Status"]):
+            print(f"   {status}  {name} (stock {stock}, priority score {score})")
 
         self.print_divider()
         print("\n📋 INVENTORY TABLE:")
@@ -115,26 +772,17 @@ class InventoryAgent:
             return
 
         try:
-            stock = int(input("Initial Stock: "))
-            demand = int(input("Daily Demand: "))
-        except ValueError:
-            print("❌ Stock and Demand must be numbers.")
+            stock = check_count(input("Initial Stock: "), "Stock")
+            demand = check_count(input("Daily Demand: "), "Daily Demand")
+        except ValueError as e:
+            print(f"❌ {e}.")
             return
 
         # Check for duplicate ID
-        if not self.df.empty and product_id in self.df["Product ID"].values:
+        if not self.insert_product(product_id, product_name, stock, demand):
             print(f"❌ Product ID '{product_id}' already exists!")
             return
 
-        new_product = pd.DataFrame([{
-            "Product ID": product_id,
-            "Product Name": product_name,
-            "Stock": stock,
-            "Daily Demand": demand
-        }])
-
-        self.df = pd.concat([self.df, new_product], ignore_index=True)
-        self._save_data()
         print(f"\n✅ Product '{product_name}' added successfully!")
 
     # ==================== DELETE PRODUCT ====================
@@ -142,16 +790,16 @@ class InventoryAgent:
         """Delete product by ID"""
         try:
             product_id = str(product_id).strip()
-            if self.df.empty:
-                return False
-            
-            # Check if product exists
-            if product_id not in self.df["Product ID"].values:
-                return False
-            
-            # Delete the product
-            self.df = self.df[self.df["Product ID"] != product_id].reset_index(drop=True)
-            self._save_data()
+
+            with self._writing():
+                # Check if product exists
+                pos = self._index.get(product_id)
+                if pos is None:
+                    return False
+
+                # Delete the product
+                self._remove_at(pos)
+                self._record({"op": "delete", "id": product_id}, pos)
             return True
         except Exception as e:
             print(f"Error deleting product: {e}")
@@ -166,23 +814,27 @@ class InventoryAgent:
             print("\n❌ No products in inventory. Please add a product first.")
             return
 
-        print("\nAvailable Products:")
-        for idx, (_, row) in enumerate(self.df.iterrows(), 1):
-            print(f"  {idx}. {row['Product Name']} (ID: {row['Product ID']}) - Current Stock: {row['Stock']}")
+        matches = self.search(input("\nSearch product (ID or name): "))
+        if matches.empty:
+            print("❌ No matching products.")
+            return
+
+        rows = zip(matches["Product Name"], matches["Product ID"], matches["Stock"])
+        for idx, (name, pid, stock) in enumerate(rows, 1):
+            print(f"  {idx}. {name} (ID: {pid}) - Current Stock: {stock}")
 
         try:
             choice = int(input("\nSelect product number: ")) - 1
-            if choice < 0 or choice >= len(self.df):
+            if choice < 0 or choice >= len(matches):
                 print("❌ Invalid selection.")
                 return
 
-            row = self.df.iloc[choice]
+            row = matches.iloc[choice]
             print(f"\n📦 Updating '{row['Product Name']}'")
             print(f"   Current Stock: {row['Stock']}")
 
-            new_stock = int(input("New Stock: "))
-            self.df.at[choice, "Stock"] = new_stock
-            self._save_data()
+            new_stock = check_count(input("New Stock: "), "Stock")
+            self.set_stock(row["Product ID"], new_stock)
             print(f"\n✅ Stock updated successfully!")
 
         except ValueError:
@@ -198,25 +850,10 @@ class InventoryAgent:
             return
 
         print("\n" + "=" * 60)
-        for idx, (_, row) in enumerate(self.df.iterrows(), 1):
-            product_name = row["Product Name"]
-            stock = row["Stock"]
-            demand = row["Daily Demand"]
-            week_forecast = demand * 7
-
-            # AI Decision Logic
-            priority_score = (demand * 2) - stock
-
-            if stock < self.low_limit:
-                status = "🔴 HIGH RISK"
-                recommendation = "URGENT: Reorder immediately!"
-            elif priority_score > 0:
-                status = "🟡 MEDIUM RISK"
-                recommendation = "Monitor stock closely. Plan to reorder soon."
-            else:
-                status = "🟢 SAFE"
-                recommendation = "Stock levels are healthy. Continue monitoring."
-
+        result = self.recommendations()
+        rows = zip(result["Product Name"], result["Stock"], result["Daily Demand"], result["Forecast"],
+                   result["Priority Score"], result["Status"], result["Recommendation"])
+        for idx, (product_name, stock, demand, week_forecast, priority_score, status, recommendation) in enumerate(rows, 1):
             print(f"\n{idx}. {product_name}")
             self.print_divider()
             print(f"   Current Stock: {stock} units")
@@ -227,6 +864,21 @@ class InventoryAgent:
             print(f"   Recommendation: {recommendation}")
 
         print("\n" + "=" * 60)
+        self.show_purchase_suggestions()
+
+    def show_purchase_suggestions(self):
+        """Print products at or below their reorder point with the quantity to order"""
+        plan = self.reorder_plan()
+        due = plan[plan["Order Qty"] > 0]
+        print("\n🛒 PURCHASE SUGGESTIONS")
+        self.print_divider()
+        if due.empty:
+            print("   Nothing to order. All products are above their reorder point.")
+            return
+        rows = zip(due["Product Name"], due["Stock"], due["Reorder Point"], due["Days of Cover"], due["Order Qty"])
+        for product_name, stock, reorder_point, cover, order_qty in rows:
+            print(f"   {product_name}: order {order_qty} units "
+                  f"(stock {stock}, reorder point {reorder_point}, {cover} days of cover)")
 
     # ==================== PDF REPORT ====================
     def generate_pdf_report(self):
@@ -243,49 +895,38 @@ class InventoryAgent:
             return
 
         try:
-            filename = f"inventory_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            pdf = canvas.Canvas(filename, pagesize=A4)
-
-            # Header
-            pdf.setFont("Helvetica-Bold", 16)
-            pdf.drawString(50, 800, "INVENTORY MANAGEMENT REPORT")
-            pdf.setFont("Helvetica", 10)
-            pdf.drawString(50, 780, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-            # Content
-            y = 750
-            pdf.setFont("Helvetica-Bold", 11)
-
-            for _, row in self.df.iterrows():
-                pdf.drawString(50, y, f"Product: {row['Product Name']} (ID: {row['Product ID']})")
-                y -= 15
-                pdf.setFont("Helvetica", 10)
-                pdf.drawString(60, y, f"Stock: {row['Stock']} | Daily Demand: {row['Daily Demand']}")
-                y -= 15
-                y -= 5
-
-                if y < 50:
-                    pdf.showPage()
-                    y = 800
-
-            pdf.save()
+            filename = write_pdf_report(self.report_filename("inventory_report", "pdf"), self.df, self.reorder_plan())
             print(f"\n✅ Report generated: {filename}")
 
         except Exception as e:
             print(f"\n❌ Error generating PDF: {e}")
 
     # ==================== EXPORT DATA ====================
-    def export_data(self):
-        """Export inventory to CSV"""
+    def export_data(self, data: Optional[pd.DataFrame] = None, prefix: str = "inventory_export") -> Optional[str]:
+        """Export inventory (or another table such as the reorder plan) to CSV"""
         self.print_header("💾 EXPORT DATA")
 
         if self.df.empty:
             print("\n❌ No data to export.")
-            return
+            return None
 
-        filename = f"inventory_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        self.df.to_csv(filename, index=False)
+        data = self.df if data is None else data
+        filename = write_csv(self.report_filename(prefix, "csv"), data)
         print(f"\n✅ Data exported to: {filename}")
+        return filename
+
+    def export_reorder_plan(self) -> Optional[str]:
+        """Export the purchase-suggestion table to CSV"""
+        return self.export_data(self.reorder_plan(), prefix="purchase_plan")
+
+    @staticmethod
+    def report_filename(prefix: str, extension: str) -> str:
+        """Timestamped output file name, e.g. inventory_export_20250101_120000.csv"""
+        return f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+    def snapshot(self) -> pd.DataFrame:
+        """Copy of the inventory that later mutations cannot touch (for background work)"""
+        return self.df.copy()
 
     # ==================== MAIN MENU ====================
     def show_menu(self):
@@ -316,9 +957,14 @@ class InventoryAgent:
             print("\n❌ Authentication failed. Exiting...")
             return
 
+        # Low-stock alerts
+        self.attach_alert_sinks()
+        self.events.subscribe(lambda event: print(f"\n🔔 {event}"))
+
         # Main loop
         while True:
             self.clear_screen()
+            self.refresh()
             self.show_menu()
 
             choice = input("\nEnter your choice (1-8): ").strip()
@@ -334,15 +980,18 @@ class InventoryAgent:
             elif choice == "5":
                 self.generate_pdf_report()
             elif choice == "6":
-                self.export_data()
+                if self.export_data() and input("Also export purchase plan? (y/n): ").strip().lower() == "y":
+                    self.export_reorder_plan()
             elif choice == "7":
                 print("\n👋 Logging out...")
+                self.compact()
                 self.logged_in = False
                 if self.login():
                     continue
                 else:
                     break
             elif choice == "8":
+                self.compact()
                 print("\n✅ Thank you for using Smart Inventory Agent. Goodbye!")
                 break
             else:
@@ -353,5 +1002,10 @@ class InventoryAgent:
 
 # ==================== MAIN ====================
 if __name__ == "__main__":
-    agent = InventoryAgent(file_path="inventory.csv", low_limit=10)
+    # Optional warehouse name: python final_smart_inventory_agent.py north
+    network = WarehouseNetwork(InventoryAgent, "inventory.csv", low_limit=10, journal=True)
+    site = sys.argv[1] if len(sys.argv) > 1 else network.default_site
+    if site not in network.sites:
+        network.add_site(site)
+    agent = network.site(site)
     agent.run()
@@ -5,105 +5,227 @@ Dashboard Page - Overview with metrics and table
 import tkinter as tk
 from tkinter import ttk, messagebox
 from config.styles import *
-from ui.widgets import create_page_header, create_metric_card
+from core.recommendations import SAFE, STATUSES
+from ui.page import Page
+from ui.search_box import SearchBox
+from ui.widgets import create_metric_card, fill_tree
+from ui.virtual_table import VirtualTable
 
+TOP_AT_RISK = 10
 
-def show_dashboard(content_frame, agent, fonts):
-    """Display dashboard page"""
-    # Clear content
-    for widget in content_frame.winfo_children():
-        widget.destroy()
+# Inventory table heading -> column it shows and sorts by (agent SORT_COLUMNS)
+INVENTORY_COLUMNS = {"ID": "Product ID", "Name": "Product Name", "Stock": "Stock", "Demand": "Daily Demand",
+                     "Score": "Priority Score"}
+ALL_STATUSES = "All statuses"
 
-    # Page header
-    create_page_header(content_frame, "Dashboard Overview", fonts)
 
-    # Content
-    content = tk.Frame(content_frame, bg=BG)
-    content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+class DashboardPage(Page):
+    """Dashboard page"""
 
-    if agent.df.empty:
-        tk.Label(
-            content, 
-            text="No products yet. Add a product to get started!", 
-            font=fonts['header'], 
-            bg=BG, 
+    title = "Dashboard Overview"
+    empty_text = "No products yet. Add a product to get started!"
+
+    def build(self, body):
+        """Create metrics, the Top N at Risk table and the inventory table"""
+        fonts = self.fonts
+
+        # Metrics row
+        metrics = tk.Frame(body, bg=BG)
+        metrics.pack(fill=tk.X, pady=(0, 10))
+
+        self.total_products = create_metric_card(metrics, "Total Products", 0, SECONDARY, fonts)
+        self.total_stock = create_metric_card(metrics, "Total Stock", 0, SUCCESS, fonts)
+        self.low_stock = create_metric_card(metrics, "Low Stock Items", 0, DANGER, fonts)
+
+        self.histogram = tk.Label(
+            body,
+            font=fonts['small'],
+            bg=BG,
             fg=TEXT_LIGHT
-        ).pack(pady=20)
-        return
-
-    # Metrics row
-    metrics = tk.Frame(content, bg=BG)
-    metrics.pack(fill=tk.X, pady=(0, 30))
-
-    total = len(agent.df)
-    stock = int(agent.df["Stock"].sum())
-    low = int((agent.df["Stock"] < agent.low_limit).sum())
-
-    create_metric_card(metrics, "Total Products", total, SECONDARY, fonts)
-    create_metric_card(metrics, "Total Stock", stock, SUCCESS, fonts)
-    create_metric_card(metrics, "Low Stock Items", low, DANGER, fonts)
-
-    # Table and buttons section
-    table_section = tk.Frame(content, bg=BG)
-    table_section.pack(fill=tk.BOTH, expand=True)
-
-    tk.Label(
-        table_section, 
-        text="Inventory Table", 
-        font=fonts['header'], 
-        bg=BG, 
-        fg=TEXT
-    ).pack(anchor=tk.W, pady=(0, 10))
-
-    # Table frame (takes available space)
-    table_frame = tk.Frame(table_section, bg=CARD_BG, relief=tk.FLAT, bd=1)
-    table_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
-
-    tree = ttk.Treeview(table_frame, columns=("ID", "Name", "Stock", "Demand"), height=10, show="headings")
-    for col in ("ID", "Name", "Stock", "Demand"):
-        tree.heading(col, text=col)
-        tree.column(col, width=200)
-
-    for _, row in agent.df.iterrows():
-        tree.insert("", tk.END, values=(row["Product ID"], row["Product Name"], row["Stock"], row["Daily Demand"]))
-
-    tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-    # Button section below table
-    button_frame = tk.Frame(table_section, bg=BG)
-    button_frame.pack(fill=tk.X, pady=(10, 0))
-
-    def delete_selected():
-        selected = tree.selection()
-        if not selected:
+        )
+        self.histogram.pack(anchor=tk.W, pady=(0, 20))
+
+        # Top N at risk
+        tk.Label(
+            body,
+            text=f"Top {TOP_AT_RISK} at Risk",
+            font=fonts['header'],
+            bg=BG,
+            fg=TEXT
+        ).pack(anchor=tk.W, pady=(0, 10))
+
+        risk_frame = tk.Frame(body, bg=CARD_BG, relief=tk.FLAT, bd=1)
+        risk_frame.pack(fill=tk.X, pady=(0, 20))
+
+        self.risk_tree = ttk.Treeview(risk_frame, columns=("ID", "Name", "Stock", "Score", "Status"),
+                                      height=TOP_AT_RISK, show="headings")
+        for col in ("ID", "Name", "Stock", "Score", "Status"):
+            self.risk_tree.heading(col, text=col)
+            self.risk_tree.column(col, width=160)
+
+        self.risk_tree.pack(fill=tk.X, padx=5, pady=5)
+
+        # Table and buttons section
+        table_section = tk.Frame(body, bg=BG)
+        table_section.pack(fill=tk.BOTH, expand=True)
+
+        tk.Label(
+            table_section,
+            text="Inventory Table",
+            font=fonts['header'],
+            bg=BG,
+            fg=TEXT
+        ).pack(anchor=tk.W, pady=(0, 10))
+
+        # Jump to a product by ID or name
+        self.search = SearchBox(table_section, self.agent, fonts, self.show_product, tasks=self.tasks, bg=BG)
+        self.search.frame.pack(fill=tk.X, pady=(0, 10))
+
+        # Filters
+        filters = tk.Frame(table_section, bg=BG)
+        filters.pack(fill=tk.X, pady=(0, 10))
+
+        self.low_only = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            filters,
+            text="Low stock only",
+            variable=self.low_only,
+            command=self.apply_view,
+            font=fonts['normal'],
+            bg=BG,
+            fg=TEXT,
+            activebackground=BG,
+            cursor="hand2"
+        ).pack(side=tk.LEFT)
+
+        tk.Label(filters, text="Status:", font=fonts['normal'], bg=BG, fg=TEXT).pack(side=tk.LEFT, padx=(20, 8))
+        self.status_var = tk.StringVar(value=ALL_STATUSES)
+        status = ttk.Combobox(filters, textvariable=self.status_var, values=[ALL_STATUSES] + STATUSES,
+                              state="readonly", width=18)
+        status.bind("<<ComboboxSelected>>", lambda e: self.apply_view())
+        status.pack(side=tk.LEFT)
+
+        self.shown = tk.Label(filters, font=fonts['small'], bg=BG, fg=TEXT_LIGHT)
+        self.shown.pack(side=tk.RIGHT)
+
+        # Table frame (takes available space)
+        table_frame = tk.Frame(table_section, bg=CARD_BG, relief=tk.FLAT, bd=1)
+        table_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+
+        # Only the visible rows are materialized, read from agent.df through the
+        # agent's cached sort order / filter view; clicking a heading sorts
+        self.sort = None
+        self.descending = False
+        self.table = VirtualTable(table_frame, lambda: self.agent.df, dict(INVENTORY_COLUMNS, Score=self._scores),
+                                  width=160, view=self._view, on_heading=self.sort_by)
+
+        # Button section below table
+        button_frame = tk.Frame(table_section, bg=BG)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+
+        delete_btn = tk.Button(
+            button_frame,
+            text="🗑️  Delete Selected",
+            command=self.delete_selected,
+            bg=DANGER,
+            fg="white",
+            font=fonts['normal'],
+            padx=20,
+            pady=10,
+            relief=tk.FLAT,
+            cursor="hand2",
+            activebackground="#dc2626"
+        )
+        delete_btn.pack(side=tk.LEFT, padx=5, pady=5)
+
+    def update(self):
+        """Refresh metrics, the Top N at Risk rows and the visible table rows"""
+        summary = self.agent.get_summary()
+        self.total_products.config(text=str(summary["total_products"]))
+        self.total_stock.config(text=str(summary["total_stock"]))
+        self.low_stock.config(text=str(summary["low_stock"]))
+        self.histogram.config(
+            text="Stock Levels:  " + "   |   ".join(f"{label}: {count}" for label, count in summary["histogram"])
+        )
+
+        urgent = self.agent.most_urgent(TOP_AT_RISK)
+        urgent = urgent[urgent["Risk Level"] != SAFE]
+        fill_tree(self.risk_tree, zip(urgent["Product ID"], urgent["Product Name"], urgent["Stock"],
+                                      urgent["Priority Score"], urgent["Status"]))
+        self.risk_tree.config(height=max(min(len(urgent), TOP_AT_RISK), 1))
+
+        self.table.refresh()
+        self._show_count()
+        self.search.refresh()
+
+    # ==================== SORTING AND FILTERS ====================
+    def _scores(self, positions):
+        """Priority scores of some rows (the Score column is not in agent.df)"""
+        return self.agent.risk_scores(positions)[0].tolist()
+
+    def _status(self):
+        """Selected status filter, or None"""
+        status = self.status_var.get()
+        return None if status == ALL_STATUSES else status
+
+    def _view(self):
+        """Row positions in table order for the current sort and filters (None: all, unsorted)"""
+        return self.agent.table_view(self.sort, self.descending, self.low_only.get(), self._status())
+
+    def sort_by(self, heading):
+        """Heading click: sort ascending, click again for descending, a third time for the original order"""
+        column = INVENTORY_COLUMNS[heading]
+        if column != self.sort:
+            self.sort, self.descending = column, False
+        elif not self.descending:
+            self.descending = True
+        else:
+            self.sort = None
+        for name, col in INVENTORY_COLUMNS.items():
+            arrow = (" ▼" if self.descending else " ▲") if col == self.sort else ""
+            self.table.set_heading(name, name + arrow)
+        self.apply_view()
+
+    def apply_view(self):
+        """Show the table from the top in the new sort / filter order"""
+        self.table.refresh(top=True)
+        self._show_count()
+
+    def _show_count(self):
+        """How many products the filters let through"""
+        shown, total = len(self.table), len(self.agent.df)
+        self.shown.config(text=f"Showing {shown:,} of {total:,} products" if shown != total else f"{total:,} products")
+
+    def show_product(self, product_id):
+        """Scroll the inventory table to a product found by the search box and select it"""
+        pos = self.agent.get_position(product_id)
+        if pos is None or self.table.show_position(pos):
+            return
+        # Filtered out: drop the filters (keeping the sort) and try again
+        self.low_only.set(False)
+        self.status_var.set(ALL_STATUSES)
+        self.apply_view()
+        self.table.show_position(pos)
+
+    def delete_selected(self):
+        """Delete the product selected in the inventory table"""
+        agent = self.agent
+        pos = self.table.selected_position()
+        if pos is None:
             messagebox.showwarning("Alert", "Please select a product to delete")
             return
-        
+
         try:
-            item = tree.item(selected[0])
-            product_id = str(item['values'][0]).strip()
-            product_name = str(item['values'][1]).strip()
-            
+            product_id = str(agent.df["Product ID"].iat[pos])
+            product_name = str(agent.df["Product Name"].iat[pos])
+
             if messagebox.askyesno("Confirm Delete", f"Delete '{product_name}' (ID: {product_id})?"):
                 if agent.delete_product(product_id):
                     messagebox.showinfo("Success", f"Product '{product_name}' deleted successfully!")
-                    show_dashboard(content_frame, agent, fonts)
+                    # The swap-remove moved another row into this position
+                    self.table.clear_selection()
+                    self.refresh()
                 else:
                     messagebox.showerror("Error", f"Failed to delete product. ID: {product_id}")
         except Exception as e:
             messagebox.showerror("Error", f"Delete failed: {str(e)}")
-    
-    delete_btn = tk.Button(
-        button_frame,
-        text="🗑️  Delete Selected",
-        command=delete_selected,
-        bg=DANGER,
-        fg="white",
-        font=fonts['normal'],
-        padx=20,
-        pady=10,
-        relief=tk.FLAT,
-        cursor="hand2",
-        activebackground="#dc2626"
-    )
-    delete_btn.pack(side=tk.LEFT, padx=5, pady=5)
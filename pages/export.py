@@ -5,75 +5,95 @@ Export Page - Export data to CSV
 import tkinter as tk
 from tkinter import messagebox
 from config.styles import *
-from ui.widgets import create_page_header
+from ui.page import Page
+from ui.tasks import TaskProgress
+from core.reports import write_csv
 
 
-def show_export(content_frame, agent, fonts):
-    """Display export page"""
-    # Clear content
-    for widget in content_frame.winfo_children():
-        widget.destroy()
+class ExportPage(Page):
+    """Export page"""
 
-    # Page header
-    create_page_header(content_frame, "Export Data", fonts)
+    title = "Export Data"
+    empty_text = "No data to export!"
 
-    # Content
-    content = tk.Frame(content_frame, bg=BG)
-    content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+    def build(self, body):
+        """Create the info card and buttons"""
+        fonts = self.fonts
+
+        # Info card
+        card = tk.Frame(body, bg=CARD_BG)
+        card.pack(fill=tk.X)
 
-    if agent.df.empty:
         tk.Label(
-            content,
-            text="No data to export!",
+            card,
+            text="Export Inventory Data",
             font=fonts['header'],
-            bg=BG,
-            fg=TEXT_LIGHT
-        ).pack(pady=20)
-        return
+            bg=CARD_BG,
+            fg=TEXT
+        ).pack(anchor=tk.W, padx=20, pady=(20, 10))
+
+        tk.Label(
+            card,
+            text="Export your inventory data to a CSV file for use in Excel, analysis tools, or backup purposes. The purchase plan lists safety stock, reorder point, order quantity (EOQ) and days of cover for every product.",
+            font=fonts['normal'],
+            bg=CARD_BG,
+            fg=TEXT_LIGHT,
+            wraplength=500,
+            justify=tk.LEFT
+        ).pack(anchor=tk.W, padx=20, pady=(0, 20))
+
+        # Buttons
+        buttons = tk.Frame(body, bg=BG)
+        buttons.pack(fill=tk.X, pady=(20, 0))
 
-    # Info card
-    card = tk.Frame(content, bg=CARD_BG)
-    card.pack(fill=tk.X)
+        tk.Button(
+            buttons,
+            text="💾 Export to CSV",
+            font=fonts['normal'],
+            bg=SUCCESS,
+            fg="white",
+            padx=20,
+            pady=10,
+            command=self.export,
+            cursor="hand2",
+            relief=tk.FLAT,
+            activebackground="#059669"
+        ).pack(side=tk.LEFT, padx=5, pady=5)
 
-    tk.Label(
-        card,
-        text="Export Inventory Data",
-        font=fonts['header'],
-        bg=CARD_BG,
-        fg=TEXT
-    ).pack(anchor=tk.W, padx=20, pady=(20, 10))
+        tk.Button(
+            buttons,
+            text="🛒 Export Purchase Plan",
+            font=fonts['normal'],
+            bg=SECONDARY,
+            fg="white",
+            padx=20,
+            pady=10,
+            command=self.export_plan,
+            cursor="hand2",
+            relief=tk.FLAT,
+            activebackground="#2563eb"
+        ).pack(side=tk.LEFT, padx=5, pady=5)
 
-    tk.Label(
-        card,
-        text="Export your inventory data to a CSV file for use in Excel, analysis tools, or backup purposes.",
-        font=fonts['normal'],
-        bg=CARD_BG,
-        fg=TEXT_LIGHT,
-        wraplength=500,
-        justify=tk.LEFT
-    ).pack(anchor=tk.W, padx=20, pady=(0, 20))
+        self.progress = TaskProgress(body, fonts)
 
-    # Buttons
-    buttons = tk.Frame(content, bg=BG)
-    buttons.pack(fill=tk.X, pady=(20, 0))
+    def export(self):
+        """Export the inventory to CSV in the background"""
+        self._export(self.agent.snapshot(), "inventory_export", "Exporting data")
 
-    def export():
-        try:
-            agent.export_data()
-            messagebox.showinfo("Success", "✓ Data exported successfully!")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed: {e}")
+    def export_plan(self):
+        """Export the purchase plan to CSV in the background"""
+        self._export(self.agent.reorder_plan(), "purchase_plan", "Exporting purchase plan")
 
-    tk.Button(
-        buttons,
-        text="💾 Export to CSV",
-        font=fonts['normal'],
-        bg=SUCCESS,
-        fg="white",
-        padx=20,
-        pady=10,
-        command=export,
-        cursor="hand2",
-        relief=tk.FLAT,
-        activebackground="#059669"
-    ).pack(side=tk.LEFT, padx=5, pady=5)
+    def _export(self, data, prefix, title):
+        """Write data (a snapshot) to a timestamped CSV on a worker thread"""
+        if self.progress.busy:
+            return
+        filename = self.agent.report_filename(prefix, "csv")
+        task = self.tasks.submit(
+            lambda task: write_csv(filename, data, task),
+            title=title,
+            on_done=lambda path: messagebox.showinfo("Success", f"✓ Exported to {path}"),
+            on_error=lambda e: messagebox.showerror("Error", f"Failed: {e}")
+        )
+        task.on_cancel = lambda: messagebox.showinfo("Cancelled", "Export cancelled.")
+        self.progress.track(task)
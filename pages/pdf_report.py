@@ -5,75 +5,79 @@ PDF Report Page - Generate PDF reports
 import tkinter as tk
 from tkinter import messagebox
 from config.styles import *
-from ui.widgets import create_page_header
+from ui.page import Page
+from ui.tasks import TaskProgress
+from core.reports import HAS_REPORTLAB, write_pdf_report
 
 
-def show_pdf_report(content_frame, agent, fonts):
-    """Display PDF report page"""
-    # Clear content
-    for widget in content_frame.winfo_children():
-        widget.destroy()
+class PdfReportPage(Page):
+    """PDF report page"""
 
-    # Page header
-    create_page_header(content_frame, "Generate PDF Report", fonts)
+    title = "Generate PDF Report"
+    empty_text = "No data to report!"
 
-    # Content
-    content = tk.Frame(content_frame, bg=BG)
-    content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+    def build(self, body):
+        """Create the info card and button"""
+        fonts = self.fonts
+
+        # Info card
+        card = tk.Frame(body, bg=CARD_BG)
+        card.pack(fill=tk.X)
 
-    if agent.df.empty:
         tk.Label(
-            content,
-            text="No data to report!",
+            card,
+            text="About PDF Report",
             font=fonts['header'],
-            bg=BG,
-            fg=TEXT_LIGHT
-        ).pack(pady=20)
-        return
+            bg=CARD_BG,
+            fg=TEXT
+        ).pack(anchor=tk.W, padx=20, pady=(20, 10))
 
-    # Info card
-    card = tk.Frame(content, bg=CARD_BG)
-    card.pack(fill=tk.X)
+        tk.Label(
+            card,
+            text="Generate a detailed PDF report of your current inventory status, including all products, stock levels, demand forecasts, and purchase suggestions. Large reports are written in the background.",
+            font=fonts['normal'],
+            bg=CARD_BG,
+            fg=TEXT_LIGHT,
+            wraplength=500,
+            justify=tk.LEFT
+        ).pack(anchor=tk.W, padx=20, pady=(0, 20))
 
-    tk.Label(
-        card,
-        text="About PDF Report",
-        font=fonts['header'],
-        bg=CARD_BG,
-        fg=TEXT
-    ).pack(anchor=tk.W, padx=20, pady=(20, 10))
+        # Buttons
+        buttons = tk.Frame(body, bg=BG)
+        buttons.pack(fill=tk.X, pady=(20, 0))
 
-    tk.Label(
-        card,
-        text="Generate a detailed PDF report of your current inventory status, including all products, stock levels, and demand forecasts.",
-        font=fonts['normal'],
-        bg=CARD_BG,
-        fg=TEXT_LIGHT,
-        wraplength=500,
-        justify=tk.LEFT
-    ).pack(anchor=tk.W, padx=20, pady=(0, 20))
+        tk.Button(
+            buttons,
+            text="📄 Generate Report",
+            font=fonts['normal'],
+            bg=SECONDARY,
+            fg="white",
+            padx=20,
+            pady=10,
+            command=self.generate,
+            cursor="hand2",
+            relief=tk.FLAT,
+            activebackground="#2563eb"
+        ).pack(side=tk.LEFT, padx=5, pady=5)
 
-    # Buttons
-    buttons = tk.Frame(content, bg=BG)
-    buttons.pack(fill=tk.X, pady=(20, 0))
+        self.progress = TaskProgress(body, fonts)
 
-    def generate():
-        try:
-            agent.generate_pdf_report()
-            messagebox.showinfo("Success", "✓ PDF generated successfully!")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed: {e}")
+    def generate(self):
+        """Write the PDF report in the background from a snapshot of the data"""
+        if self.progress.busy:
+            return
+        if not HAS_REPORTLAB:
+            messagebox.showerror("Error", "reportlab is not installed.\nInstall it with: pip install reportlab")
+            return
 
-    tk.Button(
-        buttons,
-        text="📄 Generate Report",
-        font=fonts['normal'],
-        bg=SECONDARY,
-        fg="white",
-        padx=20,
-        pady=10,
-        command=generate,
-        cursor="hand2",
-        relief=tk.FLAT,
-        activebackground="#2563eb"
-    ).pack(side=tk.LEFT, padx=5, pady=5)
+        agent = self.agent
+        filename = agent.report_filename("inventory_report", "pdf")
+        df, plan = agent.snapshot(), agent.reorder_plan()
+        task = self.tasks.submit(
+            lambda task: write_pdf_report(filename, df, plan, task),
+            title="Generating PDF report",
+            on_done=lambda path: messagebox.showinfo("Success", f"✓ PDF generated: {path}"),
+            on_error=lambda e: messagebox.showerror("Error", f"Failed: {e}")
+        )
+        task.on_cancel = lambda: messagebox.showinfo("Cancelled", "PDF report cancelled.")
+        self.progress.track(task)
@@ -3,106 +3,117 @@ Update Stock Page - Form to update product stock levels
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import messagebox
 from config.styles import *
-from ui.widgets import create_page_header
+from core.schema import check_count
+from ui.page import Page
+from ui.search_box import SearchBox
 
 
-def show_update_stock(content_frame, agent, fonts):
-    """Display update stock page"""
-    # Clear content
-    for widget in content_frame.winfo_children():
-        widget.destroy()
+class UpdateStockPage(Page):
+    """Update stock page"""
 
-    # Page header
-    create_page_header(content_frame, "Update Stock", fonts)
+    title = "Update Stock"
+    empty_text = "No products! Add one first."
 
-    # Content
-    content = tk.Frame(content_frame, bg=BG)
-    content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+    def build(self, body):
+        """Create the form"""
+        fonts = self.fonts
+        self.product_id = None
+
+        # Form
+        form = tk.Frame(body, bg=CARD_BG)
+        form.pack(fill=tk.X)
+
+        tk.Label(
+            form,
+            text="Find Product *",
+            font=fonts['normal'],
+            bg=CARD_BG,
+            fg=TEXT
+        ).grid(row=0, column=0, sticky="nw", padx=20, pady=10)
+
+        # Matches carry the real Product ID; nothing is parsed back out of display text
+        self.search = SearchBox(form, self.agent, fonts, self.pick, tasks=self.tasks)
+        self.search.frame.grid(row=0, column=1, padx=20, pady=10, sticky="ew")
+
+        self.selected = tk.Label(
+            form,
+            text="No product selected",
+            font=fonts['normal'],
+            bg=CARD_BG,
+            fg=TEXT_LIGHT,
+            anchor=tk.W
+        )
+        self.selected.grid(row=1, column=1, padx=20, pady=(0, 10), sticky="ew")
 
-    if agent.df.empty:
         tk.Label(
-            content,
-            text="No products! Add one first.",
+            form,
+            text="New Stock *",
+            font=fonts['normal'],
+            bg=CARD_BG,
+            fg=TEXT
+        ).grid(row=2, column=0, sticky="w", padx=20, pady=10)
+
+        self.stock_entry = tk.Entry(form, font=fonts['normal'], width=40, border=1, relief=tk.SOLID)
+        self.stock_entry.grid(row=2, column=1, padx=20, pady=10, sticky="ew", ipady=6)
+
+        form.columnconfigure(1, weight=1)
+
+        # Buttons
+        buttons = tk.Frame(body, bg=BG)
+        buttons.pack(fill=tk.X, pady=(20, 0))
+
+        tk.Button(
+            buttons,
+            text="✓ Update Stock",
             font=fonts['header'],
-            bg=BG,
-            fg=TEXT_LIGHT
-        ).pack(pady=20)
-        return
-
-    # Form
-    form = tk.Frame(content, bg=CARD_BG)
-    form.pack(fill=tk.X)
-
-    tk.Label(
-        form,
-        text="Select Product *",
-        font=fonts['normal'],
-        bg=CARD_BG,
-        fg=TEXT
-    ).grid(row=0, column=0, sticky="w", padx=20, pady=10)
-
-    product_var = tk.StringVar()
-    options = [
-        f"{row['Product Name']} (ID: {row['Product ID']}) - Stock: {row['Stock']}"
-        for _, row in agent.df.iterrows()
-    ]
-    combo = ttk.Combobox(
-        form,
-        textvariable=product_var,
-        values=options,
-        width=55,
-        state="readonly",
-        font=fonts['normal']
-    )
-    combo.grid(row=0, column=1, padx=20, pady=10, sticky="ew", ipady=6)
-
-    tk.Label(
-        form,
-        text="New Stock *",
-        font=fonts['normal'],
-        bg=CARD_BG,
-        fg=TEXT
-    ).grid(row=1, column=0, sticky="w", padx=20, pady=10)
-
-    stock_entry = tk.Entry(form, font=fonts['normal'], width=40, border=1, relief=tk.SOLID)
-    stock_entry.grid(row=1, column=1, padx=20, pady=10, sticky="ew", ipady=6)
-
-    form.columnconfigure(1, weight=1)
-
-    # Buttons
-    buttons = tk.Frame(content, bg=BG)
-    buttons.pack(fill=tk.X, pady=(20, 0))
-
-    def update():
+            bg=SECONDARY,
+            fg="white",
+            width=20,
+            command=self.update_stock,
+            cursor="hand2",
+            border=0,
+            activebackground="#1d4ed8"
+        ).pack(side=tk.LEFT, ipady=8, ipadx=15)
+
+    def update(self):
+        """Drop a selection whose product no longer exists, show its current stock otherwise"""
+        self.select(self.product_id)
+        self.search.refresh()
+
+    def select(self, product_id):
+        """Make product_id (or None) the product to update"""
+        product = None if product_id is None else self.agent.get_product(product_id)
+        if product is None:
+            self.product_id = None
+            self.selected.config(text="No product selected", fg=TEXT_LIGHT)
+            return
+        self.product_id = product.product_id
+        self.selected.config(text=f"{product.name} (ID: {product.product_id}) - Stock: {product.stock}", fg=TEXT)
+
+    def pick(self, product_id):
+        """Search box choice: select the product and move on to the stock field"""
+        self.select(product_id)
+        self.stock_entry.focus_set()
+
+    def update_stock(self):
+        """Validate the form and set the stock"""
         try:
-            if not product_var.get():
+            if self.product_id is None:
                 messagebox.showerror("Error", "Select a product!")
                 return
 
-            pid = product_var.get().split("(ID: ")[1].split(")")[0]
-            new_stock = int(stock_entry.get())
+            new_stock = check_count(self.stock_entry.get(), "Stock")
 
-            idx = agent.df[agent.df["Product ID"] == pid].index[0]
-            agent.df.at[idx, "Stock"] = new_stock
-            agent._save_data()
+            if not self.agent.set_stock(self.product_id, new_stock):
+                messagebox.showerror("Error", "That product no longer exists!")
+                self.select(None)
+                return
 
             messagebox.showinfo("Success", "✓ Stock updated!")
-            show_update_stock(content_frame, agent, fonts)
-
-        except ValueError:
-            messagebox.showerror("Error", "Stock must be a number!")
-
-    tk.Button(
-        buttons,
-        text="✓ Update Stock",
-        font=fonts['header'],
-        bg=SECONDARY,
-        fg="white",
-        width=20,
-        command=update,
-        cursor="hand2",
-        border=0,
-        activebackground="#1d4ed8"
-    ).pack(side=tk.LEFT, ipady=8, ipadx=15)
+            self.select(None)
+            self.stock_entry.delete(0, tk.END)
+
+        except ValueError as e:
+            messagebox.showerror("Error", f"{e}!")
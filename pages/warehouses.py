@@ -0,0 +1,135 @@
+"""
+Warehouses Page - Company-wide rollups across all sites
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from config.styles import *
+from ui.page import Page
+from ui.widgets import create_metric_card, fill_tree
+from core.recommendations import SAFE
+
+RISK_COLUMNS = ["Product ID", "Product Name", "Stock", "Forecast", "Priority Score", "Status"]
+
+
+class WarehousesPage(Page):
+    """Per-warehouse totals, low stock by site and company-wide risk"""
+
+    title = "Warehouses"
+
+    def __init__(self, parent, network, fonts, on_sites_changed=None):
+        """Create the page for a warehouse network"""
+        self.network = network
+        self.on_sites_changed = on_sites_changed
+        super().__init__(parent, None, fonts)
+
+    def build(self, body):
+        """Create metrics, tables and the add-warehouse form"""
+        fonts = self.fonts
+
+        # Company-wide metrics
+        metrics = tk.Frame(body, bg=BG)
+        metrics.pack(fill=tk.X, pady=(0, 20))
+
+        self.sites = create_metric_card(metrics, "Warehouses", 0, PRIMARY, fonts)
+        self.total_products = create_metric_card(metrics, "Stock Lines", 0, SECONDARY, fonts)
+        self.total_stock = create_metric_card(metrics, "Total Stock", 0, SUCCESS, fonts)
+        self.low_stock = create_metric_card(metrics, "Low Stock Lines", 0, DANGER, fonts)
+
+        tables = tk.Frame(body, bg=BG)
+        tables.pack(fill=tk.BOTH, expand=True)
+
+        self.site_table = _create_table(tables, ["Warehouse", "Products", "Total Stock", "Low Stock"], fonts, height=4)
+        self.low_table = _create_table(tables, ["Warehouse", "Product ID", "Product Name", "Stock", "Daily Demand"],
+                                       fonts, height=6)
+        self.risk_table = _create_table(tables, RISK_COLUMNS, fonts, height=6)
+
+        # Add warehouse
+        form = tk.Frame(body, bg=BG)
+        form.pack(fill=tk.X, pady=(10, 0))
+
+        tk.Label(form, text="New warehouse:", font=fonts['normal'], bg=BG, fg=TEXT).pack(side=tk.LEFT, padx=(0, 10))
+        self.name_entry = tk.Entry(form, font=fonts['normal'], width=25, border=1, relief=tk.SOLID)
+        self.name_entry.pack(side=tk.LEFT, ipady=6)
+
+        tk.Button(
+            form,
+            text="🏢 Add Warehouse",
+            font=fonts['normal'],
+            bg=SUCCESS,
+            fg="white",
+            padx=20,
+            pady=6,
+            command=self.add_site,
+            cursor="hand2",
+            relief=tk.FLAT,
+            activebackground="#059669"
+        ).pack(side=tk.LEFT, padx=10)
+
+    def data_version(self):
+        """Data versions of every warehouse (opening and refreshing them)"""
+        return tuple((site, agent.version) for site, agent in self.network.agents())
+
+    def update(self):
+        """Recompute the rollups"""
+        network = self.network
+        summary = network.company_summary()
+        self.sites.config(text=str(len(network.sites)))
+        self.total_products.config(text=str(summary["total_products"]))
+        self.total_stock.config(text=str(summary["total_stock"]))
+        self.low_stock.config(text=str(summary["low_stock"]))
+
+        # Per-warehouse totals
+        site_totals = network.site_totals()
+        _show_table(self.site_table, "Per Warehouse", site_totals)
+        self.site_table[1].config(height=max(min(len(site_totals), 6), 1))
+
+        # Low stock by site
+        low = network.low_stock_by_site()
+        _show_table(self.low_table, f"Low Stock by Site ({len(low)})", low.head(200))
+
+        # Company-wide risk (stock and demand summed over warehouses)
+        result = network.recommendations()
+        at_risk = result[result["Risk Level"].to_numpy() != SAFE]
+        at_risk = at_risk.sort_values(["Risk Level", "Priority Score"], ascending=False)
+        _show_table(self.risk_table, f"Company-wide Risk ({len(at_risk)})", at_risk[RISK_COLUMNS].head(200))
+
+    def add_site(self):
+        """Add the warehouse typed in the form"""
+        name = self.name_entry.get()
+        try:
+            if not self.network.add_site(name):
+                messagebox.showerror("Error", "A warehouse with this name already exists!")
+                return
+            messagebox.showinfo("Success", f"✓ Warehouse '{name.strip()}' added!")
+            self.name_entry.delete(0, tk.END)
+            if self.on_sites_changed:
+                self.on_sites_changed()
+            else:
+                self.refresh()
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+
+
+def _create_table(parent, columns, fonts, height):
+    """Titled read-only Treeview; returns (title label, tree)"""
+    title = tk.Label(parent, font=fonts['header'], bg=BG, fg=TEXT)
+    title.pack(anchor=tk.W, pady=(0, 5))
+
+    table_frame = tk.Frame(parent, bg=CARD_BG, relief=tk.FLAT, bd=1)
+    table_frame.pack(fill=tk.X, pady=(0, 15))
+
+    tree = ttk.Treeview(table_frame, columns=columns, height=height, show="headings")
+    for col in columns:
+        tree.heading(col, text=col)
+        tree.column(col, width=140)
+
+    tree.pack(fill=tk.X, padx=5, pady=5)
+    return title, tree
+
+
+def _show_table(table, title, frame):
+    """Show a DataFrame in a table made by _create_table"""
+    label, tree = table
+    label.config(text=title)
+    fill_tree(tree, frame.itertuples(index=False))
@@ -5,17 +5,23 @@ Orchestrates all UI components and page navigation
 
 import tkinter as tk
 from tkinter import messagebox
-from config.styles import get_fonts, PRIMARY, SECONDARY, BG, CARD_BG, TEXT, TEXT_LIGHT, DANGER
+from config.styles import get_fonts, PRIMARY, SECONDARY, BG, CARD_BG, TEXT, TEXT_LIGHT
 from ui.header import Header
 from ui.sidebar import Sidebar
 from ui.widgets import clear_frame
-from pages.dashboard import show_dashboard
-from pages.add_product import show_add_product
-from pages.update_stock import show_update_stock
-from pages.ai_insights import show_ai_recommendations
-from pages.pdf_report import show_pdf_report
-from pages.export import show_export
+from ui.tasks import TaskRunner
+from pages.dashboard import DashboardPage
+from pages.add_product import AddProductPage
+from pages.update_stock import UpdateStockPage
+from pages.ai_insights import AIInsightsPage
+from pages.pdf_report import PdfReportPage
+from pages.export import ExportPage
+from pages.warehouses import WarehousesPage
 from final_smart_inventory_agent import InventoryAgent
+from core.warehouses import WarehouseNetwork
+
+# How often to check whether the change journal is due for compaction
+AUTOSAVE_MS = 2000
 
 
 class InventoryUI:
@@ -36,8 +42,21 @@ class InventoryUI:
         self.root.geometry(f'{width}x{height}+{x}+{y}')
 
         self.agent = None
+        self.user = None
+        self.network = None
+        self.site = None
         self.content_frame = None
+        # Pages are built on first visit and kept until the site or layout changes
+        self.pages = {}
+        self.page = None
+        self.header = None
+        self.alerts = []
         self.fonts = get_fonts()
+        # Reports, exports and journal compaction run here, off the Tk thread
+        self.tasks = TaskRunner(self.root)
+        self._saving = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(AUTOSAVE_MS, self._autosave)
 
         # Show login
         self._show_login()
@@ -45,7 +64,11 @@ class InventoryUI:
     # ==================== LOGIN ====================
     def _show_login(self):
         """Show login screen"""
+        if self.network is not None:
+            self.network.close()
         clear_frame(self.root)
+        self.pages = {}
+        self.page = None
 
         main_frame = tk.Frame(self.root, bg=BG)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -80,8 +103,12 @@ class InventoryUI:
 
         def handle_login():
             if user_entry.get() == "admin" and pwd_entry.get() == "admin123":
-                self.agent = InventoryAgent(file_path="inventory.csv", low_limit=10)
-                self.agent.user = "admin"
+                self.user = "admin"
+                self.alerts = []
+                self.network = WarehouseNetwork(InventoryAgent, "inventory.csv", on_open=self._on_site_open,
+                                                low_limit=10, journal=True)
+                self.site = self.network.default_site
+                self.agent = self.network.site(self.site)
                 self._create_main_layout()
             else:
                 messagebox.showerror("Error", "Invalid credentials!")
@@ -105,12 +132,15 @@ class InventoryUI:
     def _create_main_layout(self):
         """Create main layout: Header + Sidebar + Content"""
         clear_frame(self.root)
+        self.pages = {}
+        self.page = None
 
         main = tk.Frame(self.root, bg="white")
         main.pack(fill=tk.BOTH, expand=True)
 
         # Fixed Header
-        Header(main, self.agent.user, self.fonts)
+        self.header = Header(main, self.agent.user, self.fonts, self._show_alerts)
+        self.header.set_alert_count(len(self.alerts))
 
         # Body: Sidebar + Content
         body = tk.Frame(main, bg=BG)
@@ -118,18 +148,112 @@ class InventoryUI:
 
         # Sidebar
         menu_items = [
-            ("📊 Dashboard", lambda: show_dashboard(self.content_frame, self.agent, self.fonts)),
-            ("➕ Add Product", lambda: show_add_product(self.content_frame, self.agent, self.fonts)),
-            ("🔄 Update Stock", lambda: show_update_stock(self.content_frame, self.agent, self.fonts)),
-            ("🤖 AI Insights", lambda: show_ai_recommendations(self.content_frame, self.agent, self.fonts)),
-            ("📄 PDF Report", lambda: show_pdf_report(self.content_frame, self.agent, self.fonts)),
-            ("💾 Export CSV", lambda: show_export(self.content_frame, self.agent, self.fonts)),
+            ("📊 Dashboard", lambda: self._open_page(DashboardPage)),
+            ("➕ Add Product", lambda: self._open_page(AddProductPage)),
+            ("🔄 Update Stock", lambda: self._open_page(UpdateStockPage)),
+            ("🤖 AI Insights", lambda: self._open_page(AIInsightsPage)),
+            ("📄 PDF Report", lambda: self._open_page(PdfReportPage)),
+            ("💾 Export CSV", lambda: self._open_page(ExportPage)),
+            ("🏢 Warehouses", self._open_warehouses),
         ]
-        Sidebar(body, menu_items, self._show_login, self.fonts)
+        Sidebar(body, menu_items, self._show_login, self.fonts,
+                sites=self.network.sites, current_site=self.site, on_site_change=self._switch_site)
 
         # Content Area
         self.content_frame = tk.Frame(body, bg=BG)
         self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
         # Show dashboard by default
-        show_dashboard(self.content_frame, self.agent, self.fonts)
+        self._open_page(DashboardPage)
+
+    def _open_page(self, page_class):
+        """Pick up changes saved by other clerks, then show a page (built on first visit)"""
+        self.agent.refresh()
+        page = self.pages.get(page_class)
+        if page is None:
+            page = self._build_page(page_class)
+            self.pages[page_class] = page
+        if self.page is not None and self.page is not page:
+            self.page.hide()
+        self.page = page
+        page.show()
+
+    def _build_page(self, page_class):
+        """Create a page in the content area"""
+        if page_class is WarehousesPage:
+            return WarehousesPage(self.content_frame, self.network, self.fonts,
+                                  on_sites_changed=self._create_main_layout)
+        return page_class(self.content_frame, self.agent, self.fonts, tasks=self.tasks)
+
+    def _drop_pages(self):
+        """Destroy every cached page (they are bound to the current agent and layout)"""
+        for page in self.pages.values():
+            page.destroy()
+        self.pages = {}
+        self.page = None
+
+    # ==================== WAREHOUSES ====================
+    def _on_site_open(self, site, agent):
+        """Set up a warehouse agent the first time it is opened"""
+        agent.user = self.user
+        # Compaction rewrites the whole file, so _autosave() does it in the background
+        agent.storage.defer_compaction = True
+        agent.attach_alert_sinks()
+        agent.events.subscribe(self._on_stock_event)
+
+    def _switch_site(self, site):
+        """Make another warehouse the one all pages work on"""
+        self.site = site
+        self.agent = self.network.site(site)
+        self._drop_pages()
+        self._open_page(DashboardPage)
+
+    def _open_warehouses(self):
+        """Show company-wide rollups across all warehouses"""
+        self._open_page(WarehousesPage)
+
+    # ==================== BACKGROUND SAVES ====================
+    def _autosave(self):
+        """Fold a long change journal into the base file on a worker thread"""
+        agent = self.agent
+        if agent is not None and not self._saving:
+            pending = agent.pending_compaction()
+            if pending is not None:
+                self._saving = True
+                self.tasks.submit(
+                    lambda task: agent.save_snapshot(*pending),
+                    title="Saving",
+                    on_done=lambda saved: self._saved(),
+                    on_error=lambda e: self._saved(e)
+                )
+        self.root.after(AUTOSAVE_MS, self._autosave)
+
+    def _saved(self, error=None):
+        """A background save finished (the journal keeps every change if it failed)"""
+        self._saving = False
+        if error is not None:
+            messagebox.showerror("Save Failed", f"Could not compact the data file: {error}")
+
+    def _on_close(self):
+        """Stop background work and close the window"""
+        self.tasks.shutdown()
+        self.root.destroy()
+
+    # ==================== ALERTS ====================
+    def _on_stock_event(self, event):
+        """Collect a low-stock / risk alert and update the header badge"""
+        self.alerts.append(event)
+        self.root.after(0, lambda: self.header and self.header.set_alert_count(len(self.alerts)))
+
+    def _show_alerts(self):
+        """Show unread alerts and clear the badge"""
+        if not self.alerts:
+            return
+        shown = self.alerts[-20:]
+        more = len(self.alerts) - len(shown)
+        text = "\n".join(str(event) for event in reversed(shown))
+        if more:
+            text += f"\n... and {more} earlier alerts (see inventory_alerts.log)"
+        self.alerts = []
+        self.header.set_alert_count(0)
+        messagebox.showinfo("Stock Alerts", text)
@@ -10,7 +10,7 @@ from config.styles import *
 class Header:
     """Application header"""
     
-    def __init__(self, parent, username, fonts):
+    def __init__(self, parent, username, fonts, on_badge_click=None):
         """Create fixed header"""
         self.header = tk.Frame(parent, bg=PRIMARY, height=70)
         self.header.pack(fill=tk.X)
@@ -34,3 +34,23 @@ class Header:
             bg=PRIMARY, 
             fg="#e0e7ff"
         ).pack(anchor=tk.E, side=tk.RIGHT)
+
+        # Alert badge, hidden until there is something to show
+        self.badge = tk.Label(
+            content,
+            text="",
+            font=fonts['header'],
+            bg=DANGER,
+            fg="white",
+            padx=10,
+            cursor="hand2"
+        )
+        self.badge.bind("<Button-1>", lambda e: on_badge_click() if on_badge_click else None)
+
+    def set_alert_count(self, count):
+        """Show the number of unread alerts (0 hides the badge)"""
+        if count:
+            self.badge.config(text=f"🔔 {count}")
+            self.badge.pack(anchor=tk.E, side=tk.RIGHT, padx=(0, 20))
+        else:
+            self.badge.pack_forget()
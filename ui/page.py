@@ -0,0 +1,80 @@
+"""
+Page Base - Pages built once and kept alive by InventoryUI
+A page builds its widgets in build() the first time it is opened. Later
+visits only call refresh(), which does nothing while the agent's data
+version is unchanged and otherwise lets the page patch what changed.
+"""
+
+import tkinter as tk
+from abc import ABC, abstractmethod
+from config.styles import *
+from ui.widgets import create_page_header
+
+
+class Page(ABC):
+    """A persistent page; subclasses implement build() and update()"""
+
+    title = ""
+    # Shown instead of the page body while there are no products (None = always show the body)
+    empty_text = None
+
+    def __init__(self, parent, agent, fonts, tasks=None):
+        """Create the page frame (hidden until show()); tasks: the app's ui.tasks.TaskRunner"""
+        self.agent = agent
+        self.fonts = fonts
+        self.tasks = tasks
+        self.version = None
+
+        self.frame = tk.Frame(parent, bg=BG)
+        create_page_header(self.frame, self.title, fonts)
+
+        self.content = tk.Frame(self.frame, bg=BG)
+        self.content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        self.empty = tk.Label(
+            self.content,
+            text=self.empty_text or "",
+            font=fonts['header'],
+            bg=BG,
+            fg=TEXT_LIGHT
+        )
+        self.body = tk.Frame(self.content, bg=BG)
+        self.build(self.body)
+
+    @abstractmethod
+    def build(self, body):
+        """Create the page widgets inside body"""
+
+    def update(self):
+        """Bring the widgets up to date with the data (only called after a change)"""
+
+    def data_version(self):
+        """Changes whenever the data shown on this page changes"""
+        return self.agent.version
+
+    def show(self):
+        """Display the page, refreshed"""
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        self.refresh()
+
+    def hide(self):
+        """Take the page off screen, keeping its widgets"""
+        self.frame.pack_forget()
+
+    def refresh(self):
+        """Apply data changes since the last refresh (no-op when nothing changed)"""
+        version = self.data_version()
+        if version == self.version:
+            return
+        self.version = version
+        if self.empty_text is not None and self.agent.df.empty:
+            self.body.pack_forget()
+            self.empty.pack(pady=20)
+            return
+        self.empty.pack_forget()
+        self.body.pack(fill=tk.BOTH, expand=True)
+        self.update()
+
+    def destroy(self):
+        """Destroy the page widgets"""
+        self.frame.destroy()
@@ -0,0 +1,131 @@
+"""
+Search Box - Search-as-you-type product finder
+An Entry with a short list of the best matches under it. Every keystroke
+runs agent.search() (a fraction of a millisecond once the index exists) and
+picking a match hands its real Product ID to the page. With a task runner
+the index is built in the background the first time the box gets focus.
+"""
+
+import tkinter as tk
+from config.styles import *
+from core.search import SearchIndex
+
+
+class SearchBox:
+    """Product search entry with a list of matches"""
+
+    def __init__(self, parent, agent, fonts, on_pick, tasks=None, limit=8, bg=CARD_BG):
+        """on_pick(product_id) runs when a match is chosen; tasks: optional ui.tasks.TaskRunner"""
+        self.agent = agent
+        self.on_pick = on_pick
+        self.tasks = tasks
+        self.limit = limit
+        self.ids = []
+        self._indexing = False
+
+        self.frame = tk.Frame(parent, bg=bg)
+
+        row = tk.Frame(self.frame, bg=bg)
+        row.pack(fill=tk.X)
+        tk.Label(row, text="🔍", font=fonts['normal'], bg=bg, fg=TEXT_LIGHT).pack(side=tk.LEFT, padx=(0, 8))
+
+        self.var = tk.StringVar()
+        self.entry = tk.Entry(row, textvariable=self.var, font=fonts['normal'], border=1, relief=tk.SOLID)
+        self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=6)
+
+        self.results = tk.Listbox(
+            self.frame,
+            height=limit,
+            font=fonts['normal'],
+            activestyle="none",
+            border=1,
+            relief=tk.SOLID,
+            selectbackground=SECONDARY
+        )
+
+        self.var.trace_add("write", lambda *_: self.refresh())
+        self.entry.bind("<FocusIn>", lambda e: self.prepare())
+        self.entry.bind("<Return>", lambda e: self.pick(0))
+        self.entry.bind("<Down>", self._enter_results)
+        self.entry.bind("<Escape>", lambda e: self.clear())
+        self.results.bind("<Return>", lambda e: self.pick())
+        self.results.bind("<ButtonRelease-1>", lambda e: self.pick())
+        self.results.bind("<Escape>", lambda e: self.clear())
+
+    # ==================== INDEX ====================
+    def prepare(self):
+        """Build the agent's search index in the background if it does not exist yet.
+
+        The agent runs one build at a time: a box that gets focus while
+        another box's build is running waits for that one.
+        """
+        agent = self.agent
+        if agent.search_ready or self.tasks is None or self._indexing:
+            return
+        self._indexing = True
+        snapshot = agent.search_snapshot(self._indexed)
+        if snapshot is None:
+            return
+        ids, names = snapshot
+        self.tasks.submit(
+            lambda task: SearchIndex(ids, names),
+            title="Indexing products",
+            on_done=agent.adopt_search_index,
+            on_error=lambda error: agent.adopt_search_index(None)
+        )
+
+    def _indexed(self):
+        """The agent's build finished (or failed): run the query typed meanwhile"""
+        self._indexing = False
+        if self.frame.winfo_exists():
+            self.refresh()
+
+    # ==================== RESULTS ====================
+    def refresh(self):
+        """Show the best matches for the current text (call after the data changed)"""
+        query = self.var.get().strip()
+        if not query:
+            self._show([], [])
+            return
+        if self._indexing and not self.agent.search_ready:
+            self._show([], ["Indexing products..."])
+            return
+        matches = self.agent.search(query, self.limit)
+        labels = (matches["Product Name"].astype(str) + "  (ID: " + matches["Product ID"].astype(str)
+                  + ")  - Stock: " + matches["Stock"].astype(str)).tolist()
+        self._show(matches["Product ID"].tolist(), labels or ["No matching products"])
+
+    def _show(self, ids, labels):
+        """Fill the match list, hiding it when there is nothing to show"""
+        self.ids = ids
+        self.results.delete(0, tk.END)
+        if not labels:
+            self.results.pack_forget()
+            return
+        self.results.insert(tk.END, *labels)
+        self.results.config(height=min(len(labels), self.limit))
+        self.results.pack(fill=tk.X, pady=(5, 0))
+
+    def _enter_results(self, event=None):
+        """Down arrow: move from the entry into the match list"""
+        if self.ids:
+            self.results.focus_set()
+            self.results.selection_clear(0, tk.END)
+            self.results.selection_set(0)
+            self.results.activate(0)
+        return "break"
+
+    def pick(self, index=None):
+        """Hand the chosen (or first) match's Product ID to on_pick"""
+        if index is None:
+            selected = self.results.curselection()
+            index = selected[0] if selected else 0
+        if index < len(self.ids):
+            product_id = self.ids[index]
+            self.clear()
+            self.on_pick(product_id)
+        return "break"
+
+    def clear(self):
+        """Empty the entry and hide the matches"""
+        self.var.set("")
@@ -4,14 +4,15 @@ Left side panel with menu items and logout button
 """
 
 import tkinter as tk
+from tkinter import ttk
 from config.styles import *
 
 
 class Sidebar:
     """Application sidebar with navigation"""
     
-    def __init__(self, parent, menu_items, logout_callback, fonts):
-        """Create sidebar with menu"""
+    def __init__(self, parent, menu_items, logout_callback, fonts, sites=None, current_site=None, on_site_change=None):
+        """Create sidebar with menu (and a warehouse selector when sites are given)"""
         self.sidebar = tk.Frame(parent, bg=CARD_BG, width=220)
         self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
         self.sidebar.pack_propagate(False)
@@ -28,6 +29,21 @@ class Sidebar:
             fg=TEXT
         ).pack(pady=15)
 
+        # Warehouse selector
+        if sites:
+            tk.Label(
+                self.sidebar,
+                text="Warehouse",
+                font=fonts['small'],
+                bg=CARD_BG,
+                fg=TEXT_LIGHT
+            ).pack(anchor=tk.W, padx=15)
+            self.site_var = tk.StringVar(value=current_site or sites[0])
+            selector = ttk.Combobox(self.sidebar, textvariable=self.site_var, values=list(sites), state="readonly")
+            selector.pack(fill=tk.X, padx=10, pady=(0, 10))
+            if on_site_change:
+                selector.bind("<<ComboboxSelected>>", lambda e: on_site_change(self.site_var.get()))
+
         # Menu items
         for label, callback in menu_items:
             btn = tk.Button(
@@ -0,0 +1,202 @@
+"""
+Background Tasks - Slow work off the Tk thread
+Jobs run on a thread pool as job(task, *args) and use the Task to report
+progress and notice cancellation. Progress, results and errors come back
+through a queue that the Tk thread drains with root.after, so callbacks
+and widgets only ever run on the Tk thread.
+
+Jobs must not touch live agent state: hand them snapshots
+(agent.snapshot(), a cached reorder plan) taken on the Tk thread.
+"""
+
+import queue
+import threading
+import time
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+from config.styles import *
+
+
+class TaskCancelled(Exception):
+    """Raised inside a job by Task.check() after the user cancelled it"""
+
+
+class Task:
+    """Handle shared by a running job and the Tk thread"""
+
+    # Seconds between progress messages (the job may report far more often)
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, runner, title, on_done=None, on_error=None):
+        """Create a task; callbacks run on the Tk thread"""
+        self.runner = runner
+        self.title = title
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = None
+        self.on_progress = None
+        self.on_finish = None
+        self.fraction = 0.0
+        self.text = ""
+        self.finished = False
+        self._cancel = threading.Event()
+        self._last_report = 0.0
+
+    # ==================== JOB SIDE ====================
+    @property
+    def cancelled(self):
+        """True once cancel() was called"""
+        return self._cancel.is_set()
+
+    def check(self):
+        """Stop the job here if it was cancelled"""
+        if self._cancel.is_set():
+            raise TaskCancelled(self.title)
+
+    def progress(self, done, total=None, text=None):
+        """Report progress: done of total units (or a fraction when total is None)"""
+        now = time.monotonic()
+        fraction = done / total if total else float(done)
+        if fraction < 1 and now - self._last_report < self.PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        self.runner._post("progress", self, (min(fraction, 1.0), text))
+
+    # ==================== TK SIDE ====================
+    def cancel(self):
+        """Ask the job to stop at its next check()"""
+        self._cancel.set()
+
+
+class TaskRunner:
+    """Thread pool whose results are delivered on the Tk thread"""
+
+    def __init__(self, root, workers=2, poll_ms=50):
+        """Create the pool; root is any Tk widget used for after()"""
+        self.root = root
+        self.poll_ms = poll_ms
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inventory-task")
+        self.active = set()
+        self._queue = queue.Queue()
+        self._polling = False
+
+    def submit(self, job, *args, title="", on_done=None, on_error=None):
+        """Run job(task, *args) in the background; returns the Task"""
+        task = Task(self, title, on_done, on_error)
+        self.active.add(task)
+        self.pool.submit(self._run, task, job, args)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return task
+
+    def _run(self, task, job, args):
+        """Worker thread: run the job and queue its outcome"""
+        try:
+            result = job(task, *args)
+        except TaskCancelled:
+            self._post("cancelled", task, None)
+        except Exception as e:
+            self._post("error", task, e)
+        else:
+            self._post("done", task, result)
+
+    def _post(self, kind, task, value):
+        """Queue a message for the Tk thread (any thread)"""
+        self._queue.put((kind, task, value))
+
+    def _poll(self):
+        """Tk thread: deliver queued messages, keep polling while tasks run"""
+        while True:
+            try:
+                kind, task, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                task.fraction, text = value
+                task.text = text or task.text
+                if task.on_progress:
+                    task.on_progress(task)
+                continue
+            self.active.discard(task)
+            task.finished = True
+            if kind == "cancelled":
+                if task.on_cancel:
+                    task.on_cancel()
+            else:
+                callback = task.on_done if kind == "done" else task.on_error
+                if callback:
+                    callback(value)
+            if task.on_finish:
+                task.on_finish(task)
+        if self.active:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        """Cancel running tasks and stop the pool without waiting"""
+        for task in list(self.active):
+            task.cancel()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class TaskProgress:
+    """Progress bar with a Cancel button for one task at a time (hidden when idle)"""
+
+    def __init__(self, parent, fonts):
+        """Create the (hidden) progress row"""
+        self.task = None
+        self.frame = tk.Frame(parent, bg=BG)
+
+        self.label = tk.Label(self.frame, font=fonts['normal'], bg=BG, fg=TEXT_LIGHT)
+        self.label.pack(side=tk.LEFT, padx=(0, 10))
+
+        self.bar = ttk.Progressbar(self.frame, orient=tk.HORIZONTAL, length=300, mode="determinate", maximum=1.0)
+        self.bar.pack(side=tk.LEFT, padx=(0, 10))
+
+        tk.Button(
+            self.frame,
+            text="✖ Cancel",
+            font=fonts['normal'],
+            bg=DANGER,
+            fg="white",
+            padx=10,
+            command=self.cancel,
+            cursor="hand2",
+            relief=tk.FLAT,
+            activebackground="#dc2626"
+        ).pack(side=tk.LEFT)
+
+    @property
+    def busy(self):
+        """True while the tracked task runs"""
+        return self.task is not None and not self.task.finished
+
+    def track(self, task):
+        """Show progress for task until it finishes"""
+        self.task = task
+        task.on_progress = self._show
+        task.on_finish = self._hide
+        self.bar["value"] = 0
+        self.label.config(text=f"{task.title}...")
+        self.frame.pack(fill=tk.X, pady=(15, 0))
+
+    def cancel(self):
+        """Cancel the tracked task"""
+        if self.busy:
+            self.task.cancel()
+            self.label.config(text=f"{self.task.title}: cancelling...")
+
+    def _show(self, task):
+        """Update the bar from the task"""
+        if not self.frame.winfo_exists():
+            return
+        self.bar["value"] = task.fraction
+        self.label.config(text=f"{task.title}... {task.fraction:.0%}" + (f" ({task.text})" if task.text else ""))
+
+    def _hide(self, task):
+        """Hide the row once the task is over"""
+        if task is self.task and self.frame.winfo_exists():
+            self.frame.pack_forget()
@@ -0,0 +1,128 @@
+"""
+Virtual List - Scrolling list of recycled item widgets
+Only as many item widgets exist as fit in the viewport. Scrolling moves a
+window over the rows of a DataFrame and refills the same widgets, so memory
+and drawing time depend on the window size, not on the number of rows.
+"""
+
+import math
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualList:
+    """Rows of a DataFrame shown through a fixed pool of item widgets"""
+
+    def __init__(self, parent, source, create_item, fill_item, bg, item_pady=10):
+        """create_item(parent) -> item with a .frame; fill_item(item, row) shows one itertuples() row"""
+        self.source = source
+        self.create_item = create_item
+        self.fill_item = fill_item
+        self.item_pady = item_pady
+        self.item_height = None
+        self.first = 0
+        self.items = []
+
+        self.frame = tk.Frame(parent, bg=bg)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Size comes from the window, not from the cards inside
+        self.body = tk.Frame(self.frame, bg=bg)
+        self.body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.body.pack_propagate(False)
+        self.body.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.body)
+
+    # ==================== ITEMS ====================
+    def _bind_wheel(self, widget):
+        """Scroll with the mouse wheel over the widget and its children"""
+        widget.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        widget.bind("<Button-4>", lambda e: self.scroll(-1))
+        widget.bind("<Button-5>", lambda e: self.scroll(1))
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _new_item(self):
+        """Create one more pooled item widget"""
+        item = self.create_item(self.body)
+        self._bind_wheel(item.frame)
+        self.items.append(item)
+        return item
+
+    def _on_resize(self, event):
+        """Grow or shrink the pool to fill the viewport"""
+        self._fit(event.height)
+
+    def _fit(self, height):
+        """Size the pool for a viewport `height` pixels high, then refill it"""
+        if self.item_height is None:
+            rows = self.source()
+            if rows.empty:
+                return
+            # Measure one filled item to size the pool
+            item = self.items[0] if self.items else self._new_item()
+            self.fill_item(item, next(rows.iloc[:1].itertuples(index=False)))
+            item.frame.update_idletasks()
+            self.item_height = max(item.frame.winfo_reqheight() + 2 * self.item_pady, 1)
+
+        wanted = max(1, math.ceil(height / self.item_height))
+        while len(self.items) < wanted:
+            self._new_item()
+        for item in self.items[wanted:]:
+            item.frame.destroy()
+        del self.items[wanted:]
+        self.refresh()
+
+    # ==================== DATA ====================
+    def visible_rows(self):
+        """Items that fit completely in the viewport"""
+        if self.item_height is None:
+            return max(len(self.items), 1)
+        return max(1, self.body.winfo_height() // self.item_height)
+
+    def refresh(self):
+        """Refill the pooled items from the current window (call after the data changed)"""
+        rows = self.source()
+        total = len(rows)
+        if self.item_height is None and total:
+            # The first rows arrived after the list was laid out empty
+            self._fit(self.body.winfo_height())
+            return
+        self.first = max(0, min(self.first, total - self.visible_rows()))
+        window = rows.iloc[self.first:self.first + len(self.items)]
+        shown = 0
+        for item, row in zip(self.items, window.itertuples(index=False)):
+            self.fill_item(item, row)
+            item.frame.pack(fill=tk.X, pady=self.item_pady)
+            shown += 1
+        for item in self.items[shown:]:
+            item.frame.pack_forget()
+
+        if total:
+            self.scrollbar.set(self.first / total, min(self.first + self.visible_rows(), total) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    # ==================== SCROLLING ====================
+    def scroll_to(self, first):
+        """Show the window starting at row `first`"""
+        first = max(0, min(int(first), len(self.source()) - self.visible_rows()))
+        if first != self.first:
+            self.first = first
+            self.refresh()
+
+    def scroll(self, direction, what="units"):
+        """Scroll by one row ("units") or one screen ("pages")"""
+        step = self.visible_rows() if what == "pages" else 1
+        self.scroll_to(self.first + direction * step)
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")"""
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self.source()))
+        elif args[0] == "scroll":
+            self.scroll(int(args[1]), args[2])
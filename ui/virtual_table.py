@@ -0,0 +1,196 @@
+"""
+Virtual Table - A Treeview that only holds the rows on screen
+The Treeview keeps one item per visible line. Scrolling moves a window over
+the data and rewrites those items in place, reading just the window from the
+DataFrame's columns, so showing or scrolling the table costs the same for
+10 products or 1M. A sorted or filtered table is a view: an array of data
+positions in display order, and lines map to positions through it.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+import numpy as np
+
+from ui.widgets import fill_tree
+
+
+class VirtualTable:
+    """Windowed read-only table over a DataFrame's columns"""
+
+    def __init__(self, parent, source, columns, height=10, width=200, view=None, on_heading=None):
+        """Create the table.
+
+        source() returns the current DataFrame; columns maps heading -> column
+        name, or -> values(positions) for values that are not in the frame.
+        view() returns the data positions to show in order (None: all rows).
+        on_heading(heading) runs when a column heading is clicked.
+        """
+        self.source = source
+        self.view = view
+        self.columns = dict(columns)
+        self.first = 0
+        self.rows = height
+        self._selected = None
+
+        self.frame = tk.Frame(parent, bg=parent.cget("bg"))
+        self.frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        headings = list(self.columns)
+        self.tree = ttk.Treeview(self.frame, columns=headings, height=height, show="headings",
+                                 selectmode="browse")
+        for col in headings:
+            if on_heading is None:
+                self.tree.heading(col, text=col)
+            else:
+                self.tree.heading(col, text=col, command=lambda col=col: on_heading(col))
+            self.tree.column(col, width=width)
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1, "units", 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1, "units", 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1, "units", 3))
+        self.tree.bind("<Prior>", lambda e: self.scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.scroll(1, "pages"))
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0))
+        self.tree.bind("<End>", lambda e: self.scroll_to(len(self)))
+        self.tree.bind("<Up>", lambda e: self._step(-1))
+        self.tree.bind("<Down>", lambda e: self._step(1))
+
+        self.refresh()
+
+    # ==================== DATA ====================
+    def __len__(self):
+        """Number of rows in the view (not on screen)"""
+        view = self.view() if self.view is not None else None
+        return len(self.source()) if view is None else len(view)
+
+    def _positions(self, start, stop):
+        """Data positions shown on lines start..stop of the table"""
+        view = self.view() if self.view is not None else None
+        return np.arange(start, stop) if view is None else view[start:stop]
+
+    def _line_of(self, position):
+        """Line of the table showing a data position, or None if the view leaves it out"""
+        view = self.view() if self.view is not None else None
+        if view is None:
+            return position if position < len(self.source()) else None
+        lines = np.flatnonzero(view == position)
+        return int(lines[0]) if len(lines) else None
+
+    def row_values(self, positions):
+        """Column values for the given data positions, as Python objects"""
+        df = self.source()
+        columns = [col(positions) if callable(col) else df[col].take(positions).tolist()
+                   for col in self.columns.values()]
+        return list(zip(*columns))
+
+    def set_heading(self, heading, text):
+        """Change the text of a column heading (e.g. to show the sort direction)"""
+        self.tree.heading(heading, text=text)
+
+    def refresh(self, top=False):
+        """Re-read the visible window (call after the data or the view changed); top: back to line 0"""
+        total = len(self)
+        if top:
+            self.first = 0
+        self.first = max(0, min(self.first, total - self.rows))
+        positions = self._positions(self.first, min(self.first + self.rows, total))
+        values = self.row_values(positions)
+
+        fill_tree(self.tree, values)
+        self._positions_shown = positions
+        self._restore_selection()
+        if total:
+            self.scrollbar.set(self.first / total, min(self.first + self.rows, total) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    # ==================== SCROLLING ====================
+    def scroll_to(self, first):
+        """Show the window starting at data line `first`"""
+        first = max(0, min(int(first), len(self) - self.rows))
+        if first != self.first:
+            self.first = first
+            self.refresh()
+
+    def scroll(self, direction, what="units", amount=1):
+        """Scroll by lines ("units") or screens ("pages")"""
+        step = self.rows if what == "pages" else amount
+        self.scroll_to(self.first + direction * step)
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")"""
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self))
+        elif args[0] == "scroll":
+            self.scroll(int(args[1]), args[2])
+
+    def _step(self, direction):
+        """Arrow keys: move the selection, scrolling at the edges of the window"""
+        selected = self.tree.selection()
+        line = int(selected[0]) if selected else -1
+        target = line + direction
+        if 0 <= target < len(self._positions_shown):
+            self.tree.selection_set(str(target))
+            self.tree.focus(str(target))
+        else:
+            self.scroll(direction)
+            if selected:
+                self.tree.selection_set(selected[0])
+                self.tree.focus(selected[0])
+        return "break"
+
+    def _on_resize(self, event):
+        """Fit the number of materialized lines to the widget height"""
+        items = self.tree.get_children()
+        bbox = self.tree.bbox(items[0]) if items else None
+        if not bbox:
+            return
+        rows = max(1, (event.height - bbox[1]) // max(bbox[3], 1))
+        if rows != self.rows:
+            self.rows = rows
+            self.refresh()
+
+    # ==================== SELECTION ====================
+    def _on_select(self, event=None):
+        """Remember the selected data position so it survives scrolling"""
+        selected = self.tree.selection()
+        if selected and int(selected[0]) < len(self._positions_shown):
+            self._selected = int(self._positions_shown[int(selected[0])])
+
+    def _restore_selection(self):
+        """Highlight the remembered row if it is in the window"""
+        lines = np.flatnonzero(self._positions_shown == self._selected) if self._selected is not None else []
+        if len(lines):
+            self.tree.selection_set(str(lines[0]))
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+    def selected_position(self):
+        """Data position of the selected row, or None"""
+        if self._selected is None or self._selected >= len(self.source()):
+            return None
+        return self._selected
+
+    def show_position(self, position):
+        """Scroll the row at a data position into view and select it; False if the view leaves it out"""
+        line = self._line_of(int(position))
+        if line is None:
+            return False
+        self._selected = int(position)
+        self.scroll_to(line - self.rows // 2)
+        self._restore_selection()
+        self.tree.focus_set()
+        return True
+
+    def clear_selection(self):
+        """Forget the selected row"""
+        self._selected = None
+        self._restore_selection()
@@ -8,7 +8,7 @@ from config.styles import *
 
 
 def create_metric_card(parent, title, value, color, fonts):
-    """Create a metric card with colored bar"""
+    """Create a metric card with colored bar, returns the value label"""
     card = tk.Frame(parent, bg=CARD_BG, relief=tk.FLAT, bd=1)
     card.pack(side=tk.LEFT, padx=10, fill=tk.BOTH, expand=True)
 
@@ -19,7 +19,9 @@ def create_metric_card(parent, title, value, color, fonts):
     info.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=15)
 
     tk.Label(info, text=title, font=fonts['normal'], bg=CARD_BG, fg=TEXT_LIGHT).pack(anchor=tk.W)
-    tk.Label(info, text=str(value), font=fonts['large'], bg=CARD_BG, fg=color).pack(anchor=tk.W, pady=(5, 0))
+    value_label = tk.Label(info, text=str(value), font=fonts['large'], bg=CARD_BG, fg=color)
+    value_label.pack(anchor=tk.W, pady=(5, 0))
+    return value_label
 
 
 def create_page_header(parent, title, fonts):
@@ -43,3 +45,17 @@ def clear_frame(frame):
     """Clear all widgets from frame"""
     for widget in frame.winfo_children():
         widget.destroy()
+
+
+def fill_tree(tree, rows):
+    """Show rows in a Treeview, reusing its items in place (item iid = line number)"""
+    items = tree.get_children()
+    count = 0
+    for line, values in enumerate(rows):
+        if line < len(items):
+            tree.item(items[line], values=tuple(values))
+        else:
+            tree.insert("", tk.END, iid=str(line), values=tuple(values))
+        count += 1
+    if len(items) > count:
+        tree.delete(*items[count:])